@@ -0,0 +1,6 @@
+"""
+TranslateCloud - Offline Benchmarks
+
+Run from backend/:
+    python -m benchmarks.<name> --help
+"""
@@ -0,0 +1,320 @@
+"""
+Local DeepL API emulator (offline throughput and resilience benchmarks)
+
+Serves the subset of the DeepL v2 API TranslateCloud uses, so the sync
+client (deepl library), the async client (src/core/deepl_async_client.py),
+the rate controller and the circuit breakers run unchanged against it:
+
+    POST /v2/translate   JSON or form body; texts are pseudo-localized
+                         (src/core/pseudo_localization.py), tag_handling kept
+    GET|POST /v2/usage   characters translated by the emulator vs quota
+    GET /v2/languages    source/target languages from DEEPL_LANGUAGE_MAP
+
+Injected behaviour (all reproducible with --seed):
+    - Latency: fixed, uniform or lognormal around --latency-ms, plus
+      --per-char-ms per translated character
+    - 429 Too Many Requests with Retry-After: at --throttle-rate, and for
+      every request above --max-concurrency in flight
+    - 456 Quota Exceeded: once --quota characters were translated, or at
+      --quota-error-rate
+    - 503 at --error-rate
+
+Point TranslateCloud at it with DEEPL_SERVER_URL=http://127.0.0.1:<port>
+(any DEEPL_API_KEY works).
+
+Usage (from backend/):
+    python -m benchmarks.deepl_emulator --port 8099 --latency-ms 150 --throttle-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from src.core.deepl_translator import DEEPL_LANGUAGE_MAP
+from src.core.pseudo_localization import pseudo_localize
+
+
+class DeepLEmulator:
+    """aiohttp application emulating the DeepL v2 API"""
+
+    def __init__(
+        self,
+        latency_ms: float = 100.0,
+        latency_distribution: str = 'lognormal',
+        latency_sigma: float = 0.5,
+        per_char_ms: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        max_concurrency: Optional[int] = None,
+        quota: Optional[int] = None,
+        quota_error_rate: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            latency_ms: Median response latency
+            latency_distribution: 'fixed', 'uniform' (0.5x-1.5x) or 'lognormal'
+            latency_sigma: Sigma of the lognormal distribution
+            per_char_ms: Extra latency per translated character
+            throttle_rate: Share of requests answered with 429
+            retry_after: Retry-After seconds sent with 429 responses
+            max_concurrency: Requests in flight above this get 429 (None = no limit)
+            quota: Character limit reported by /v2/usage and enforced with 456
+            quota_error_rate: Share of requests answered with 456
+            error_rate: Share of requests answered with 503
+            seed: Random seed for reproducible runs
+        """
+        self.latency_ms = latency_ms
+        self.latency_distribution = latency_distribution
+        self.latency_sigma = latency_sigma
+        self.per_char_ms = per_char_ms
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_concurrency = max_concurrency
+        self.quota = quota
+        self.quota_error_rate = quota_error_rate
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+        self.stats = {
+            'requests': 0,
+            'texts': 0,
+            'characters': 0,
+            'throttled': 0,
+            'quota_exceeded': 0,
+            'errors': 0,
+            'max_in_flight': 0,
+        }
+        self._in_flight = 0
+
+        self.app = web.Application()
+        self.app.router.add_post('/v2/translate', self.handle_translate)
+        self.app.router.add_route('*', '/v2/usage', self.handle_usage)
+        self.app.router.add_route('*', '/v2/languages', self.handle_languages)
+
+        self._runner: Optional[web.AppRunner] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ========================================================================
+    # Handlers
+    # ========================================================================
+
+    async def handle_translate(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.json_response({'message': 'Authorization failure, check auth_key'}, status=403)
+
+        params = await self._read_params(request)
+        texts = params.get('text') or []
+        if isinstance(texts, str):
+            texts = [texts]
+        if not texts or not params.get('target_lang'):
+            return web.json_response({'message': "Parameter 'text' and 'target_lang' required"}, status=400)
+
+        self.stats['requests'] += 1
+        self._in_flight += 1
+        self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self._in_flight)
+
+        try:
+            characters = sum(len(text) for text in texts)
+
+            if self.max_concurrency is not None and self._in_flight > self.max_concurrency:
+                return self._throttled()
+            if self.random.random() < self.throttle_rate:
+                return self._throttled()
+            if self.random.random() < self.error_rate:
+                self.stats['errors'] += 1
+                return web.json_response({'message': 'Service unavailable'}, status=503)
+
+            quota_reached = self.quota is not None and self.stats['characters'] + characters > self.quota
+            if quota_reached or self.random.random() < self.quota_error_rate:
+                self.stats['quota_exceeded'] += 1
+                return web.json_response({'message': 'Quota Exceeded'}, status=456)
+
+            await asyncio.sleep(self._latency(characters) / 1000)
+
+            tag_handling = params.get('tag_handling')
+            source_lang = (params.get('source_lang') or 'EN').upper()
+
+            self.stats['texts'] += len(texts)
+            self.stats['characters'] += characters
+
+            return web.json_response({
+                'translations': [
+                    {'detected_source_language': source_lang, 'text': pseudo_localize(text, tag_handling)}
+                    for text in texts
+                ]
+            })
+
+        finally:
+            self._in_flight -= 1
+
+    async def handle_usage(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.json_response({'message': 'Authorization failure, check auth_key'}, status=403)
+
+        return web.json_response({
+            'character_count': self.stats['characters'],
+            'character_limit': self.quota if self.quota is not None else 1_000_000_000_000,
+        })
+
+    async def handle_languages(self, request: web.Request) -> web.Response:
+        params = await self._read_params(request)
+        codes = sorted(set(DEEPL_LANGUAGE_MAP.values()))
+
+        if params.get('type') == 'target':
+            languages = [{'language': code, 'name': code, 'supports_formality': False} for code in codes]
+        else:
+            # Source languages have no regional variants ('EN-US' -> 'EN')
+            languages = [{'language': code, 'name': code} for code in sorted({code.split('-')[0] for code in codes})]
+
+        return web.json_response(languages)
+
+    # ========================================================================
+    # Helpers
+    # ========================================================================
+
+    @staticmethod
+    def _authorized(request: web.Request) -> bool:
+        header = request.headers.get('Authorization', '')
+        return header.startswith('DeepL-Auth-Key ') and len(header) > len('DeepL-Auth-Key ')
+
+    @staticmethod
+    async def _read_params(request: web.Request) -> Dict[str, Any]:
+        """Parameters from a JSON body, a form body or the query string"""
+        params: Dict[str, Any] = {}
+
+        for key in request.query:
+            values = request.query.getall(key)
+            params[key] = values if key == 'text' else values[-1]
+
+        if request.can_read_body:
+            if request.content_type == 'application/json':
+                try:
+                    params.update(await request.json())
+                except json.JSONDecodeError:
+                    pass
+            else:
+                form = await request.post()
+                for key in form:
+                    values = form.getall(key)
+                    params[key] = values if key == 'text' else values[-1]
+
+        return params
+
+    def _latency(self, characters: int) -> float:
+        """Response latency in milliseconds"""
+        if self.latency_distribution == 'fixed':
+            base = self.latency_ms
+        elif self.latency_distribution == 'uniform':
+            base = self.random.uniform(0.5, 1.5) * self.latency_ms
+        else:
+            # Median of lognormal(mu, sigma) is e^mu
+            base = self.latency_ms * self.random.lognormvariate(0, self.latency_sigma)
+
+        return base + characters * self.per_char_ms
+
+    def _throttled(self) -> web.Response:
+        self.stats['throttled'] += 1
+        return web.json_response(
+            {'message': 'Too many requests'},
+            status=429,
+            headers={'Retry-After': f"{self.retry_after:g}"}
+        )
+
+    # ========================================================================
+    # Background Server (benchmarks)
+    # ========================================================================
+
+    def start_background(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Serve from a daemon thread with its own event loop
+
+        Returns:
+            str: Server URL (usable as DEEPL_SERVER_URL)
+        """
+        started = threading.Event()
+        address = {}
+
+        async def serve():
+            self._runner = web.AppRunner(self.app)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, host, port)
+            await site.start()
+            address['port'] = self._runner.addresses[0][1]
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(serve())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return f"http://{host}:{address['port']}"
+
+    def stop(self):
+        """Stop a server started with start_background()"""
+        if self._loop is None:
+            return
+
+        future = asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop)
+        future.result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._loop = None
+
+
+def add_emulator_arguments(parser: argparse.ArgumentParser):
+    """Emulator options shared with benchmarks.translation_throughput"""
+    parser.add_argument('--latency-ms', type=float, default=100.0, help="Median response latency")
+    parser.add_argument('--latency-distribution', choices=['fixed', 'uniform', 'lognormal'], default='lognormal')
+    parser.add_argument('--latency-sigma', type=float, default=0.5)
+    parser.add_argument('--per-char-ms', type=float, default=0.0, help="Extra latency per character")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument('--retry-after', type=float, default=1.0, help="Retry-After of 429 responses (seconds)")
+    parser.add_argument('--max-concurrency', type=int, default=None, help="429 above this many requests in flight")
+    parser.add_argument('--quota', type=int, default=None, help="Character limit (456 once reached)")
+    parser.add_argument('--quota-error-rate', type=float, default=0.0, help="Share of requests answered with 456")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument('--seed', type=int, default=42)
+
+
+def emulator_from_args(args: argparse.Namespace) -> DeepLEmulator:
+    return DeepLEmulator(
+        latency_ms=args.latency_ms,
+        latency_distribution=args.latency_distribution,
+        latency_sigma=args.latency_sigma,
+        per_char_ms=args.per_char_ms,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        max_concurrency=args.max_concurrency,
+        quota=args.quota,
+        quota_error_rate=args.quota_error_rate,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    add_emulator_arguments(parser)
+    args = parser.parse_args()
+
+    emulator = emulator_from_args(args)
+    print(f"DeepL emulator: DEEPL_SERVER_URL=http://{args.host}:{args.port}")
+    web.run_app(emulator.app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == '__main__':
+    main()
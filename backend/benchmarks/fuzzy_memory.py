@@ -0,0 +1,132 @@
+"""
+Fuzzy translation memory benchmark (synthetic corpus, no network)
+
+Builds a marketing-style corpus from sentence templates with numeric and
+product-name slots, "translates" it with a deterministic pseudo-translator
+(words are rewritten, numbers and product names are copied verbatim - like
+DeepL does), indexes part of it and looks up the rest.
+
+Reports:
+    - Fuzzy hit rate and share of characters that would not be sent to DeepL
+    - Accuracy: adapted translations equal to the pseudo-translation
+    - Index build throughput and lookup latency (p50/p95)
+
+Usage (from backend/):
+    python -m benchmarks.fuzzy_memory
+    python -m benchmarks.fuzzy_memory --entries 20000 --queries 5000 --threshold 0.9
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+
+from src.core.fuzzy_memory import FuzzyMatchIndex
+
+TEMPLATES = [
+    "Save {n}% on all {p} plans today",
+    "Get {n} free months when you upgrade to {p}",
+    "{p} now supports up to {n} users per workspace",
+    "Join more than {n} teams already using {p}",
+    "Try {p} free for {n} days, no credit card required",
+    "Our {p} integration syncs your data every {n} minutes",
+    "Order before {n} PM for same day shipping on {p}",
+    "The {p} bundle includes {n} premium templates",
+    "Rated {n} out of 5 by {p} customers",
+    "Download the {p} guide and learn {n} ways to grow",
+]
+
+# Near-duplicates that differ by a translated word: must be rejected
+WORD_VARIANTS = [
+    ("today", "tomorrow"),
+    ("free", "paid"),
+    ("customers", "users"),
+]
+
+PRODUCTS = [
+    "TranslateCloud", "Acme Pro", "NovaDesk", "Brightline", "Zentro",
+    "Pixelform", "Orbit CRM", "Quanta", "Helix Studio", "Lumen",
+]
+
+WORD_PATTERN = re.compile(r'[A-Za-z]+')
+
+
+def pseudo_translate(text: str, products: list[str]) -> str:
+    """Rewrite every word except product names; numbers stay as they are"""
+    protected = {}
+    for position, product in enumerate(products):
+        if product in text:
+            token = f"\x00{position}\x00"
+            protected[token] = product
+            text = text.replace(product, token)
+
+    text = WORD_PATTERN.sub(lambda match: match.group(0)[::-1].lower() + 'o', text)
+
+    for token, product in protected.items():
+        text = text.replace(token, product)
+    return text
+
+
+def build_corpus(size: int, rng: random.Random) -> list[str]:
+    """Sentences from templates with random slots and occasional word variants"""
+    corpus = []
+    for _ in range(size):
+        sentence = rng.choice(TEMPLATES).format(n=rng.randint(1, 500), p=rng.choice(PRODUCTS))
+        if rng.random() < 0.1:
+            original, variant = rng.choice(WORD_VARIANTS)
+            sentence = sentence.replace(original, variant)
+        corpus.append(sentence)
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=5000, help="Segments indexed (translation memory)")
+    parser.add_argument('--queries', type=int, default=2000, help="Segments looked up")
+    parser.add_argument('--threshold', type=float, default=0.85, help="FUZZY_MATCH_THRESHOLD")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    memory = build_corpus(args.entries, rng)
+    seen = set(memory)
+    queries = [sentence for sentence in build_corpus(args.queries * 2, rng) if sentence not in seen]
+    queries = queries[:args.queries]
+
+    index = FuzzyMatchIndex(threshold=args.threshold, max_entries=max(args.entries, 1))
+
+    start = time.perf_counter()
+    index.add_many([(sentence, pseudo_translate(sentence, PRODUCTS)) for sentence in memory], "en", "xx")
+    build_seconds = time.perf_counter() - start
+
+    latencies = []
+    hits = correct = 0
+    hit_characters = 0
+
+    for sentence in queries:
+        start = time.perf_counter()
+        found = index.lookup_many([sentence], "en", "xx")
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        if found:
+            hits += 1
+            hit_characters += len(sentence)
+            correct += found[0] == pseudo_translate(sentence, PRODUCTS)
+
+    total_characters = sum(len(sentence) for sentence in queries)
+    latencies.sort()
+    stats = index.get_stats()
+
+    print(f"Indexed segments:      {stats['entries']} ({args.entries / build_seconds:,.0f} segments/s)")
+    print(f"Queries (not exact):   {len(queries)}")
+    print(f"Fuzzy hits:            {hits} ({hits / max(len(queries), 1):.1%})")
+    print(f"Rejected candidates:   {stats['rejected']}")
+    print(f"Accuracy of hits:      {correct / max(hits, 1):.1%}")
+    print(f"DeepL characters saved: {hit_characters / max(total_characters, 1):.1%}")
+    print(f"Lookup latency p50:    {statistics.median(latencies):.3f} ms")
+    print(f"Lookup latency p95:    {latencies[int(len(latencies) * 0.95) - 1]:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""
+MarianMT int8 dynamic quantization benchmark (fp32 vs int8, CPU)
+
+Translates a fixed local corpus with the same Helsinki-NLP model loaded
+twice - full precision and with MARIAN_QUANTIZE's int8 dynamic
+quantization - and compares:
+
+    - Model weight size and process RSS growth while loading
+    - Latency: whole-corpus batched throughput and single-sentence p50/p95
+    - Agreement of int8 with fp32: corpus BLEU (fp32 output as reference)
+      and share of identical translations
+
+The corpus is the marketing-style template corpus of
+benchmarks.fuzzy_memory (fixed seed), or a text file with one sentence per
+line (--corpus). Needs torch and transformers; models are downloaded on
+first use.
+
+Usage (from backend/):
+    python -m benchmarks.marian_quantization
+    python -m benchmarks.marian_quantization --pair en-de --sentences 500 --threads 2
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+from collections import Counter
+
+import torch
+
+from benchmarks.fuzzy_memory import build_corpus
+from src.core.marian_translator import MarianTranslator
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process (Linux /proc, 0 elsewhere)"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def ngrams(tokens: list[str], n: int) -> Counter:
+    return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+
+def corpus_bleu(hypotheses: list[str], references: list[str], max_n: int = 4) -> float:
+    """Corpus BLEU (0-100) on whitespace tokens, uniform weights, brevity penalty"""
+    matches = [0] * max_n
+    totals = [0] * max_n
+    hypothesis_length = reference_length = 0
+
+    for hypothesis, reference in zip(hypotheses, references):
+        hypothesis_tokens = (hypothesis or '').split()
+        reference_tokens = (reference or '').split()
+        hypothesis_length += len(hypothesis_tokens)
+        reference_length += len(reference_tokens)
+
+        for n in range(1, max_n + 1):
+            hypothesis_ngrams = ngrams(hypothesis_tokens, n)
+            reference_ngrams = ngrams(reference_tokens, n)
+            matches[n - 1] += sum(min(count, reference_ngrams[gram]) for gram, count in hypothesis_ngrams.items())
+            totals[n - 1] += max(len(hypothesis_tokens) - n + 1, 0)
+
+    if not hypothesis_length or min(matches) == 0:
+        return 0.0
+
+    log_precision = sum(math.log(match / total) for match, total in zip(matches, totals)) / max_n
+    brevity = min(1.0, math.exp(1 - reference_length / hypothesis_length))
+    return 100 * brevity * math.exp(log_precision)
+
+
+def load(quantize: bool, source_lang: str, target_lang: str) -> tuple[MarianTranslator, int, int, float]:
+    """Load one variant; returns (translator, weight bytes, RSS growth, seconds)"""
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+
+    translator = MarianTranslator(quantize=quantize)
+    if not translator.load_model(source_lang, target_lang):
+        raise SystemExit(f"Could not load Helsinki-NLP/opus-mt-{source_lang}-{target_lang}")
+
+    seconds = time.perf_counter() - start
+    return translator, translator.get_cache_stats()['bytes'], rss_bytes() - rss_before, seconds
+
+
+def measure(translator: MarianTranslator, corpus: list[str], source_lang: str, target_lang: str, singles: int) -> dict:
+    """Batched corpus translation plus single-sentence latencies"""
+    start = time.perf_counter()
+    outputs = translator.translate_batch(corpus, source_lang, target_lang)
+    batch_seconds = time.perf_counter() - start
+
+    latencies = []
+    for sentence in corpus[:singles]:
+        start = time.perf_counter()
+        translator.translate(sentence, source_lang, target_lang)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        'outputs': outputs,
+        'sentences_per_second': len(corpus) / batch_seconds,
+        'p50': statistics.median(latencies),
+        'p95': latencies[max(math.ceil(len(latencies) * 0.95) - 1, 0)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pair', default='en-es', help="Language pair, e.g. en-es")
+    parser.add_argument('--sentences', type=int, default=200, help="Corpus size (template corpus)")
+    parser.add_argument('--corpus', help="Text file, one sentence per line (instead of the template corpus)")
+    parser.add_argument('--singles', type=int, default=30, help="Sentences timed one at a time")
+    parser.add_argument('--threads', type=int, default=None, help="torch.set_num_threads (default: torch's choice)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    source_lang, target_lang = args.pair.split('-')
+
+    if args.corpus:
+        with open(args.corpus, encoding='utf-8') as corpus_file:
+            corpus = [line.strip() for line in corpus_file if line.strip()]
+    else:
+        corpus = build_corpus(args.sentences, random.Random(args.seed))
+
+    print(f"Corpus: {len(corpus)} sentences, pair {args.pair}, {torch.get_num_threads()} threads\n")
+
+    results = {}
+    for label, quantize in (('fp32', False), ('int8', True)):
+        translator, weight_bytes, rss_growth, load_seconds = load(quantize, source_lang, target_lang)
+        # Warm-up: first generate() call allocates caches
+        translator.translate_batch(corpus[:4], source_lang, target_lang)
+
+        results[label] = measure(translator, corpus, source_lang, target_lang, args.singles)
+        results[label].update(weights=weight_bytes, rss=rss_growth, load=load_seconds)
+        del translator
+
+    print(f"{'':24}{'fp32':>12}{'int8':>12}")
+    rows = [
+        ("Weights (MB)", 'weights', lambda value: f"{value / 1024**2:,.0f}"),
+        ("RSS growth (MB)", 'rss', lambda value: f"{value / 1024**2:,.0f}"),
+        ("Load (s)", 'load', lambda value: f"{value:.1f}"),
+        ("Batched (sentences/s)", 'sentences_per_second', lambda value: f"{value:,.1f}"),
+        ("Single p50 (ms)", 'p50', lambda value: f"{value:,.0f}"),
+        ("Single p95 (ms)", 'p95', lambda value: f"{value:,.0f}"),
+    ]
+    for title, key, fmt in rows:
+        print(f"{title:24}{fmt(results['fp32'][key]):>12}{fmt(results['int8'][key]):>12}")
+
+    reference = results['fp32']['outputs']
+    quantized = results['int8']['outputs']
+    identical = sum(a == b for a, b in zip(reference, quantized))
+
+    print(f"\nBLEU int8 vs fp32:      {corpus_bleu(quantized, reference):.1f}")
+    print(f"Identical translations: {identical / len(corpus):.1%}")
+    print(f"Speed-up (batched):     {results['int8']['sentences_per_second'] / results['fp32']['sentences_per_second']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+"""
+Page parsing benchmark: legacy multi-parse vs single-pass lxml (no network)
+
+Parses a corpus of saved pages with the crawlers' page parsing before and
+after src.core.page_parser:
+
+    legacy crawler    header charset or UTF-8, then three html.parser trees
+                      (text, metadata, links) - the old WebCrawler.fetch_page
+    single crawler    WebCrawler.parse_page: charset from header/<meta>, one
+                      lxml tree
+    legacy extractor  BeautifulSoup(bytes, 'html.parser') with detection,
+                      separate find()/find_all() passes, XPaths by walking
+                      each element's ancestors and siblings - the old
+                      WebExtractor.crawl_page
+    single extractor  WebExtractor._parse_page
+
+Reports pages/s, p50/p95 ms per page, speed-up, and how many pages give the
+same word count, title and links as the legacy parse (pages declared
+windows-1252 only in <meta> differ for the crawler: the legacy path
+decoded them as UTF-8).
+
+The corpus is a directory of saved .html files (--pages), or generated
+marketing-style pages (fixed seed, a share of them declared as
+windows-1252 in <meta> only). --save writes the generated corpus to a
+directory for later runs.
+
+Usage (from backend/):
+    python -m benchmarks.page_parsing
+    python -m benchmarks.page_parsing --pages ./saved-pages --rounds 5
+    python -m benchmarks.page_parsing --generate 300 --save ./saved-pages
+"""
+
+import argparse
+import contextlib
+import math
+import random
+import statistics
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from benchmarks.fuzzy_memory import PRODUCTS, TEMPLATES
+from src.core import web_extractor
+from src.core.page_parser import resolve_charset
+from src.core.web_crawler import WebCrawler
+from src.core.web_extractor import WebExtractor
+
+BASE_URL = 'https://www.example.com/products/page.html'
+
+WORDS = "fast secure simple cloud team plan growth privacy support café über señal".split()
+
+
+def build_page(rng: random.Random) -> tuple[bytes, str]:
+    """One generated page; returns (body, Content-Type header)"""
+    sentences = [rng.choice(TEMPLATES).format(n=rng.randint(1, 500), p=rng.choice(PRODUCTS)) for _ in range(60)]
+    words = lambda count: ' '.join(rng.choice(WORDS) for _ in range(count))
+
+    nav = ''.join(f'<li><a href="/section-{i}/">{words(2)}</a></li>' for i in range(rng.randint(8, 20)))
+    sections = []
+    for i in range(rng.randint(6, 14)):
+        paragraphs = ''.join(
+            f'<p>{rng.choice(sentences)} <a href="/p/{rng.randint(1, 200)}">{words(2)}</a> '
+            f'<strong>{words(3)}</strong> {rng.choice(sentences)}</p>'
+            for _ in range(rng.randint(2, 6))
+        )
+        items = ''.join(f'<li>{rng.choice(sentences)}</li>' for _ in range(rng.randint(2, 8)))
+        sections.append(
+            f'<section id="s{i}"><h2>{words(4)}</h2><div class="col">{paragraphs}</div>'
+            f'<ul>{items}</ul><img src="/img/{i}.png" alt="{words(3)}"></section>'
+        )
+
+    windows_1252 = rng.random() < 0.2
+    charset_meta = '<meta charset="windows-1252">' if windows_1252 else '<meta charset="utf-8">'
+    html = (
+        f'<!DOCTYPE html><html lang="en"><head>{charset_meta}<title>{words(5)}</title>'
+        f'<meta name="description" content="{rng.choice(sentences)}">'
+        f'<meta name="keywords" content="{words(4)}">'
+        f'<style>.col{{display:flex}} body{{margin:0}}</style>'
+        f'<script>window.dataLayer=[];function gtag(){{dataLayer.push(arguments)}}</script></head>'
+        f'<body><header><nav><ul>{nav}</ul></nav></header><main>{"".join(sections)}</main>'
+        f'<footer><p>© 2025 {rng.choice(PRODUCTS)} - {words(6)}</p>'
+        f'<a href="mailto:hello@example.com">mail</a><a href="/terms.pdf">terms</a></footer></body></html>'
+    )
+
+    if windows_1252:
+        # Charset only in <meta>, as many older sites serve it
+        return html.encode('cp1252', errors='replace'), 'text/html'
+    return html.encode('utf-8'), 'text/html; charset=utf-8'
+
+
+def load_corpus(args) -> list[tuple[bytes, str]]:
+    if args.pages:
+        # Saved pages carry no headers: charset from <meta> (or detection, legacy)
+        return [(path.read_bytes(), 'text/html') for path in sorted(Path(args.pages).glob('*.htm*'))]
+
+    rng = random.Random(args.seed)
+    corpus = [build_page(rng) for _ in range(args.generate)]
+
+    if args.save:
+        directory = Path(args.save)
+        directory.mkdir(parents=True, exist_ok=True)
+        for number, (body, _) in enumerate(corpus):
+            (directory / f'page-{number:04d}.html').write_bytes(body)
+        print(f"Saved {len(corpus)} pages to {directory}")
+    return corpus
+
+
+# ============================================================================
+# Legacy code paths (before src.core.page_parser)
+# ============================================================================
+
+def legacy_crawler(crawler: WebCrawler, body: bytes, content_type: str) -> dict:
+    # aiohttp's response.text(): header charset, else UTF-8 (<meta> ignored;
+    # it raised on non-UTF-8 bytes, replaced here to keep the page)
+    html = body.decode(resolve_charset(b'', content_type), 'replace')
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup(['script', 'style', 'noscript']):
+        element.decompose()
+    word_count = len(soup.get_text(separator=' ', strip=True).split())
+
+    soup = BeautifulSoup(html, 'html.parser')
+    title_tag = soup.find('title')
+    title = title_tag.string if title_tag else None
+    soup.find('meta', attrs={'name': 'description'})
+    soup.find('meta', attrs={'name': 'keywords'})
+
+    soup = BeautifulSoup(html, 'html.parser')
+    links = crawler.filter_links([urljoin(BASE_URL, anchor['href']) for anchor in soup.find_all('a', href=True)], BASE_URL)
+
+    return {'word_count': word_count, 'title': title, 'links': links}
+
+
+class LegacyPaths:
+    """The old WebExtractor._get_xpath, per element (quadratic on wide/deep DOMs)"""
+
+    def __init__(self, soup: BeautifulSoup):
+        pass
+
+    def path(self, element) -> str:
+        components = []
+        child = element if element.name else element.parent
+
+        for parent in child.parents:
+            siblings = parent.find_all(child.name, recursive=False)
+            components.append(
+                child.name if len(siblings) == 1
+                else f'{child.name}[{siblings.index(child) + 1}]'
+            )
+            child = parent
+
+        components.reverse()
+        return '/' + '/'.join(components)
+
+
+@contextlib.contextmanager
+def legacy_paths():
+    """Make the extractor compute XPaths the old way"""
+    index = web_extractor.ElementPathIndex
+    web_extractor.ElementPathIndex = LegacyPaths
+    try:
+        yield
+    finally:
+        web_extractor.ElementPathIndex = index
+
+
+def legacy_extractor(extractor: WebExtractor, body: bytes, content_type: str) -> dict:
+    soup = BeautifulSoup(body, 'html.parser')
+
+    title = soup.find('title')
+    soup.find('meta', attrs={'name': 'description'})
+    with legacy_paths():
+        elements = extractor._extract_translatable_elements(soup)
+    word_count = sum(len(element['text'].split()) for element in elements)
+    str(soup)
+    links = extractor._filter_links([urljoin(BASE_URL, anchor['href']) for anchor in soup.find_all('a', href=True)])
+
+    return {'word_count': word_count, 'title': title.string if title else '', 'links': links}
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def run(parse, corpus: list[tuple[bytes, str]], rounds: int) -> tuple[list, list[float]]:
+    """Parse the corpus `rounds` times; returns (last results, ms per page)"""
+    latencies = []
+    for _ in range(rounds):
+        results = []
+        for body, content_type in corpus:
+            start = time.perf_counter()
+            results.append(parse(body, content_type))
+            latencies.append((time.perf_counter() - start) * 1000)
+    return results, latencies
+
+
+def agreement(legacy: list[dict], single: list[dict]) -> str:
+    same = sum(
+        old['word_count'] == new['word_count'] and (old['title'] or '') == (new['title'] or '') and old['links'] == new['links']
+        for old, new in zip(legacy, single)
+    )
+    return f"{same}/{len(legacy)}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', help="Directory of saved .html pages (instead of generated pages)")
+    parser.add_argument('--generate', type=int, default=200, help="Generated pages")
+    parser.add_argument('--save', help="Write the generated pages to this directory")
+    parser.add_argument('--rounds', type=int, default=3, help="Passes over the corpus")
+    parser.add_argument('--fragment-mode', action='store_true', help="Extractor in HTML fragment mode")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args)
+    if not corpus:
+        raise SystemExit("Empty corpus")
+
+    crawler = WebCrawler()
+    extractor = WebExtractor(fragment_mode=args.fragment_mode)
+
+    variants = {
+        'legacy crawler': lambda body, content_type: legacy_crawler(crawler, body, content_type),
+        'single crawler': lambda body, content_type: crawler.parse_page(BASE_URL, body, content_type),
+        'legacy extractor': lambda body, content_type: legacy_extractor(extractor, body, content_type),
+        'single extractor': lambda body, content_type: extractor._parse_page(BASE_URL, body, BASE_URL, content_type),
+    }
+
+    megabytes = sum(len(body) for body, _ in corpus) / 1024**2
+    print(f"Corpus: {len(corpus)} pages, {megabytes:.1f} MB, {args.rounds} rounds\n")
+    print(f"{'':20}{'pages/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+
+    results = {}
+    for label, parse in variants.items():
+        output, latencies = run(parse, corpus, args.rounds)
+        latencies.sort()
+        results[label] = (output, sum(latencies))
+        p95 = latencies[max(math.ceil(len(latencies) * 0.95) - 1, 0)]
+        print(f"{label:20}{len(latencies) / (sum(latencies) / 1000):>10,.1f}{statistics.median(latencies):>10.2f}{p95:>10.2f}")
+
+    for role in ('crawler', 'extractor'):
+        legacy_output, legacy_ms = results[f'legacy {role}']
+        single_output, single_ms = results[f'single {role}']
+        print(
+            f"\n{role.capitalize()}: {legacy_ms / single_ms:.2f}x faster, "
+            f"same word count/title/links on {agreement(legacy_output, single_output)} pages"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Translation throughput benchmark against the local DeepL emulator
+
+Runs the real TranslationService pipeline (segmentation, batching, router,
+rate controller, circuit breaker, sync and async DeepL clients) against
+benchmarks/deepl_emulator.py - no API key, no network, no DeepL
+characters billed. Cache, translation memory and fuzzy matching are
+disabled so every segment reaches the provider.
+
+Scenarios:
+    worker  translate_batch() in WORKER_BATCH_SIZE batches (SQS worker path)
+    text    concurrent translate_batch_async() requests (/api/text/translate)
+
+Reports segments/s, characters/s, request latency p50/p95, emulator
+request/429/456 counts and the adaptive rate controller counters.
+
+Usage (from backend/):
+    python -m benchmarks.translation_throughput
+    python -m benchmarks.translation_throughput --segments 5000 --latency-ms 200 --throttle-rate 0.05
+    python -m benchmarks.translation_throughput --pseudo   # 'pseudo' provider, no emulator
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import time
+
+from benchmarks.deepl_emulator import add_emulator_arguments, emulator_from_args
+from benchmarks.fuzzy_memory import build_corpus
+from src.config.settings import settings
+
+# worker_handler.TRANSLATION_BATCH_SIZE (not imported: pulls in boto3)
+WORKER_BATCH_SIZE = 250
+
+
+def percentile(values: list[float], share: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(len(ordered) * share) - 1, 0)]
+
+
+def run_worker(service, texts: list[str], target_lang: str) -> tuple[list[float], int]:
+    """Sequential batches, like the SQS worker"""
+    latencies = []
+    failed = 0
+
+    for start in range(0, len(texts), WORKER_BATCH_SIZE):
+        batch = texts[start:start + WORKER_BATCH_SIZE]
+        began = time.perf_counter()
+        results = service.translate_batch(batch, 'en', target_lang)
+        latencies.append((time.perf_counter() - began) * 1000)
+        failed += sum(not result['success'] for result in results)
+
+    return latencies, failed
+
+
+async def run_text(service, texts: list[str], target_lang: str, concurrency: int, request_size: int) -> tuple[list[float], int]:
+    """Concurrent small requests, like the text endpoint under load"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failed = 0
+
+    async def request(batch: list[str]):
+        nonlocal failed
+        async with semaphore:
+            began = time.perf_counter()
+            results = await service.translate_batch_async(batch, 'en', target_lang)
+            latencies.append((time.perf_counter() - began) * 1000)
+            failed += sum(not result['success'] for result in results)
+
+    await asyncio.gather(*(
+        request(texts[start:start + request_size])
+        for start in range(0, len(texts), request_size)
+    ))
+    return latencies, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenario', choices=['worker', 'text', 'both'], default='both')
+    parser.add_argument('--segments', type=int, default=2000, help="Segments translated per scenario")
+    parser.add_argument('--target-lang', default='es')
+    parser.add_argument('--concurrency', type=int, default=16, help="Concurrent requests (text scenario)")
+    parser.add_argument('--request-size', type=int, default=5, help="Texts per request (text scenario)")
+    parser.add_argument('--pseudo', action='store_true', help="Use the offline 'pseudo' provider instead of the emulator")
+    add_emulator_arguments(parser)
+    args = parser.parse_args()
+
+    # Every segment must reach the provider
+    settings.TRANSLATION_CACHE_ENABLED = False
+    settings.TRANSLATION_MEMORY_ENABLED = False
+    settings.FUZZY_MATCH_ENABLED = False
+
+    emulator = None
+    if args.pseudo:
+        settings.PSEUDO_LOCALIZATION_ENABLED = True
+        api_key = None
+    else:
+        emulator = emulator_from_args(args)
+        settings.DEEPL_SERVER_URL = emulator.start_background()
+        api_key = 'emulator-key:fx'
+        print(f"DeepL emulator:        {settings.DEEPL_SERVER_URL}")
+
+    # Imported after the settings overrides: shared clients read them once
+    from src.core.translation_service import TranslationService
+
+    service = TranslationService(deepl_api_key=api_key)
+    texts = build_corpus(args.segments, random.Random(args.seed))
+    characters = sum(len(text) for text in texts)
+
+    scenarios = ['worker', 'text'] if args.scenario == 'both' else [args.scenario]
+
+    try:
+        for scenario in scenarios:
+            began = time.perf_counter()
+            if scenario == 'worker':
+                latencies, failed = run_worker(service, texts, args.target_lang)
+            else:
+                latencies, failed = asyncio.run(
+                    run_text(service, texts, args.target_lang, args.concurrency, args.request_size)
+                )
+            seconds = time.perf_counter() - began
+
+            print(f"\n[{scenario}] {len(texts)} segments, {len(latencies)} requests")
+            print(f"Throughput:            {len(texts) / seconds:,.0f} segments/s, {characters / seconds:,.0f} chars/s")
+            print(f"Request latency p50:   {statistics.median(latencies):.1f} ms")
+            print(f"Request latency p95:   {percentile(latencies, 0.95):.1f} ms")
+            print(f"Failed segments:       {failed}")
+
+        if emulator:
+            print(f"\nEmulator:              {emulator.stats}")
+            print(f"Rate controller:       {service.deepl.rate_controller.get_stats()}")
+        print(f"Routing:               {service.get_routing_stats()}")
+
+    finally:
+        if emulator:
+            emulator.stop()
+
+
+if __name__ == '__main__':
+    main()
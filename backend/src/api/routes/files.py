@@ -89,32 +89,34 @@ async def translate_file(
         protected_strings, placeholder_maps = PlaceholderProtector.protect_batch(strings)
 
         # Initialize translation service
-        translation_service = TranslationService(deepl_api_key=settings.DEEPL_API_KEY)
+        translation_service = TranslationService(
+            deepl_api_key=settings.DEEPL_API_KEY,
+            user_id=current_user['user_id']
+        )
 
         # Translate to each target language
         translations_by_lang = {}
 
         for target_lang in target_lang_list:
-            # Translate all strings
+            # Translate all strings with batched provider requests
+            keys = list(protected_strings.keys())
             translated_strings = {}
 
-            for key, protected_value in protected_strings.items():
-                try:
-                    # Translate using translation service
-                    result = await translation_service.translate(
-                        text=protected_value,
-                        source_lang=source_lang,
-                        target_lang=target_lang
-                    )
-
-                    if result['success']:
-                        translated_strings[key] = result['text']
-                    else:
-                        # If translation fails, keep original
-                        translated_strings[key] = strings[key]
-
-                except Exception as e:
-                    # If individual translation fails, keep original
+            try:
+                batch_results = await translation_service.translate_batch_async(
+                    texts=[protected_strings[key] for key in keys],
+                    source_lang=source_lang,
+                    target_lang=target_lang
+                )
+            except Exception as e:
+                # If the batch fails, keep originals
+                batch_results = [{'success': False, 'error': str(e)}] * len(keys)
+
+            for key, result in zip(keys, batch_results):
+                if result['success']:
+                    translated_strings[key] = result['text']
+                else:
+                    # If translation fails, keep original
                     translated_strings[key] = strings[key]
 
             # Restore placeholders
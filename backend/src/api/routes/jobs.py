@@ -127,6 +127,9 @@ async def get_job_status(
         pages_translated=job.pages_translated,
         words_total=job.words_total,
         words_translated=job.words_translated,
+        segments_total=job.segments_total,
+        segments_unique=job.segments_unique,
+        dedup_ratio=job.dedup_ratio,
         created_at=job.created_at,
         updated_at=job.updated_at,
         started_at=job.started_at,
@@ -181,6 +184,9 @@ async def list_user_jobs(
                 pages_translated=job.pages_translated,
                 words_total=job.words_total,
                 words_translated=job.words_translated,
+                segments_total=job.segments_total,
+                segments_unique=job.segments_unique,
+                dedup_ratio=job.dedup_ratio,
                 created_at=job.created_at,
                 updated_at=job.updated_at,
                 started_at=job.started_at,
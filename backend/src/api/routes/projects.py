@@ -305,7 +305,7 @@ async def crawl_website(
     cursor: RealDictCursor = Depends(get_db)
 ):
     """Crawl website and return page count and word count"""
-    from src.core.web_extractor import crawl_website as extract_web
+    from src.core.web_crawler import crawl_website as extract_web
 
     try:
         # Crawl website (max 50 pages for MVP)
@@ -372,7 +372,9 @@ async def translate_website(
 
         # Initialize translation service with DeepL API key
         translation_service = TranslationService(
-            deepl_api_key=settings.DEEPL_API_KEY if hasattr(settings, 'DEEPL_API_KEY') else None
+            deepl_api_key=settings.DEEPL_API_KEY if hasattr(settings, 'DEEPL_API_KEY') else None,
+            user_id=user_id,
+            job_id=request.project_id
         )
 
         translated_pages = []
@@ -393,7 +395,7 @@ async def translate_website(
             translated_elements = []
 
             for element in page_data['elements']:
-                result = await translation_service.translate(
+                result = await translation_service.translate_async(
                     element['text'],
                     request.source_language,
                     request.target_language
@@ -414,13 +416,13 @@ async def translate_website(
                     })
 
             # 3. Translate metadata
-            title_result = await translation_service.translate(
+            title_result = await translation_service.translate_async(
                 page_data['title'],
                 request.source_language,
                 request.target_language
             ) if page_data['title'] else None
 
-            meta_desc_result = await translation_service.translate(
+            meta_desc_result = await translation_service.translate_async(
                 page_data['meta_description'],
                 request.source_language,
                 request.target_language
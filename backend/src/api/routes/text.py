@@ -3,9 +3,13 @@ Text API - Simple text-to-text translation
 For quick translations without file uploads
 """
 
+import asyncio
+import json
+
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
 from src.core.translation_service import TranslationService
 from src.core.placeholder_protector import PlaceholderProtector
 from src.api.dependencies import get_current_user
@@ -22,6 +26,7 @@ class TextTranslateRequest(BaseModel):
     source_lang: str = Field(..., min_length=2, max_length=5, description="Source language code (e.g., 'en')")
     target_langs: List[str] = Field(..., min_items=1, max_items=10, description="List of target language codes")
     preserve_placeholders: bool = Field(default=True, description="Preserve code placeholders (%s, {name}, etc.)")
+    stream: bool = Field(default=False, description="Stream one NDJSON line per language as each finishes")
 
 
 class TranslationResult(BaseModel):
@@ -116,66 +121,61 @@ async def translate_text(
             ],
             "total_characters": 76
         }
+
+    Target languages are translated concurrently (at most
+    TEXT_MAX_CONCURRENT_LANGUAGES at a time); placeholders are protected once
+    and shared by every language. With "stream": true the response is NDJSON:
+    one TranslationResult line per language in completion order (or
+    {"target_lang", "error"} if it failed), then {"done": true,
+    "total_characters"}.
     """
 
     try:
-        translation_service = TranslationService(deepl_api_key=settings.DEEPL_API_KEY)
-        translations = []
+        translation_service = TranslationService(
+            deepl_api_key=settings.DEEPL_API_KEY,
+            user_id=current_user['user_id']
+        )
 
-        # Protect placeholders if requested
+        # Protect placeholders once for all target languages
         if request.preserve_placeholders:
             protected_text, placeholder_map = PlaceholderProtector.protect(request.text)
         else:
             protected_text = request.text
             placeholder_map = {}
 
-        # Translate to each target language
-        for target_lang in request.target_langs:
-            try:
-                # Translate
-                result = await translation_service.translate(
-                    text=protected_text,
-                    source_lang=request.source_lang,
-                    target_lang=target_lang
-                )
-
-                if not result['success']:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Translation to {target_lang} failed: {result.get('error', 'Unknown error')}"
-                    )
-
-                translated_text = result['text']
-
-                # Restore placeholders
-                if request.preserve_placeholders and placeholder_map:
-                    translated_text = PlaceholderProtector.restore(translated_text, placeholder_map)
-
-                # Create result
-                result = TranslationResult(
-                    target_lang=target_lang,
-                    translated_text=translated_text,
-                    original_length=len(request.text),
-                    translated_length=len(translated_text),
-                    placeholders_preserved=len(placeholder_map) if placeholder_map else None
-                )
-
-                translations.append(result)
+        # Bounded fan-out: each language waits for a slot
+        semaphore = asyncio.Semaphore(settings.TEXT_MAX_CONCURRENT_LANGUAGES)
 
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Translation to {target_lang} failed: {str(e)}"
+        async def translate_language(target_lang: str) -> TranslationResult:
+            async with semaphore:
+                return await _translate_to_language(
+                    translation_service, request, protected_text, placeholder_map, target_lang
                 )
 
         # Calculate total characters
         total_chars = sum(len(request.text) for _ in request.target_langs)
 
+        if request.stream:
+            return StreamingResponse(
+                _stream_translations(request.target_langs, translate_language, total_chars),
+                media_type="application/x-ndjson"
+            )
+
+        outcomes = await asyncio.gather(
+            *(translate_language(target_lang) for target_lang in request.target_langs),
+            return_exceptions=True
+        )
+
+        # Report the first failing language in request order
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+
         return TextTranslateResponse(
             success=True,
             source_language=request.source_lang,
             original_text=request.text,
-            translations=translations,
+            translations=list(outcomes),
             total_characters=total_chars
         )
 
@@ -185,6 +185,83 @@ async def translate_text(
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
 
+async def _translate_to_language(
+    translation_service: TranslationService,
+    request: TextTranslateRequest,
+    protected_text: str,
+    placeholder_map: Dict[str, str],
+    target_lang: str
+) -> TranslationResult:
+    """
+    Translate the (placeholder-protected) text into one target language
+
+    Raises:
+        HTTPException: 500 if the translation failed
+    """
+    try:
+        # Translate
+        result = await translation_service.translate_async(
+            text=protected_text,
+            source_lang=request.source_lang,
+            target_lang=target_lang
+        )
+
+        if not result['success']:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Translation to {target_lang} failed: {result.get('error', 'Unknown error')}"
+            )
+
+        translated_text = result['text']
+
+        # Restore placeholders
+        if request.preserve_placeholders and placeholder_map:
+            translated_text = PlaceholderProtector.restore(translated_text, placeholder_map)
+
+        return TranslationResult(
+            target_lang=target_lang,
+            translated_text=translated_text,
+            original_length=len(request.text),
+            translated_length=len(translated_text),
+            placeholders_preserved=len(placeholder_map) if placeholder_map else None
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Translation to {target_lang} failed: {str(e)}"
+        )
+
+
+async def _stream_translations(
+    target_langs: List[str],
+    translate_language: Callable[[str], Awaitable[TranslationResult]],
+    total_chars: int
+) -> AsyncIterator[str]:
+    """Yield one NDJSON line per target language as soon as it is translated"""
+
+    async def line(target_lang: str) -> str:
+        try:
+            return (await translate_language(target_lang)).model_dump_json()
+        except HTTPException as e:
+            return json.dumps({"target_lang": target_lang, "error": e.detail})
+
+    tasks = [asyncio.ensure_future(line(target_lang)) for target_lang in target_langs]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done + "\n"
+
+        yield json.dumps({"done": True, "total_characters": total_chars}) + "\n"
+
+    finally:
+        # Client disconnected mid-stream: stop paying for the remaining languages
+        for task in tasks:
+            task.cancel()
+
+
 @router.post("/translate/batch", response_model=BatchTextTranslateResponse)
 async def translate_batch(
     request: BatchTextTranslateRequest,
@@ -217,9 +294,12 @@ async def translate_batch(
         if len(request.texts) > 100:
             raise HTTPException(status_code=400, detail="Maximum 100 texts per batch")
 
-        translation_service = TranslationService(deepl_api_key=settings.DEEPL_API_KEY)
-        results = []
-        total_chars = 0
+        translation_service = TranslationService(
+            deepl_api_key=settings.DEEPL_API_KEY,
+            user_id=current_user['user_id']
+        )
+        protected_texts = []
+        placeholder_maps = []
 
         for index, text in enumerate(request.texts):
             if len(text) > 10000:
@@ -235,41 +315,41 @@ async def translate_batch(
                 protected_text = text
                 placeholder_map = {}
 
-            # Translate
-            try:
-                result = await translation_service.translate(
-                    text=protected_text,
-                    source_lang=request.source_lang,
-                    target_lang=request.target_lang
-                )
-
-                if not result['success']:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Translation failed at index {index}: {result.get('error', 'Unknown error')}"
-                    )
+            protected_texts.append(protected_text)
+            placeholder_maps.append(placeholder_map)
 
-                translated_text = result['text']
-
-                # Restore placeholders
-                if request.preserve_placeholders and placeholder_map:
-                    translated_text = PlaceholderProtector.restore(translated_text, placeholder_map)
-
-                # Add result
-                results.append(BatchTranslationResult(
-                    original=text,
-                    translated=translated_text,
-                    index=index
-                ))
+        # Translate all texts with batched provider requests
+        batch_results = await translation_service.translate_batch_async(
+            texts=protected_texts,
+            source_lang=request.source_lang,
+            target_lang=request.target_lang
+        )
 
-                total_chars += len(text)
+        results = []
+        total_chars = 0
 
-            except Exception as e:
+        for index, (text, result, placeholder_map) in enumerate(zip(request.texts, batch_results, placeholder_maps)):
+            if not result['success']:
                 raise HTTPException(
                     status_code=500,
-                    detail=f"Translation failed at index {index}: {str(e)}"
+                    detail=f"Translation failed at index {index}: {result.get('error', 'Unknown error')}"
                 )
 
+            translated_text = result['text']
+
+            # Restore placeholders
+            if request.preserve_placeholders and placeholder_map:
+                translated_text = PlaceholderProtector.restore(translated_text, placeholder_map)
+
+            # Add result
+            results.append(BatchTranslationResult(
+                original=text,
+                translated=translated_text,
+                index=index
+            ))
+
+            total_chars += len(text)
+
         return BatchTextTranslateResponse(
             success=True,
             source_language=request.source_lang,
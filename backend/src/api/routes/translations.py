@@ -69,14 +69,19 @@ async def create_translation(
 
         # Translate text using DeepL
         logger.info(f"Translating text from {translation.source_lang} to {translation.target_lang}")
-        translated_text = service.translate(
+        result = await service.translate_async(
             text=translation.source_text,
             source_lang=translation.source_lang,
             target_lang=translation.target_lang
         )
 
-        # Determine which engine was used
-        engine = service.get_status()['primary_provider'] or 'fallback'
+        if not result['success']:
+            raise RuntimeError(result.get('error', 'Unknown error'))
+
+        translated_text = result['text']
+
+        # Engine that produced the translation
+        engine = result['provider']
         translation_status = 'completed'
         translated_at = datetime.utcnow()
 
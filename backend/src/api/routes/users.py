@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from psycopg2.extras import RealDictCursor
 from src.config.database import get_db
+from src.api.dependencies.jwt_auth import get_current_user_id
+from src.core.usage_ledger import get_usage_ledger
 from src.schemas.user import UserResponse, UserUpdate
-from typing import Dict
+from typing import Dict, Optional
 
 router = APIRouter()
 
@@ -88,4 +90,18 @@ async def get_user_stats(
             detail="User not found"
         )
     
-    return stats
\ No newline at end of file
+    return stats
+
+
+@router.get("/usage")
+def get_user_usage(
+    job_id: Optional[str] = None,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    Characters translated this month per provider and language pair (usage ledger)
+
+    Plain def: the ledger flushes and queries Postgres with blocking calls, so FastAPI
+    runs it in its threadpool instead of on the event loop.
+    """
+    return get_usage_ledger().get_summary(user_id=user_id, job_id=job_id)
@@ -19,6 +19,76 @@ class Settings(BaseSettings):
 
     # Translation Services
     DEEPL_API_KEY: Optional[str] = None
+    DEEPL_SERVER_URL: Optional[str] = None  # Override the API host (e.g. benchmarks/deepl_emulator.py)
+    DEEPL_MAX_CONCURRENT_REQUESTS: int = 8  # Async client: in-flight requests per event loop
+    DEEPL_REQUEST_TIMEOUT: float = 30.0  # Async client: seconds per request
+    TEXT_MAX_CONCURRENT_LANGUAGES: int = 4  # /api/text/translate: target languages in flight per request
+    PROVIDER_MAX_RETRIES: int = 4  # Retries per request on 429/5xx/network errors
+    PROVIDER_MAX_BACKOFF_SECONDS: float = 30.0  # Backoff / Retry-After cap
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5  # Consecutive failures that open a provider's circuit
+    CIRCUIT_BREAKER_RECOVERY_SECONDS: float = 30.0  # Open time before a probe request
+    ROUTING_STRATEGY: str = "quality"  # Provider order: 'quality', 'cost' or 'latency'
+    ROUTING_BULK_MIN_CHARACTERS: int = 400  # 'cost': segments this long go to the cheapest provider first
+    DEEPL_COST_PER_CHARACTER: float = 0.00002  # EUR (€20 per 1M characters)
+    MARIAN_COST_PER_CHARACTER: float = 0.0  # EUR (local compute only)
+    MARIAN_MODEL_CACHE_MB: int = 2048  # Loaded models per worker (LRU eviction above this)
+    MARIAN_PINNED_PAIRS: str = ""  # Comma-separated pairs never evicted, e.g. "en-es,en-fr"
+    MARIAN_MODEL_DIR: str = "/opt/translatecloud/marian"  # Pre-staged models (python -m src.core.model_store en-es ...)
+    MARIAN_HUB_FALLBACK: bool = True  # Download pairs missing from MARIAN_MODEL_DIR from the Hugging Face Hub
+    MARIAN_WARMUP_PAIRS: str = ""  # Comma-separated pairs loaded in the background at worker start
+    MARIAN_QUANTIZE: bool = False  # int8 dynamic quantization of Linear layers (CPU only, see benchmarks/marian_quantization.py)
+    MARIAN_MAX_BATCH_SIZE: int = 32  # Texts per generate() call (length-bucketed)
+    MARIAN_BATCH_MAX_TOKENS: int = 0  # Padded tokens per generate() call (0 = derive from free memory)
+    PSEUDO_LOCALIZATION_ENABLED: bool = False  # Development/benchmarks only: register the offline 'pseudo' provider
+    TRANSLATION_MEMORY_ENABLED: bool = True  # Postgres TM (requires DB_HOST)
+
+    # Translation Cache (per Lambda container)
+    TRANSLATION_CACHE_ENABLED: bool = True
+    TRANSLATION_CACHE_MAX_ENTRIES: int = 10000  # In-process LRU size cap
+    TRANSLATION_CACHE_TTL_SECONDS: int = 86400  # Entry lifetime (both tiers)
+    TRANSLATION_FALLBACK_TTL_SECONDS: int = 900  # Lifetime of fallback provider (MarianMT) entries; never in the TM
+    TRANSLATION_DISK_CACHE_PATH: str = "/tmp/translatecloud/translation-cache.sqlite3"  # '' disables
+    TRANSLATION_DISK_CACHE_MAX_MB: int = 100  # /tmp size cap (Lambda /tmp default: 512 MB)
+
+    # Fuzzy Translation Memory (near-duplicate segments)
+    FUZZY_MATCH_ENABLED: bool = True
+    FUZZY_MATCH_THRESHOLD: float = 0.85  # Minimum character similarity (0-1)
+    FUZZY_MATCH_MAX_ENTRIES: int = 20000  # Indexed segments per language pair
+    FUZZY_MATCH_PRELOAD_LIMIT: int = 5000  # Recent TM segments loaded per language pair
+
+    # Single-Flight Coalescing (identical segments in flight are translated once)
+    SINGLE_FLIGHT_ENABLED: bool = True
+    SINGLE_FLIGHT_TIMEOUT_SECONDS: float = 120.0  # Follower wait before translating itself
+
+    # Sentence Segmentation (translate, cache and store per sentence)
+    SENTENCE_SEGMENTATION_ENABLED: bool = True
+
+    # HTML Fragment Mode (website jobs: translate each text block's inner HTML
+    # with DeepL tag handling instead of its flattened text)
+    HTML_FRAGMENT_MODE: bool = True
+
+    # Crawling (WebExtractor.crawl_website, WebCrawler.crawl)
+    CRAWL_CONCURRENCY: int = 8  # Pages fetched in parallel
+    CRAWL_TIMEOUT_SECONDS: float = 15.0  # Per page (connect timeout: 5s)
+    CRAWL_MIN_DELAY_SECONDS: float = 0.1  # Per-host delay floor between request starts (robots.txt Crawl-delay raises it)
+    CRAWL_MAX_DELAY_SECONDS: float = 10.0  # Per-host delay ceiling (also caps Crawl-delay and Retry-After)
+    CRAWL_LATENCY_FACTOR: float = 0.5  # Per-host delay follows this multiple of the average response time
+    CRAWL_SITEMAPS_ENABLED: bool = True  # Seed crawls from robots.txt Sitemap: lines / sitemap.xml
+    CRAWL_MAX_SITEMAPS: int = 20  # Sitemap files (incl. sitemap-index children) fetched per crawl
+    CRAWL_FOLLOW_LINKS: bool = True  # Also follow <a href> links when a sitemap was found (always without one)
+
+    # Crawl Cache (pages shared between /crawl, /translate and worker jobs)
+    CRAWL_CACHE_ENABLED: bool = True
+    CRAWL_CACHE_BACKEND: str = "disk"  # 'disk' (per container) or 's3' (shared)
+    CRAWL_CACHE_TTL_SECONDS: int = 3600  # Served without a request; older entries are revalidated (ETag / Last-Modified)
+    CRAWL_CACHE_DIR: str = "/tmp/translatecloud/crawl-cache"  # Disk backend
+    CRAWL_CACHE_MAX_MB: int = 100  # Disk backend size cap
+    CRAWL_CACHE_S3_BUCKET: str = ""  # S3 backend
+    CRAWL_CACHE_S3_PREFIX: str = "crawl-cache/"
+
+    # Usage Ledger (local character accounting, see scripts/database/add-translation-usage.sql)
+    USAGE_LEDGER_FLUSH_SECONDS: float = 60.0  # Background flush interval to Postgres
+    USAGE_RECONCILE_SECONDS: float = 3600.0  # Minimum interval between DeepL /v2/usage calls
 
     # JWT Authentication
     JWT_SECRET_KEY: str = "your-secret-key-change-in-production"
@@ -0,0 +1,235 @@
+"""
+TranslateCloud - Provider Circuit Breaker
+
+Per-provider state machine used by TranslationService for fallback decisions
+and by the status endpoint. All state is in process memory: checking a
+provider's health never makes a network call.
+
+States:
+    closed     Requests flow. `failure_threshold` consecutive failures open
+               the circuit.
+    open       Requests are refused immediately (fallback provider is used)
+               for `recovery_timeout` seconds.
+    half_open  After the timeout, `half_open_max_calls` probe requests are let
+               through. A success closes the circuit, a failure re-opens it.
+
+    closed --(N failures)--> open --(timeout)--> half_open --(success)--> closed
+                               ^                     |
+                               +-----(failure)-------+
+
+Latency of successful calls is kept (last `latency_window` calls) for
+average/p50/p95 reporting.
+
+Usage:
+    breaker = get_circuit_breaker('deepl')
+    if breaker.allow_request():
+        start = time.perf_counter()
+        try:
+            result = call_provider()
+            breaker.record_success(time.perf_counter() - start)
+        except ProviderDown:
+            breaker.record_failure()
+        except BaseException:
+            breaker.record_abandoned()  # cancelled: free the probe slot
+            raise
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker with latency stats"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        latency_window: int = 200
+    ):
+        """
+        Args:
+            name: Provider name (logging and status)
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before probing
+            half_open_max_calls: Concurrent probe requests in half-open state
+            latency_window: Successful call latencies kept for percentiles
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._last_success: Optional[float] = None
+        self._last_failure: Optional[float] = None
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+        self._stats = {'successes': 0, 'failures': 0, 'rejected': 0, 'opened': 0}
+
+    @property
+    def state(self) -> str:
+        """Current state ('open' turns into 'half_open' once the timeout passed)"""
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """
+        Whether a request to the provider should be attempted now
+
+        In half-open state only `half_open_max_calls` probes are admitted;
+        each admitted call must be followed by record_success/record_failure,
+        or by record_abandoned if it ended without an outcome (cancelled).
+        """
+        with self._lock:
+            state = self._current_state()
+
+            if state == CLOSED:
+                return True
+
+            if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+
+            self._stats['rejected'] += 1
+            return False
+
+    def record_success(self, latency: Optional[float] = None):
+        """Record a successful call (closes a half-open circuit)"""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit breaker '{self.name}' closed (provider recovered)")
+
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._half_open_calls = 0
+            self._last_success = time.time()
+            self._stats['successes'] += 1
+
+            if latency is not None:
+                self._latencies.append(latency)
+
+    def record_abandoned(self):
+        """
+        Release an admitted call that ended without an outcome
+
+        A probe cancelled (or interrupted) before the provider answered says
+        nothing about its health: its half-open slot is freed for the next
+        probe and the state is left unchanged. No-op outside half-open state.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_failure(self):
+        """Record a provider failure (may open the circuit)"""
+        with self._lock:
+            state = self._current_state()
+            self._consecutive_failures += 1
+            self._last_failure = time.time()
+            self._stats['failures'] += 1
+
+            if state == HALF_OPEN or (
+                state == CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._half_open_calls = 0
+                self._stats['opened'] += 1
+                logger.warning(
+                    f"Circuit breaker '{self.name}' opened after {self._consecutive_failures} "
+                    f"consecutive failures (retry in {self.recovery_timeout:.0f}s)"
+                )
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Cached health of the provider (no network call)
+
+        Returns:
+            dict: {
+                'state': 'closed' | 'open' | 'half_open',
+                'available': bool (requests would be attempted),
+                'consecutive_failures': int,
+                'retry_in_seconds': float (open state only, else 0),
+                'last_success': epoch seconds or None,
+                'last_failure': epoch seconds or None,
+                'latency_ms': {'avg', 'p50', 'p95', 'samples'},
+                'successes', 'failures', 'rejected', 'opened': counters
+            }
+        """
+        with self._lock:
+            state = self._current_state()
+            latencies = sorted(self._latencies)
+
+            retry_in = 0.0
+            if state == OPEN:
+                retry_in = max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+            return {
+                'state': state,
+                'available': state != OPEN,
+                'consecutive_failures': self._consecutive_failures,
+                'retry_in_seconds': round(retry_in, 1),
+                'last_success': self._last_success,
+                'last_failure': self._last_failure,
+                'latency_ms': {
+                    'avg': round(sum(latencies) / len(latencies) * 1000, 1) if latencies else None,
+                    'p50': round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+                    'p95': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1) if latencies else None,
+                    'samples': len(latencies)
+                },
+                **self._stats
+            }
+
+    def _current_state(self) -> str:
+        """Resolve open -> half_open after the recovery timeout (lock held)"""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+
+        return self._state
+
+
+# ============================================================================
+# Shared Breakers
+# ============================================================================
+
+# Module level so provider health survives the per-request TranslationService
+# instances within a warm Lambda container
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get (or create) the shared circuit breaker for a provider"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_SECONDS
+            )
+            _breakers[name] = breaker
+
+        return breaker
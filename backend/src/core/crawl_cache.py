@@ -0,0 +1,301 @@
+"""
+TranslateCloud - Shared HTTP Crawl Cache
+
+Pages fetched by one crawl are reused by the next: /api/projects/crawl
+(WebCrawler) followed by /api/projects/translate (WebExtractor.crawl_page),
+re-submitted jobs and several workers crawling the same site.
+
+Each entry, keyed by the crawler's normalized URL, holds the response body,
+its validators (ETag, Last-Modified) and the parsed page of every consumer
+that already parsed it ('crawler', 'extractor:elements',
+'extractor:fragments'):
+
+- Fresh entry (younger than CRAWL_CACHE_TTL_SECONDS): no request at all,
+  and no parsing if this consumer parsed the page before
+- Stale entry with validators: conditional GET (If-None-Match /
+  If-Modified-Since); a 304 renews the entry and skips download and parsing
+- Responses with Cache-Control: no-store are never cached
+
+Backends (CRAWL_CACHE_BACKEND):
+    disk - one gzipped JSON file per URL under CRAWL_CACHE_DIR (per
+           container, pruned to CRAWL_CACHE_MAX_MB)
+    s3   - one object per URL under CRAWL_CACHE_S3_BUCKET/CRAWL_CACHE_S3_PREFIX
+           (shared by API and worker Lambdas; expire old objects with a
+           bucket lifecycle rule)
+
+Cache errors never fail a crawl: they are logged and the page is fetched.
+
+Usage:
+    >>> cache = get_crawl_cache()
+    >>> entry = cache.lookup(url)
+    >>> headers = cache.validators(entry)
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry or parsed page format changes
+CACHE_VERSION = 2
+
+# Disk backend: prune after this many writes
+PRUNE_EVERY = 50
+
+
+class DiskCrawlCacheBackend:
+    """Entries as files in a local directory (atomic writes, size-capped)"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return (self.directory / key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename: readers never see half an entry
+        handle, temporary = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(handle, 'wb') as output:
+                output.write(data)
+            os.replace(temporary, self.directory / key)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self):
+        """Delete least recently written entries until within max_bytes"""
+        files = []
+        for path in self.directory.glob('*.json.gz'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class S3CrawlCacheBackend:
+    """Entries as objects in an S3 bucket (shared across containers)"""
+
+    def __init__(self, bucket: str, prefix: str):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.s3 = boto3.client('s3', region_name=settings.AWS_REGION)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.s3.get_object(Bucket=self.bucket, Key=self.prefix + key)['Body'].read()
+        except self.s3.exceptions.NoSuchKey:
+            return None
+
+    def put(self, key: str, data: bytes):
+        self.s3.put_object(
+            Bucket=self.bucket,
+            Key=self.prefix + key,
+            Body=data,
+            ContentType='application/json',
+            ContentEncoding='gzip'
+        )
+
+
+class CrawlCache:
+    """
+    HTTP crawl cache with TTL and conditional revalidation
+
+    Entries are plain dicts:
+        url, status, content_type, etag, last_modified, final_url,
+        fetched_at, body (bytes), pages ({consumer: parsed page})
+    """
+
+    def __init__(self, backend, ttl_seconds: float):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'errors': 0}
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for `url` (fresh or stale, see is_fresh), None if not cached"""
+        try:
+            data = self.backend.get(self._key(url))
+            entry = self._decode(data) if data else None
+        except Exception as e:
+            logger.warning(f"Crawl cache read failed for {url}: {e}")
+            self._count('errors')
+            return None
+
+        if entry is None or entry.get('url') != url:
+            self._count('misses')
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Usable without asking the server"""
+        return time.time() - entry['fetched_at'] < self.ttl_seconds
+
+    def validators(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Conditional request headers for a stale entry ({} if it has no validators)"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record_hit(self):
+        """A fresh entry was served"""
+        self._count('hits')
+
+    def revalidated(self, entry: Dict[str, Any], headers) -> Dict[str, Any]:
+        """Renew an entry after a 304 (the server may send new validators)"""
+        self._count('revalidated')
+        entry['fetched_at'] = time.time()
+        entry['etag'] = headers.get('ETag') or entry.get('etag')
+        entry['last_modified'] = headers.get('Last-Modified') or entry.get('last_modified')
+        self._put(entry)
+        return entry
+
+    def store(
+        self,
+        url: str,
+        status: int,
+        headers,
+        body: bytes,
+        final_url: Optional[str] = None,
+        consumer: Optional[str] = None,
+        page: Optional[Dict] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cache a fetched response (and the consumer's parsed page)
+
+        Returns:
+            The new entry, None if the response must not be cached
+        """
+        if status != 200 or 'no-store' in (headers.get('Cache-Control') or '').lower():
+            return None
+
+        entry = {
+            'url': url,
+            'status': status,
+            'content_type': headers.get('Content-Type', ''),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'final_url': final_url or url,
+            'fetched_at': time.time(),
+            'body': body,
+            'pages': {consumer: page} if consumer and page is not None else {},
+        }
+        self._count('stores')
+        self._put(entry)
+        return entry
+
+    def add_page(self, entry: Dict[str, Any], consumer: str, page: Dict):
+        """Attach another consumer's parsed page to an existing entry"""
+        entry['pages'][consumer] = page
+        self._put(entry)
+
+    def get_stats(self) -> Dict[str, int]:
+        """hits, revalidated (304), misses, stores, errors"""
+        with self._lock:
+            return dict(self._stats)
+
+    def _put(self, entry: Dict[str, Any]):
+        try:
+            self.backend.put(self._key(entry['url']), self._encode(entry))
+        except Exception as e:
+            logger.warning(f"Crawl cache write failed for {entry['url']}: {e}")
+            self._count('errors')
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(f'v{CACHE_VERSION}:{url}'.encode('utf-8')).hexdigest() + '.json.gz'
+
+    @staticmethod
+    def _encode(entry: Dict[str, Any]) -> bytes:
+        document = dict(entry, body=base64.b64encode(entry['body']).decode('ascii'))
+        return gzip.compress(json.dumps(document).encode('utf-8'), compresslevel=5)
+
+    @staticmethod
+    def _decode(data: bytes) -> Dict[str, Any]:
+        entry = json.loads(gzip.decompress(data))
+        entry['body'] = base64.b64decode(entry['body'])
+        return entry
+
+
+# ============================================================================
+# Shared Instance
+# ============================================================================
+
+_crawl_cache: Optional[CrawlCache] = None
+_crawl_cache_lock = threading.Lock()
+
+
+def get_crawl_cache() -> Optional[CrawlCache]:
+    """
+    Get the process-wide crawl cache (None if disabled or misconfigured)
+    """
+    global _crawl_cache
+
+    if not settings.CRAWL_CACHE_ENABLED:
+        return None
+
+    with _crawl_cache_lock:
+        if _crawl_cache is None:
+            backend = None
+
+            if settings.CRAWL_CACHE_BACKEND == 's3':
+                if settings.CRAWL_CACHE_S3_BUCKET:
+                    backend = S3CrawlCacheBackend(settings.CRAWL_CACHE_S3_BUCKET, settings.CRAWL_CACHE_S3_PREFIX)
+                else:
+                    logger.warning("CRAWL_CACHE_BACKEND=s3 without CRAWL_CACHE_S3_BUCKET, crawl cache disabled")
+            elif settings.CRAWL_CACHE_BACKEND == 'disk' and settings.CRAWL_CACHE_DIR:
+                backend = DiskCrawlCacheBackend(settings.CRAWL_CACHE_DIR, settings.CRAWL_CACHE_MAX_MB * 1024 * 1024)
+
+            if backend is None:
+                return None
+
+            _crawl_cache = CrawlCache(backend, settings.CRAWL_CACHE_TTL_SECONDS)
+            logger.info(f"Crawl cache: {settings.CRAWL_CACHE_BACKEND}, TTL {settings.CRAWL_CACHE_TTL_SECONDS}s")
+
+        return _crawl_cache
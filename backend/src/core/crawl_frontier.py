@@ -0,0 +1,239 @@
+"""
+TranslateCloud - Crawl Frontier and Per-Host Politeness
+
+Building blocks shared by the two crawlers (WebExtractor.crawl_website for
+the SQS worker, WebCrawler.crawl for the API):
+
+- CrawlFrontier: FIFO queue + seen set, O(1) enqueue/dequeue/membership
+  (the crawlers used list.pop(0) and `url in list`, quadratic on large sites)
+- should_skip_url(): precompiled skip rules (assets, documents, mailto:,
+  social networks) instead of one regex compile per link and pattern
+- HostPoliteness: adaptive delay between request starts per host
+    * never below robots.txt Crawl-delay (or CRAWL_MIN_DELAY_SECONDS)
+    * follows the server: CRAWL_LATENCY_FACTOR x average response time
+    * 429/503 double the delay (or use Retry-After), successes decay it
+  Callers reserve a slot and sleep themselves (time.sleep in threads,
+  asyncio.sleep in coroutines), so the same policy serves both crawlers.
+- CrawlStats: pages, errors, bytes and pages/sec for a crawl
+
+Usage:
+    >>> frontier = CrawlFrontier(['https://example.com'])
+    >>> politeness = HostPoliteness()
+    >>> politeness.set_robots('example.com', robots_txt)
+    >>> time.sleep(politeness.reserve('example.com'))
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Optional
+from urllib import robotparser
+
+from src.config.settings import settings
+
+USER_AGENT = 'TranslateCloud-Bot/1.0'
+
+# Non-HTML resources (matched on the URL path, query string ignored)
+SKIP_EXTENSIONS = re.compile(
+    r'\.(?:jpe?g|png|gif|svg|webp|ico|pdf|docx?|xlsx?|pptx?|zip|tar|gz|rar|'
+    r'mp3|mp4|avi|mov|css|js|json|xml|rss|woff2?|ttf|eot)$',
+    re.IGNORECASE
+)
+
+# Links that never lead to a translatable page of the site
+SKIP_PATTERNS = re.compile(
+    r'^(?:mailto|tel|javascript|data):|'
+    r'(?:facebook|twitter|linkedin|instagram|youtube)\.com',
+    re.IGNORECASE
+)
+
+
+def should_skip_url(url: str) -> bool:
+    """True for assets, documents, mailto:/tel: links and social networks"""
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    return bool(SKIP_EXTENSIONS.search(path) or SKIP_PATTERNS.search(url))
+
+
+class CrawlFrontier:
+    """URLs waiting to be crawled, each URL enqueued at most once"""
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self._queue: deque = deque()
+        self._seen: set = set()
+        for url in urls:
+            self.add(url)
+
+    def add(self, url: str) -> bool:
+        """Enqueue `url` unless it was ever enqueued before"""
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        self._queue.append(url)
+        return True
+
+    def pop(self) -> str:
+        return self._queue.popleft()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._seen
+
+
+class HostPoliteness:
+    """
+    Adaptive per-host delay between request starts
+
+    Thread-safe; one instance per crawl.
+    """
+
+    def __init__(
+        self,
+        min_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        latency_factor: Optional[float] = None
+    ):
+        """
+        Args:
+            min_delay: Floor of the delay (default: CRAWL_MIN_DELAY_SECONDS)
+            max_delay: Ceiling of the delay (default: CRAWL_MAX_DELAY_SECONDS)
+            latency_factor: Delay as a multiple of the average response time
+                            (default: CRAWL_LATENCY_FACTOR)
+        """
+        self.min_delay = settings.CRAWL_MIN_DELAY_SECONDS if min_delay is None else min_delay
+        self.max_delay = settings.CRAWL_MAX_DELAY_SECONDS if max_delay is None else max_delay
+        self.latency_factor = settings.CRAWL_LATENCY_FACTOR if latency_factor is None else latency_factor
+
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+
+    def set_robots(self, host: str, robots_txt: Optional[str]) -> Optional[robotparser.RobotFileParser]:
+        """
+        Apply a host's robots.txt (None or '' = no robots.txt)
+
+        Returns:
+            The parsed robots.txt (e.g. for its Sitemap: lines), or None
+        """
+        parser = None
+        floor = self.min_delay
+
+        if robots_txt:
+            parser = robotparser.RobotFileParser()
+            parser.parse(robots_txt.splitlines())
+            crawl_delay = parser.crawl_delay(USER_AGENT)
+            if crawl_delay:
+                floor = max(floor, min(float(crawl_delay), self.max_delay))
+
+        with self._lock:
+            state = self._state(host)
+            state['floor'] = floor
+            state['delay'] = max(state['delay'], floor)
+            state['robots'] = parser
+
+        return parser
+
+    def reserve(self, host: str) -> float:
+        """
+        Reserve the next request slot for `host`
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        with self._lock:
+            state = self._state(host)
+            now = time.monotonic()
+            start = max(now, state['next_start'])
+            state['next_start'] = start + state['delay']
+            return start - now
+
+    def record(self, host: str, latency: float, status: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Adapt the host's delay to a finished request
+
+        Args:
+            host: Host the request went to
+            latency: Response time in seconds
+            status: HTTP status (None on network errors)
+            retry_after: Retry-After seconds sent with a 429/503
+        """
+        with self._lock:
+            state = self._state(host)
+            state['latency'] = latency if state['latency'] is None else 0.8 * state['latency'] + 0.2 * latency
+
+            if status in (429, 503):
+                delay = retry_after if retry_after else state['delay'] * 2
+                state['delay'] = min(max(delay, state['floor']), self.max_delay)
+                state['next_start'] = max(state['next_start'], time.monotonic() + state['delay'])
+                state['throttled'] += 1
+                return
+
+            target = max(state['floor'], self.latency_factor * state['latency'])
+            # Back off immediately, speed up gradually
+            state['delay'] = min(target if target > state['delay'] else 0.5 * (state['delay'] + target), self.max_delay)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per host: delay_seconds, crawl_delay_floor, latency_ms, throttled"""
+        with self._lock:
+            return {
+                host: {
+                    'delay_seconds': round(state['delay'], 3),
+                    'crawl_delay_floor': round(state['floor'], 3),
+                    'latency_ms': round(state['latency'] * 1000, 1) if state['latency'] is not None else None,
+                    'throttled': state['throttled'],
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def _state(self, host: str) -> Dict[str, Any]:
+        """Per-host state (lock held)"""
+        if host not in self._hosts:
+            self._hosts[host] = {
+                'delay': self.min_delay,
+                'floor': self.min_delay,
+                'next_start': 0.0,
+                'latency': None,
+                'throttled': 0,
+                'robots': None,
+            }
+        return self._hosts[host]
+
+
+class CrawlStats:
+    """Counters of one crawl (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self.pages = 0
+        self.errors = 0
+        self.bytes = 0
+
+    def record_page(self, size: int):
+        with self._lock:
+            self.pages += 1
+            self.bytes += size
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def as_dict(self, politeness: Optional[HostPoliteness] = None) -> Dict[str, Any]:
+        """pages, errors, bytes, seconds, pages_per_second (+ hosts)"""
+        with self._lock:
+            seconds = time.monotonic() - self._start
+            stats = {
+                'pages': self.pages,
+                'errors': self.errors,
+                'bytes': self.bytes,
+                'seconds': round(seconds, 2),
+                'pages_per_second': round(self.pages / seconds, 2) if seconds > 0 else 0.0,
+            }
+
+        if politeness is not None:
+            stats['hosts'] = politeness.get_stats()
+        return stats
@@ -0,0 +1,215 @@
+"""
+TranslateCloud - Async DeepL API Client
+
+Native asyncio client for the DeepL API v2, used by the FastAPI routes.
+
+The official `deepl` package is synchronous: calling it from an `async def`
+route blocks the whole event loop for the duration of the HTTP request. This
+client talks to the REST API directly with aiohttp instead.
+
+Features:
+- One keep-alive aiohttp session per event loop, shared by every
+  DeepLTranslator created with the same API key (routes create a new
+  TranslationService per request, the connections survive between them)
+- Bounded concurrency: at most DEEPL_MAX_CONCURRENT_REQUESTS in flight
+- Per-call timeouts (DEEPL_REQUEST_TIMEOUT seconds)
+
+The synchronous `deepl.Translator` is still used by the SQS worker.
+
+API Reference:
+    https://www.deepl.com/docs-api/translate-text/
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# DeepL routes Free API keys (suffix ":fx") and Pro keys to different hosts
+DEEPL_FREE_SERVER_URL = "https://api-free.deepl.com"
+DEEPL_PRO_SERVER_URL = "https://api.deepl.com"
+
+
+def default_server_url(api_key: str) -> str:
+    """Return the DeepL API host matching the API key type"""
+    return DEEPL_FREE_SERVER_URL if api_key.endswith(':fx') else DEEPL_PRO_SERVER_URL
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class DeepLAPIError(Exception):
+    """
+    Error response from the DeepL API (or a transport failure)
+
+    Attributes:
+        status (Optional[int]): HTTP status code, None for network errors
+        retry_after (Optional[float]): Seconds from the Retry-After header
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AsyncDeepLClient:
+    """
+    Connection-pooled asyncio client for DeepL /v2/translate and /v2/usage
+
+    Usage:
+        client = get_async_client(api_key)
+        texts = await client.translate(["Hello"], target_lang="ES")
+        # ["Hola"]
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        server_url: Optional[str] = None,
+        max_concurrency: int = 8,
+        timeout: float = 30.0
+    ):
+        """
+        Args:
+            api_key: DeepL API key
+            server_url: API host (default: derived from the key type)
+            max_concurrency: Maximum concurrent requests per event loop
+            timeout: Total timeout per request in seconds
+        """
+        self.api_key = api_key
+        self.server_url = (server_url or default_server_url(api_key)).rstrip('/')
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+
+        # aiohttp sessions and asyncio semaphores are bound to the event loop
+        # that created them, so keep one of each per loop
+        self._loop_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_loop_state(self) -> tuple:
+        """Return (session, semaphore) for the running event loop"""
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.get(loop)
+
+        if state is None or state[0].closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                keepalive_timeout=60
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={
+                    'Authorization': f'DeepL-Auth-Key {self.api_key}',
+                    'User-Agent': 'TranslateCloud/1.0'
+                }
+            )
+            state = (session, asyncio.Semaphore(self.max_concurrency))
+            self._loop_state[loop] = state
+
+        return state
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Perform one API request under the concurrency limit
+
+        Raises:
+            DeepLAPIError: On non-2xx responses, timeouts and network errors
+        """
+        session, semaphore = self._get_loop_state()
+
+        async with semaphore:
+            try:
+                async with session.request(method, f"{self.server_url}{path}", **kwargs) as response:
+                    if response.status >= 400:
+                        body = await response.text()
+                        raise DeepLAPIError(
+                            f"DeepL API returned {response.status}: {body[:200]}",
+                            status=response.status,
+                            retry_after=_parse_retry_after(response.headers.get('Retry-After'))
+                        )
+                    return await response.json()
+
+            except asyncio.TimeoutError:
+                raise DeepLAPIError(f"DeepL request timed out after {self.timeout.total}s")
+            except aiohttp.ClientError as e:
+                raise DeepLAPIError(f"DeepL connection error: {e}")
+
+    async def translate(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        **options: Any
+    ) -> List[str]:
+        """
+        Translate a list of texts in a single API request
+
+        Args:
+            texts: Texts to translate (caller enforces DeepL request limits)
+            target_lang: DeepL target language code (e.g. 'ES', 'EN-US')
+            source_lang: DeepL source language code, None for auto-detection
+            **options: Extra DeepL parameters (e.g. tag_handling='html')
+
+        Returns:
+            List[str]: Translated texts in input order
+        """
+        payload: Dict[str, Any] = {'text': texts, 'target_lang': target_lang}
+        if source_lang:
+            payload['source_lang'] = source_lang
+        payload.update({key: value for key, value in options.items() if value is not None})
+
+        data = await self._request('POST', '/v2/translate', json=payload)
+        return [item['text'] for item in data['translations']]
+
+    async def get_usage(self) -> Dict[str, Any]:
+        """Return raw /v2/usage response ({'character_count', 'character_limit'})"""
+        return await self._request('GET', '/v2/usage')
+
+    async def close(self):
+        """Close the session bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.pop(loop, None)
+        if state and not state[0].closed:
+            await state[0].close()
+
+
+# ============================================================================
+# Shared Clients
+# ============================================================================
+
+# One client per API key so keep-alive connections are reused across
+# TranslationService instances within a warm Lambda container
+_clients: Dict[str, AsyncDeepLClient] = {}
+
+
+def get_async_client(api_key: str) -> AsyncDeepLClient:
+    """Get (or create) the shared async client for an API key"""
+    client = _clients.get(api_key)
+
+    if client is None:
+        client = AsyncDeepLClient(
+            api_key,
+            server_url=settings.DEEPL_SERVER_URL,
+            max_concurrency=settings.DEEPL_MAX_CONCURRENT_REQUESTS,
+            timeout=settings.DEEPL_REQUEST_TIMEOUT
+        )
+        _clients[api_key] = client
+
+    return client
@@ -24,13 +24,15 @@ Architecture Flow:
 
 Performance:
 - Average latency: 200-500ms per request
-- Batch size: Optimized for single text strings
-- Rate limits: Managed by DeepL API
-- Concurrent requests: Handled by DeepL infrastructure
+- Batch size: Up to 50 texts / 128 KiB per request (see translate_batch)
+- Rate limits: Shared adaptive controller (src/core/rate_limiter.py) -
+  Retry-After, jittered backoff, AIMD concurrency
+- Concurrent requests: Bounded by the async client and the controller
 
 Error Handling:
 - DeepL API errors (quota exceeded, invalid language, etc.)
-- Network timeouts and connectivity issues
+- Network timeouts and connectivity issues (retried, then flagged
+  'retryable' so the worker can retry them at the end of the job)
 - Malformed input validation
 
 Author: TranslateCloud Team
@@ -39,12 +41,20 @@ Version: 2.0 (DeepL API v2 compliant)
 """
 
 # Standard library imports
+import asyncio  # For concurrent async batch requests
 import logging  # For error and info logging
-from typing import Optional  # For optional return types
+import time  # For request latency (circuit breaker stats)
+from typing import Any, Dict, Iterator, List, Optional, Tuple  # For type hints
 
 # Third-party imports
 import deepl  # Official DeepL API client library
 
+# Local imports
+from src.config.settings import settings  # DEEPL_SERVER_URL
+from src.core.deepl_async_client import DeepLAPIError, get_async_client  # Non-blocking client for routes
+from src.core.rate_limiter import TRANSIENT_ERRORS, classify_error, get_rate_controller  # Shared retry policy
+from src.core.circuit_breaker import get_circuit_breaker  # Cached provider health
+
 # ============================================================================
 # Logging Configuration
 # ============================================================================
@@ -123,6 +133,23 @@ DEEPL_LANGUAGE_MAP = {
 # Format: 'LANG_CODE': 'LANG_CODE'
 # Example: 'AR': 'AR' for Arabic (when DeepL adds support)
 
+# ============================================================================
+# DeepL API v2 Request Limits
+# ============================================================================
+
+# A single /v2/translate request accepts at most 50 `text` parameters and a
+# total request size of 128 KiB. We keep a safety margin on the payload size
+# for the other form fields (languages, tag handling) and URL encoding.
+#
+# Reference: https://www.deepl.com/docs-api/translate-text/translate-text/
+DEEPL_MAX_TEXTS_PER_REQUEST = 50
+DEEPL_MAX_REQUEST_BYTES = 120 * 1024
+
+# The deepl package retries 429/5xx itself (5 times, ignoring Retry-After and
+# unaware of other requests). Retries are owned by the shared rate controller
+# instead, so throttling seen by one request slows down all of them.
+deepl.http_client.max_network_retries = 0
+
 
 class DeepLTranslator:
     """
@@ -143,9 +170,12 @@ class DeepLTranslator:
 
     Usage Example:
         translator = DeepLTranslator(api_key="your-api-key")
-        result = await translator.translate_text("Hello", "auto", "ES")
+        result = translator.translate_text("Hello", "auto", "ES")
         print(result)  # "Hola"
 
+        # From async code (FastAPI routes) - does not block the event loop
+        result = await translator.translate_text_async("Hello", "auto", "ES")
+
         usage = translator.get_usage()
         print(f"Used: {usage['character_count']} / {usage['character_limit']}")
 
@@ -184,11 +214,63 @@ class DeepLTranslator:
 
         # Initialize DeepL API client
         # This does NOT make an API call - validation happens on first request
-        self.translator = deepl.Translator(api_key)
+        # DEEPL_SERVER_URL points both clients at another host (local emulator)
+        self.translator = deepl.Translator(api_key, server_url=settings.DEEPL_SERVER_URL)
+
+        # Shared asyncio client (keep-alive session) for the *_async methods
+        # used by FastAPI routes - the deepl.Translator above blocks the loop
+        self.async_client = get_async_client(api_key)
+
+        # Shared retry/backoff/concurrency controller for every DeepL call
+        self.rate_controller = get_rate_controller('deepl')
+
+        # Shared circuit breaker: stops calling DeepL while it is down and
+        # provides cached health/latency for status checks
+        self.breaker = get_circuit_breaker('deepl')
 
         # Log successful initialization
         logger.info("DeepL translator initialized successfully")
 
+    def _map_languages(
+        self,
+        source_lang: str,
+        target_lang: str
+    ) -> Tuple[Optional[str], str]:
+        """
+        Map user-facing language codes to DeepL API v2 codes
+
+        Args:
+            source_lang (str): Source language code or 'auto'
+            target_lang (str): Target language code (case-insensitive)
+
+        Returns:
+            Tuple[Optional[str], str]: (source, target) where source is None
+                                       for automatic language detection
+        """
+        # Convert source language to uppercase for mapping
+        # Special case: 'auto' means automatic language detection
+        if source_lang != 'auto':
+            source = source_lang.upper()
+        else:
+            source = None  # DeepL API uses None for auto-detection
+
+        # Convert target language to uppercase
+        target_upper = target_lang.upper()
+
+        # Map to DeepL API v2 format using our mapping dictionary
+        # If language is not in map, use it as-is (for future languages)
+        target = DEEPL_LANGUAGE_MAP.get(target_upper, target_upper)
+
+        # Validate target language is supported
+        # Log warning if language not in our mapping (might still work)
+        if target not in DEEPL_LANGUAGE_MAP.values():
+            logger.warning(
+                f"Language code '{target_lang}' not in DeepL map, "
+                f"using as-is. Translation may fail if unsupported."
+            )
+
+        return source, target
+
     def translate_text(
         self,
         text: str,
@@ -229,15 +311,15 @@ class DeepLTranslator:
 
         Examples:
             # Basic translation
-            result = await translate_text("Hello", "auto", "ES")
+            result = translate_text("Hello", "auto", "ES")
             # Returns: "Hola"
 
             # With language detection
-            result = await translate_text("Bonjour", "auto", "EN-US")
+            result = translate_text("Bonjour", "auto", "EN-US")
             # Returns: "Hello" (American English)
 
             # HTML preservation
-            result = await translate_text("<p>Hello</p>", "EN", "ES")
+            result = translate_text("<p>Hello</p>", "EN", "ES")
             # Returns: "<p>Hola</p>"
 
         Error Handling:
@@ -251,39 +333,20 @@ class DeepLTranslator:
             - Timeout: Managed by DeepL client (default: 30s)
 
         Notes:
-            - Function is async for consistency, but DeepL client is synchronous
+            - Blocking (synchronous DeepL client); use translate_text_async from async code
             - Language codes are case-insensitive (converted to uppercase)
             - HTML tags are preserved in translation
             - Whitespace and formatting are preserved
         """
-        try:
-            # ================================================================
-            # Step 1: Process Source Language
-            # ================================================================
-            # Convert source language to uppercase for mapping
-            # Special case: 'auto' means automatic language detection
-            if source_lang != 'auto':
-                source = source_lang.upper()
-            else:
-                source = None  # DeepL API uses None for auto-detection
+        if not self.breaker.allow_request():
+            logger.warning("DeepL circuit open, skipping request")
+            return None
 
+        try:
             # ================================================================
-            # Step 2: Map Target Language to DeepL Format
+            # Step 1-2: Map Source/Target Languages to DeepL Format
             # ================================================================
-            # Convert target language to uppercase
-            target_upper = target_lang.upper()
-
-            # Map to DeepL API v2 format using our mapping dictionary
-            # If language is not in map, use it as-is (for future languages)
-            target = DEEPL_LANGUAGE_MAP.get(target_upper, target_upper)
-
-            # Validate target language is supported
-            # Log warning if language not in our mapping (might still work)
-            if target not in DEEPL_LANGUAGE_MAP.values():
-                logger.warning(
-                    f"Language code '{target_lang}' not in DeepL map, "
-                    f"using as-is. Translation may fail if unsupported."
-                )
+            source, target = self._map_languages(source_lang, target_lang)
 
             # ================================================================
             # Step 3: Log Translation Request
@@ -298,11 +361,15 @@ class DeepLTranslator:
             # ================================================================
             # Make synchronous API call to DeepL
             # This is the actual translation request
-            result = self.translator.translate_text(
+            # Retried with backoff on 429/5xx/network errors
+            start = time.perf_counter()
+            result = self.rate_controller.call(
+                self.translator.translate_text,
                 text,
                 source_lang=source,    # None for auto-detection, or language code
                 target_lang=target     # Mapped target language (e.g., 'EN-US')
             )
+            self.breaker.record_success(time.perf_counter() - start)
 
             # ================================================================
             # Step 5: Log Success and Return
@@ -323,6 +390,7 @@ class DeepLTranslator:
             # - AuthorizationException: Invalid API key
             # - TooManyRequestsException: Rate limit exceeded
             logger.error(f"DeepL API error: {e}")
+            self._record_outcome(e)
             return None
 
         except Exception as e:
@@ -330,8 +398,331 @@ class DeepLTranslator:
             # Generic Errors (Network, Timeout, etc.)
             # ================================================================
             logger.error(f"DeepL translation failed: {e}")
+            self._record_outcome(e)
             return None
 
+        except BaseException:
+            # Interrupted before DeepL answered: free a half-open probe slot
+            self.breaker.record_abandoned()
+            raise
+
+    def _record_outcome(self, error: Exception) -> None:
+        """
+        Feed a failed request into the circuit breaker
+
+        Errors caused by the request itself (400 Bad Request, 413) prove
+        DeepL is reachable and count as a success for the breaker; anything
+        else (throttling after retries, 5xx, network, quota, auth,
+        unrecognized errors) counts as a provider failure.
+        """
+        if classify_error(error) == 'invalid':
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate many texts with as few DeepL API requests as possible
+
+        Texts are packed into requests of up to DEEPL_MAX_TEXTS_PER_REQUEST
+        strings and DEEPL_MAX_REQUEST_BYTES of UTF-8 payload. A failing
+        request only fails the texts it carried; the other chunks are still
+        translated.
+
+        Args:
+            texts (List[str]): Texts to translate (must be non-empty strings)
+            source_lang (str): Source language code or 'auto'
+            target_lang (str): Target language code
+            tag_handling (Optional[str]): 'html' or 'xml' when the texts are
+                markup fragments (DeepL keeps the tags in place), None for
+                plain text
+
+        Returns:
+            List[Dict[str, Any]]: One result per input text, in input order:
+                {
+                    'text': translated text or None,
+                    'success': True | False,
+                    'error': error message (only if success=False),
+                    'retryable': True if the failure was transient (429, 5xx,
+                                 network) after all retries (only if success=False)
+                }
+
+        Examples:
+            results = translator.translate_batch(["Hello", "Goodbye"], "en", "es")
+            # [{'text': 'Hola', 'success': True}, {'text': 'Adiós', 'success': True}]
+
+        Performance:
+            - 1 round trip per 50 texts instead of 1 per text
+            - A 2,000 element site goes from ~2,000 requests to ~40
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+
+        if not texts:
+            return []
+
+        source, target = self._map_languages(source_lang, target_lang)
+
+        for chunk in self._chunk_indices(texts):
+            self._translate_chunk(texts, chunk, source, target, results, tag_handling)
+
+        return results
+
+    def _translate_chunk(
+        self,
+        texts: List[str],
+        chunk: List[int],
+        source: Optional[str],
+        target: str,
+        results: List[Optional[Dict[str, Any]]],
+        tag_handling: Optional[str] = None
+    ) -> None:
+        """
+        Translate one request worth of texts, writing into `results`
+
+        Throttling, server and network errors are retried by the rate
+        controller. If DeepL rejects the request for a reason that may be
+        caused by a single text (400 Bad Request, 413 Payload Too Large), the
+        chunk is split in half and retried so only the offending text is
+        reported as failed.
+        Account level errors (quota, auth) and exhausted retries fail the
+        whole chunk. While the circuit breaker is open the chunk fails
+        immediately (retryable) without calling DeepL.
+        """
+        if self._reject_if_open(chunk, results):
+            return
+
+        chunk_texts = [texts[i] for i in chunk]
+
+        logger.info(
+            f"DeepL batch translating: {source or 'auto'} -> {target} "
+            f"({len(chunk_texts)} texts, {sum(len(t) for t in chunk_texts)} chars)"
+        )
+
+        start = time.perf_counter()
+
+        try:
+            translated = self.rate_controller.call(
+                self.translator.translate_text,
+                chunk_texts,
+                source_lang=source,
+                target_lang=target,
+                tag_handling=tag_handling
+            )
+            self.breaker.record_success(time.perf_counter() - start)
+
+            for index, result in zip(chunk, translated):
+                results[index] = {'text': result.text, 'success': True}
+            return
+
+        except deepl.DeepLException as e:
+            kind = classify_error(e)
+            self._record_outcome(e)
+
+            if kind == 'invalid' and len(chunk) > 1:
+                # Isolate the text(s) DeepL rejected
+                logger.warning(f"DeepL rejected batch of {len(chunk)} texts, splitting: {e}")
+                middle = len(chunk) // 2
+                self._translate_chunk(texts, chunk[:middle], source, target, results, tag_handling)
+                self._translate_chunk(texts, chunk[middle:], source, target, results, tag_handling)
+                return
+
+            logger.error(f"DeepL API error ({len(chunk)} texts, {kind}): {e}")
+            error = str(e)
+
+        except Exception as e:
+            logger.error(f"DeepL batch translation failed ({len(chunk)} texts): {e}")
+            error = str(e)
+            kind = classify_error(e)
+            self._record_outcome(e)
+
+        except BaseException:
+            # Interrupted before DeepL answered: free a half-open probe slot
+            self.breaker.record_abandoned()
+            raise
+
+        for index in chunk:
+            results[index] = {
+                'text': None,
+                'success': False,
+                'error': error,
+                'retryable': kind in TRANSIENT_ERRORS
+            }
+
+    def _reject_if_open(self, chunk: List[int], results: List[Optional[Dict[str, Any]]]) -> bool:
+        """Fail a chunk without a request if the circuit breaker is open"""
+        if self.breaker.allow_request():
+            return False
+
+        logger.warning(f"DeepL circuit {self.breaker.state}, skipping {len(chunk)} texts")
+        for index in chunk:
+            results[index] = {
+                'text': None,
+                'success': False,
+                'error': 'DeepL temporarily unavailable (circuit open)',
+                'retryable': True
+            }
+        return True
+
+    def _chunk_indices(self, texts: List[str]) -> Iterator[List[int]]:
+        """
+        Split text indices into chunks that respect DeepL request limits
+
+        A text that alone exceeds DEEPL_MAX_REQUEST_BYTES is sent in a chunk
+        of its own so DeepL can reject it without failing its neighbours.
+
+        Args:
+            texts (List[str]): Texts to pack
+
+        Yields:
+            List[int]: Indices into `texts` for one API request
+        """
+        chunk: List[int] = []
+        chunk_bytes = 0
+
+        for index, text in enumerate(texts):
+            text_bytes = len(text.encode('utf-8'))
+
+            if chunk and (
+                len(chunk) >= DEEPL_MAX_TEXTS_PER_REQUEST or
+                chunk_bytes + text_bytes > DEEPL_MAX_REQUEST_BYTES
+            ):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+
+            chunk.append(index)
+            chunk_bytes += text_bytes
+
+        if chunk:
+            yield chunk
+
+    async def translate_text_async(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> Optional[str]:
+        """
+        Async variant of translate_text() that does not block the event loop
+
+        Uses the shared connection-pooled AsyncDeepLClient instead of the
+        synchronous deepl.Translator. Same arguments and return value as
+        translate_text().
+        """
+        result = (await self.translate_batch_async([text], source_lang, target_lang))[0]
+        return result['text'] if result['success'] else None
+
+    async def translate_batch_async(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of translate_batch()
+
+        Chunks are sent concurrently; the number of requests in flight is
+        bounded by the async client (DEEPL_MAX_CONCURRENT_REQUESTS) and
+        adapted to DeepL throttling by the rate controller.
+
+        Returns:
+            List[Dict[str, Any]]: Same format as translate_batch()
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+
+        if not texts:
+            return []
+
+        source, target = self._map_languages(source_lang, target_lang)
+
+        await asyncio.gather(*(
+            self._translate_chunk_async(texts, chunk, source, target, results, tag_handling)
+            for chunk in self._chunk_indices(texts)
+        ))
+
+        return results
+
+    async def _translate_chunk_async(
+        self,
+        texts: List[str],
+        chunk: List[int],
+        source: Optional[str],
+        target: str,
+        results: List[Optional[Dict[str, Any]]],
+        tag_handling: Optional[str] = None
+    ) -> None:
+        """Async variant of _translate_chunk() (same bisection and breaker rules)"""
+        if self._reject_if_open(chunk, results):
+            return
+
+        chunk_texts = [texts[i] for i in chunk]
+
+        logger.info(
+            f"DeepL async batch translating: {source or 'auto'} -> {target} "
+            f"({len(chunk_texts)} texts, {sum(len(t) for t in chunk_texts)} chars)"
+        )
+
+        start = time.perf_counter()
+
+        try:
+            translated = await self.rate_controller.call_async(
+                self.async_client.translate,
+                chunk_texts,
+                target_lang=target,
+                source_lang=source,
+                tag_handling=tag_handling
+            )
+            self.breaker.record_success(time.perf_counter() - start)
+
+            for index, text in zip(chunk, translated):
+                results[index] = {'text': text, 'success': True}
+            return
+
+        except DeepLAPIError as e:
+            kind = classify_error(e)
+            self._record_outcome(e)
+
+            if kind == 'invalid' and len(chunk) > 1:
+                # Isolate the text(s) DeepL rejected
+                logger.warning(f"DeepL rejected batch of {len(chunk)} texts, splitting: {e}")
+                middle = len(chunk) // 2
+                await asyncio.gather(
+                    self._translate_chunk_async(texts, chunk[:middle], source, target, results, tag_handling),
+                    self._translate_chunk_async(texts, chunk[middle:], source, target, results, tag_handling)
+                )
+                return
+
+            logger.error(f"DeepL API error ({len(chunk)} texts, {kind}): {e}")
+            error = str(e)
+
+        except Exception as e:
+            logger.error(f"DeepL async batch translation failed ({len(chunk)} texts): {e}")
+            error = str(e)
+            kind = classify_error(e)
+            self._record_outcome(e)
+
+        except BaseException:
+            # Cancelled (e.g. request timeout) before DeepL answered: without
+            # this a half-open probe slot stays taken and the circuit never
+            # leaves half-open
+            self.breaker.record_abandoned()
+            raise
+
+        for index in chunk:
+            results[index] = {
+                'text': None,
+                'success': False,
+                'error': error,
+                'retryable': kind in TRANSIENT_ERRORS
+            }
+
     def get_usage(self) -> dict:
         """
         Get current DeepL API usage statistics
@@ -433,7 +824,8 @@ class DeepLTranslator:
         Performance:
             - Latency: ~50-100ms (makes API call)
             - Should not be called on every translation request
-            - Consider caching result for 5-10 minutes
+            - For cached health use self.breaker.get_status() (no API call);
+              the result of this probe is fed into the breaker
 
         Error Handling:
             Returns False on any error (API error, network error, etc.)
@@ -445,10 +837,13 @@ class DeepLTranslator:
         try:
             # Attempt to get usage statistics
             # If this succeeds, API is available
+            start = time.perf_counter()
             self.translator.get_usage()
+            self.breaker.record_success(time.perf_counter() - start)
             return True
 
         except Exception as e:
             # Log failure and return False
             logger.error(f"DeepL availability check failed: {e}")
+            self.breaker.record_failure()
             return False
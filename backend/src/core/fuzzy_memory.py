@@ -0,0 +1,449 @@
+"""
+TranslateCloud - Fuzzy Translation Memory Index
+
+Reuses translations of near-duplicate segments. Marketing sites repeat
+sentences that only differ by a number or a product name:
+
+    TM:     "Save 10% today"  ->  "Ahorra un 10% hoy"
+    Query:  "Save 20% today"  ->  "Ahorra un 20% hoy"   (no DeepL call)
+
+Pipeline (per language pair, in memory):
+    1. Candidate retrieval: MinHash signatures over character trigrams,
+       banded LSH buckets (no full scan)
+    2. Verification: difflib character similarity >= FUZZY_MATCH_THRESHOLD
+    3. Span substitution: the differing word spans must be *replacements*
+       (no insertions/deletions) of tokens DeepL copies verbatim - numbers,
+       placeholders, symbols and proper nouns (capitalized mid-sentence or
+       with inner capitals: "NovaDesk", "iPhone", "CRM") - and each replaced
+       source span must appear exactly once, as a whole word, in the stored
+       translation. Translated words ("today" -> "hoy") are rejected, as
+       are common words that happen to exist in the target language too
+       ("a", "no", "me"): the candidate is rejected rather than returning a
+       wrong translation.
+
+Segments are normalized with PlaceholderProtector.normalize_segment(), the
+same form the exact-match translation memory stores, so the index can be
+preloaded straight from the `translation_memory` table.
+
+Usage:
+    >>> index = FuzzyMatchIndex(threshold=0.85)
+    >>> index.add_many([("Save 10% today", "Ahorra un 10% hoy")], "en", "es")
+    >>> index.lookup_many(["Save 20% today"], "en", "es")
+    {0: 'Ahorra un 20% hoy'}
+
+Benchmark:
+    python -m benchmarks.fuzzy_memory
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import difflib
+import hashlib
+import logging
+import random
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config.settings import settings
+from src.core.placeholder_protector import PlaceholderProtector
+from src.core.translation_memory import get_translation_memory
+
+logger = logging.getLogger(__name__)
+
+# Word, canonical placeholder (__PH0__) or single punctuation character
+_TOKEN_PATTERN = re.compile(r'__PH\d+__|\w+|[^\w\s]')
+_PLACEHOLDER_PATTERN = re.compile(r'__PH\d+__')
+
+# Tokens after which a capitalized word may just start a sentence
+_SENTENCE_BREAKS = frozenset({'.', '!', '?', ':', ';'})
+
+# Loads (normalized_source, canonical_translation) pairs for a language pair
+EntryLoader = Callable[[str, str, int], List[Tuple[str, str]]]
+
+
+class _PairIndex:
+    """LSH buckets and entries for one (source_lang, target_lang) pair"""
+
+    def __init__(self):
+        self.entries: "OrderedDict[int, Tuple[str, str, tuple]]" = OrderedDict()
+        self.ids_by_segment: Dict[str, int] = {}
+        self.buckets: Dict[Tuple[int, tuple], set] = defaultdict(set)
+        self.next_id = 0
+
+
+class FuzzyMatchIndex:
+    """
+    In-memory near-duplicate index over translation memory segments
+
+    Entries per language pair are bounded by max_entries (oldest first out).
+    Thread-safe: the async service path calls it from worker threads.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        max_entries: int = 20000,
+        num_perm: int = 16,
+        bands: int = 8,
+        max_candidates: int = 8,
+        min_length: int = 8,
+        loader: Optional[EntryLoader] = None,
+        preload_limit: int = 5000
+    ):
+        """
+        Args:
+            threshold: Minimum character similarity (0-1) to reuse a translation
+            max_entries: Maximum indexed segments per language pair
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm / bands rows each). 8 bands of 2 rows
+                   retrieve ~97% of pairs with trigram Jaccard >= 0.6
+            max_candidates: Candidates verified per lookup (most band collisions first)
+            min_length: Shorter segments are not fuzzy-matched ("Home" vs "Hope")
+            loader: Called once per language pair to preload entries
+            preload_limit: Maximum entries requested from the loader
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_candidates = max_candidates
+        self.min_length = min_length
+        self.loader = loader
+        self.preload_limit = preload_limit
+
+        # Fixed seed plus a deterministic shingle hash (see _signature):
+        # signatures, and so benchmark runs, do not depend on PYTHONHASHSEED
+        rng = random.Random(0x7C10D)
+        self._masks = [rng.getrandbits(64) for _ in range(num_perm)]
+
+        self._pairs: Dict[Tuple[str, str], _PairIndex] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'lookups': 0,
+            'hits': 0,
+            'rejected': 0,
+            'characters_saved': 0
+        }
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def add_many(self, entries: List[Tuple[str, str]], source_lang: str, target_lang: str) -> int:
+        """
+        Index (source, translation) pairs
+
+        Args:
+            entries: (source_text, translated_text) pairs, raw or protected
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            int: Number of entries indexed
+        """
+        prepared = []
+        for source_text, translated_text in entries:
+            segment, tokens = PlaceholderProtector.normalize_segment(source_text)
+            if len(segment) >= self.min_length and translated_text:
+                prepared.append((
+                    segment,
+                    PlaceholderProtector.canonicalize_tokens(translated_text, tokens),
+                    self._signature(segment)
+                ))
+
+        if not prepared:
+            return 0
+
+        pair = self._get_pair(source_lang, target_lang)
+        with self._lock:
+            for segment, translation, signature in prepared:
+                self._insert(pair, segment, translation, signature)
+
+        return len(prepared)
+
+    def lookup_many(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> Dict[int, str]:
+        """
+        Find near-duplicate segments and adapt their translations
+
+        Returns:
+            Dict[int, str]: Index into `texts` -> adapted translation, with
+                            placeholder tokens mapped back to this call's tokens
+        """
+        pair = self._get_pair(source_lang, target_lang)
+        found: Dict[int, str] = {}
+        rejected = 0
+
+        for index, text in enumerate(texts):
+            segment, tokens = PlaceholderProtector.normalize_segment(text)
+            if len(segment) < self.min_length:
+                continue
+
+            signature = self._signature(segment)
+            with self._lock:
+                candidates = self._candidates(pair, segment, signature)
+
+            for candidate_segment, candidate_translation in candidates:
+                translation = self._adapt(segment, candidate_segment, candidate_translation)
+                if translation is not None:
+                    found[index] = PlaceholderProtector.denormalize_tokens(translation, tokens)
+                    break
+            else:
+                if candidates:
+                    rejected += 1
+
+        with self._lock:
+            self._stats['lookups'] += len(texts)
+            self._stats['hits'] += len(found)
+            self._stats['rejected'] += rejected
+            self._stats['characters_saved'] += sum(len(texts[index]) for index in found)
+
+        return found
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Cumulative statistics for this index
+
+        Returns:
+            dict: lookups, hits, hit_rate, rejected (similar candidates whose
+                  differences could not be substituted safely),
+                  characters_saved, entries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = sum(len(pair.entries) for pair in self._pairs.values())
+
+        stats['hit_rate'] = round(stats['hits'] / stats['lookups'], 4) if stats['lookups'] else 0.0
+        return stats
+
+    # ========================================================================
+    # Index Maintenance
+    # ========================================================================
+
+    def _get_pair(self, source_lang: str, target_lang: str) -> _PairIndex:
+        """Return the index for a language pair, preloading it on first use"""
+        key = (source_lang.lower(), target_lang.lower())
+
+        with self._lock:
+            pair = self._pairs.get(key)
+            if pair is not None:
+                return pair
+            pair = self._pairs[key] = _PairIndex()
+
+        if self.loader:
+            try:
+                loaded = self.loader(key[0], key[1], self.preload_limit)
+            except Exception as e:
+                logger.warning(f"Fuzzy index preload failed for {key[0]}->{key[1]}: {e}")
+                loaded = []
+
+            # Loader rows are already normalized (translation_memory.source_text)
+            prepared = [
+                (segment, translation, self._signature(segment))
+                for segment, translation in loaded
+                if len(segment) >= self.min_length and translation
+            ]
+            with self._lock:
+                for segment, translation, signature in prepared:
+                    self._insert(pair, segment, translation, signature)
+
+            logger.info(f"Fuzzy index preloaded {len(prepared)} segments for {key[0]}->{key[1]}")
+
+        return pair
+
+    def _insert(self, pair: _PairIndex, segment: str, translation: str, signature: tuple):
+        """Add or replace one entry (lock held)"""
+        if segment in pair.ids_by_segment:
+            self._remove(pair, pair.ids_by_segment[segment])
+
+        entry_id = pair.next_id
+        pair.next_id += 1
+        pair.entries[entry_id] = (segment, translation, signature)
+        pair.ids_by_segment[segment] = entry_id
+
+        for band in self._bands(signature):
+            pair.buckets[band].add(entry_id)
+
+        while len(pair.entries) > self.max_entries:
+            self._remove(pair, next(iter(pair.entries)))
+
+    def _remove(self, pair: _PairIndex, entry_id: int):
+        """Drop one entry from the entries and its buckets (lock held)"""
+        segment, _, signature = pair.entries.pop(entry_id)
+        pair.ids_by_segment.pop(segment, None)
+
+        for band in self._bands(signature):
+            bucket = pair.buckets.get(band)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del pair.buckets[band]
+
+    # ========================================================================
+    # Matching
+    # ========================================================================
+
+    def _signature(self, segment: str) -> tuple:
+        """MinHash signature over lowercase character trigrams"""
+        text = segment.lower()
+        # Built-in hash() of str is salted per process; blake2b is not
+        hashes = {
+            int.from_bytes(hashlib.blake2b(text[i:i + 3].encode('utf-8'), digest_size=8).digest(), 'little')
+            for i in range(max(1, len(text) - 2))
+        }
+        return tuple(min(h ^ mask for h in hashes) for mask in self._masks)
+
+    def _bands(self, signature: tuple):
+        """LSH bucket keys of a signature"""
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def _candidates(self, pair: _PairIndex, segment: str, signature: tuple) -> List[Tuple[str, str]]:
+        """
+        Entries sharing at least one LSH bucket that pass the similarity
+        threshold, best first (lock held)
+        """
+        collisions: Dict[int, int] = defaultdict(int)
+        for band in self._bands(signature):
+            for entry_id in pair.buckets.get(band, ()):
+                collisions[entry_id] += 1
+
+        ranked = sorted(collisions, key=collisions.get, reverse=True)[:self.max_candidates]
+        scored = []
+
+        for entry_id in ranked:
+            candidate_segment, candidate_translation, _ = pair.entries[entry_id]
+            if candidate_segment == segment:
+                # Exact matches are served by the cache/translation memory
+                continue
+
+            matcher = difflib.SequenceMatcher(None, segment, candidate_segment, autojunk=False)
+            if matcher.real_quick_ratio() < self.threshold or matcher.quick_ratio() < self.threshold:
+                continue
+
+            ratio = matcher.ratio()
+            if ratio >= self.threshold:
+                scored.append((ratio, candidate_segment, candidate_translation))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [(candidate_segment, translation) for _, candidate_segment, translation in scored]
+
+    @staticmethod
+    def _adapt(segment: str, candidate_segment: str, candidate_translation: str) -> Optional[str]:
+        """
+        Rewrite a candidate's translation for `segment` by substituting the
+        differing spans, or None if that cannot be done safely
+        """
+        new_tokens = list(_TOKEN_PATTERN.finditer(segment))
+        old_tokens = list(_TOKEN_PATTERN.finditer(candidate_segment))
+
+        matcher = difflib.SequenceMatcher(
+            None,
+            [match.group(0) for match in old_tokens],
+            [match.group(0) for match in new_tokens],
+            autojunk=False
+        )
+
+        replacements = []
+        for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            if tag != 'replace':
+                # Inserted/deleted words change the sentence structure
+                return None
+
+            if not (
+                all(_is_verbatim(old_tokens, position) for position in range(old_start, old_end)) and
+                all(_is_verbatim(new_tokens, position) for position in range(new_start, new_end))
+            ):
+                # A translatable word changed: its translation is unknown
+                return None
+
+            old_span = candidate_segment[old_tokens[old_start].start():old_tokens[old_end - 1].end()]
+            new_span = segment[new_tokens[new_start].start():new_tokens[new_end - 1].end()]
+
+            occurrences = [
+                match.span() for match in
+                re.finditer(rf'(?<!\w){re.escape(old_span)}(?!\w)', candidate_translation)
+            ]
+            if len(occurrences) != 1:
+                # Span was translated (or is ambiguous) - cannot map it
+                return None
+
+            replacements.append((occurrences[0], new_span))
+
+        if not replacements:
+            return None
+
+        replacements.sort()
+        adapted = []
+        position = 0
+        for (start, end), new_span in replacements:
+            if start < position:
+                return None
+            adapted.append(candidate_translation[position:start])
+            adapted.append(new_span)
+            position = end
+        adapted.append(candidate_translation[position:])
+
+        return ''.join(adapted)
+
+
+def _is_verbatim(tokens: List[re.Match], position: int) -> bool:
+    """
+    Whether a token is one DeepL keeps as is: a number, placeholder or
+    symbol, or a proper noun (inner capitals, or capitalized anywhere but
+    at the start of a sentence)
+    """
+    token = tokens[position].group(0)
+
+    if _PLACEHOLDER_PATTERN.fullmatch(token):
+        return True
+    if any(character.isdigit() for character in token) or not any(character.isalpha() for character in token):
+        return True
+    if any(character.isupper() for character in token[1:]):
+        return True
+
+    sentence_start = position == 0 or tokens[position - 1].group(0) in _SENTENCE_BREAKS
+    return token[0].isupper() and not sentence_start
+
+
+# ============================================================================
+# Shared Instance
+# ============================================================================
+
+_fuzzy_index: Optional[FuzzyMatchIndex] = None
+
+
+def get_fuzzy_index() -> Optional[FuzzyMatchIndex]:
+    """
+    Get the shared fuzzy index, or None if FUZZY_MATCH_ENABLED is false
+
+    When the translation memory is available each language pair is
+    preloaded with its most recently used TM segments.
+    """
+    global _fuzzy_index
+
+    if not settings.FUZZY_MATCH_ENABLED:
+        return None
+
+    if _fuzzy_index is None:
+        memory = get_translation_memory()
+        _fuzzy_index = FuzzyMatchIndex(
+            threshold=settings.FUZZY_MATCH_THRESHOLD,
+            max_entries=settings.FUZZY_MATCH_MAX_ENTRIES,
+            loader=memory.recent_entries if memory else None,
+            preload_limit=settings.FUZZY_MATCH_PRELOAD_LIMIT
+        )
+
+    return _fuzzy_index
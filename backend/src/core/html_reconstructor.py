@@ -3,10 +3,12 @@ TranslateCloud - HTML Reconstructor
 Reconstruye HTML traducido manteniendo estructura original
 """
 
-from bs4 import BeautifulSoup
-from typing import Dict, List
+from bs4 import BeautifulSoup, Tag
+from typing import Dict, List, Optional
 import logging
 
+from src.core.page_parser import ElementPathIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,14 +40,20 @@ class HTMLReconstructor:
         """
         try:
             soup = BeautifulSoup(original_html, self.parser)
+
+            # Índice XPath -> elemento, un solo recorrido del árbol original
+            paths = ElementPathIndex(soup)
             
             # Actualizar lang attribute
             if soup.html:
                 soup.html['lang'] = target_lang
             
-            # Aplicar traducciones a cada elemento
-            for element in translated_elements:
-                self._apply_translation(soup, element)
+            # Aplicar traducciones a cada elemento: primero los fragmentos,
+            # que sustituyen el contenido de su bloque; después el resto
+            # (alt de <img> dentro de un fragmento se busca en el bloque ya
+            # sustituido, ver _locate)
+            for element in sorted(translated_elements, key=lambda element: 'html' not in element):
+                self._apply_translation(soup, element, paths)
             
             # Actualizar meta tags
             self._update_meta_tags(soup, translated_elements)
@@ -59,40 +67,81 @@ class HTMLReconstructor:
             logger.error(f'Error reconstructing HTML: {str(e)}')
             return original_html
     
-    def _apply_translation(self, soup: BeautifulSoup, element: Dict):
+    def _apply_translation(self, soup: BeautifulSoup, element: Dict, paths: Optional[ElementPathIndex] = None):
         """
         Aplica traducción a un elemento específico usando XPath
+
+        Solo se modifica el elemento extraído (antes, tag + atributos
+        coincidían con todos los <p> sin atributos de la página).
         """
         try:
-            xpath = element.get('xpath', '')
             translated_text = element.get('translated_text', '')
             tag_name = element.get('tag', '')
             
             if not translated_text:
                 return
+
+            target = self._locate(soup, element, paths or ElementPathIndex(soup))
+
+            if target is None:
+                logger.warning(f"Could not locate element {element.get('xpath')}")
+                return
             
+            # Fragmentos HTML: sustituir el contenido conservando el marcado
+            if 'html' in element:
+                self._apply_fragment(target, element)
+
             # Para imágenes, actualizar alt text
-            if tag_name == 'img':
-                img_elements = soup.find_all('img', attrs=element.get('attrs', {}))
-                for img in img_elements:
-                    img['alt'] = translated_text
+            elif tag_name == 'img':
+                target['alt'] = translated_text
             
             # Para otros elementos, reemplazar contenido de texto
-            else:
-                # Buscar elemento por atributos originales
-                elements = soup.find_all(
-                    tag_name,
-                    attrs=element.get('attrs', {})
-                )
-                
-                for elem in elements:
-                    # Preservar tags hijos (como <strong>, <em>, etc)
-                    if elem.string:
-                        elem.string.replace_with(translated_text)
+            # Preservar tags hijos (como <strong>, <em>, etc)
+            elif target.string:
+                target.string.replace_with(translated_text)
                     
         except Exception as e:
             logger.warning(f'Could not apply translation to element: {str(e)}')
+
+    def _locate(self, soup: BeautifulSoup, element: Dict, paths: ElementPathIndex) -> Optional[Tag]:
+        """
+        Elemento de la página: por XPath en el índice; si el árbol difiere
+        (HTML de otro parser, elementos sin XPath) o el elemento quedó fuera
+        del árbol al sustituir un fragmento, por tag + atributos + texto
+        original
+        """
+        tag_name = element.get('tag')
+        target = paths.find(element.get('xpath', ''))
+
+        if target is not None and target.name == tag_name and self._attached(soup, target):
+            return target
+
+        return next(
+            (
+                candidate for candidate in soup.find_all(tag_name, attrs=element.get('attrs', {}))
+                if tag_name == 'img' or candidate.get_text(strip=True) == element.get('text')
+            ),
+            None
+        )
     
+    @staticmethod
+    def _attached(soup: BeautifulSoup, tag: Tag) -> bool:
+        """Si el tag sigue en el árbol (clear() de su bloque lo desprende)"""
+        return any(parent is soup for parent in tag.parents)
+
+    def _apply_fragment(self, target: Tag, element: Dict):
+        """
+        Sustituye el HTML interno de un bloque por su traducción
+
+        El fragmento traducido (DeepL tag_handling='html') conserva los tags
+        inline del original (<a href>, <b>, <em>), así que se parsea y se
+        inserta como hijos del bloque.
+        """
+        fragment = BeautifulSoup(element['translated_text'], 'html.parser')
+        target.clear()
+        for child in list(fragment.contents):
+            target.append(child)
+
     def _update_meta_tags(self, soup: BeautifulSoup, translated_elements: List[Dict]):
         """
         Actualiza meta tags con contenido traducido
@@ -22,6 +22,7 @@ import json
 import logging
 from typing import Optional, List
 from datetime import datetime, timedelta
+from decimal import Decimal
 from botocore.exceptions import ClientError
 
 from src.schemas.job import DynamoDBJob, JobStatus
@@ -153,7 +154,9 @@ def update_job_status(
     message: Optional[str] = None,
     error_message: Optional[str] = None,
     result_url: Optional[str] = None,
-    download_url: Optional[str] = None
+    download_url: Optional[str] = None,
+    segments_total: Optional[int] = None,
+    segments_unique: Optional[int] = None
 ) -> bool:
     """
     Update job status and progress in DynamoDB
@@ -170,6 +173,9 @@ def update_job_status(
         error_message (str, optional): Error details if failed
         result_url (str, optional): S3 URL of translated site (when completed)
         download_url (str, optional): Presigned URL for downloading result (expires in 7 days)
+        segments_total (int, optional): Text segments extracted from all pages
+        segments_unique (int, optional): Distinct segments actually translated
+            (dedup_ratio = 1 - unique/total is stored alongside)
 
     Returns:
         bool: True if update succeeded, False otherwise
@@ -232,6 +238,16 @@ def update_job_status(
             update_expr += ", download_url = :download_url"
             expr_attr_values[':download_url'] = download_url
 
+        if segments_total is not None and segments_unique is not None:
+            update_expr += ", segments_total = :segments_total, segments_unique = :segments_unique"
+            update_expr += ", dedup_ratio = :dedup_ratio"
+            expr_attr_values[':segments_total'] = segments_total
+            expr_attr_values[':segments_unique'] = segments_unique
+            # DynamoDB rejects Python floats
+            expr_attr_values[':dedup_ratio'] = Decimal(
+                str(round(1 - segments_unique / segments_total, 4)) if segments_total else '0'
+            )
+
         # Set timestamp for status transitions
         if status == JobStatus.PROCESSING:
             update_expr += ", started_at = :started_at"
@@ -3,23 +3,70 @@ TranslateCloud - MarianMT Translation Engine
 Core translation module using Helsinki-NLP models
 """
 
+import os
+import re
+import threading
 import torch
 from transformers import MarianMTModel, MarianTokenizer
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+from src.config.settings import settings
+from src.core.model_cache import ModelCache
+from src.core.model_store import ModelStore
+from src.core.segmenter import SentenceSegmenter
+
 logger = logging.getLogger(__name__)
 
+# Presupuesto de tokens por lote de generate() (padding incluido)
+MEMORY_FRACTION = 0.25  # Parte de la memoria libre que puede usar un lote
+BYTES_PER_TOKEN = 1024 * 1024  # Coste estimado por token (activaciones + beam search)
+DEFAULT_TOKEN_BUDGET = 4096  # Si no se puede medir la memoria libre
+MIN_TOKEN_BUDGET = 512  # Siempre cabe al menos un texto de longitud máxima
+MAX_TOKEN_BUDGET = 32768
+
+# Tokens reservados por trozo de un texto largo (</s> y diferencias de
+# tokenización al unir frases)
+CHUNK_MARGIN_TOKENS = 8
+
 
 class MarianTranslator:
     """
     Gestor principal de traducción usando modelos MarianMT
     """
     
-    def __init__(self):
-        self.models: Dict[str, MarianMTModel] = {}
-        self.tokenizers: Dict[str, MarianTokenizer] = {}
+    def __init__(
+        self,
+        cache_mb: Optional[int] = None,
+        pinned_pairs: Optional[List[str]] = None,
+        quantize: Optional[bool] = None
+    ):
+        """
+        Args:
+            cache_mb: Memoria máxima de los modelos cargados (default: settings.MARIAN_MODEL_CACHE_MB)
+            pinned_pairs: Pares que nunca se descargan, ej. ['en-es']
+                          (default: settings.MARIAN_PINNED_PAIRS)
+            quantize: Cuantizar las capas Linear a int8 al cargar (solo CPU,
+                      default: settings.MARIAN_QUANTIZE)
+        """
         self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self.quantize = (settings.MARIAN_QUANTIZE if quantize is None else quantize) and self.device == 'cpu'
+        self.store = ModelStore()
+        self._budget_scale = 1.0  # Se reduce tras un lote sin memoria
+
+        if pinned_pairs is None:
+            pinned_pairs = [pair.strip() for pair in settings.MARIAN_PINNED_PAIRS.split(',') if pair.strip()]
+
+        # (modelo, tokenizer, bytes) por par, con LRU y presupuesto de memoria
+        self.cache = ModelCache(
+            max_bytes=(cache_mb or settings.MARIAN_MODEL_CACHE_MB) * 1024 * 1024,
+            size_of=lambda entry: entry[2],
+            pinned=pinned_pairs,
+            on_evict=self._on_evict
+        )
+
+        # Textos de más de max_length tokens divididos en trozos
+        self.chunk_stats = {'texts': 0, 'chunks': 0, 'overflow_tokens': 0}
         logger.info(f'MarianTranslator initialized on device: {self.device}')
     
     def load_model(self, source_lang: str, target_lang: str) -> bool:
@@ -33,25 +80,100 @@ class MarianTranslator:
         Returns:
             bool: True si se cargó correctamente
         """
+        return self._get_model(source_lang, target_lang) is not None
+
+    def warm_up(self, pairs: Optional[List[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Carga los pares más usados antes de la primera traducción
+
+        Cada par se carga (caché de modelos) y traduce una frase corta para
+        inicializar los kernels de generate().
+
+        Args:
+            pairs: Pares 'en-es' (default: settings.MARIAN_WARMUP_PAIRS)
+            background: Cargar en un hilo daemon sin bloquear al llamante
+
+        Returns:
+            threading.Thread si background, None si no
+        """
+        if pairs is None:
+            pairs = [pair.strip() for pair in settings.MARIAN_WARMUP_PAIRS.split(',') if pair.strip()]
+
+        def run():
+            for pair in pairs:
+                source_lang, _, target_lang = pair.partition('-')
+                if self.translate_batch(['Hello'], source_lang, target_lang)[0] is None:
+                    logger.warning(f'Warm-up of model {pair} failed')
+            logger.info(f'MarianMT warm-up finished: {", ".join(pairs)}')
+
+        if not pairs:
+            return None
+
+        if not background:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, name='marian-warmup', daemon=True)
+        thread.start()
+        return thread
+
+    def pin(self, source_lang: str, target_lang: str):
+        """Mantiene el modelo del par siempre cargado"""
+        self.cache.pin(f'{source_lang}-{target_lang}')
+
+    def unpin(self, source_lang: str, target_lang: str):
+        """Permite descargar el modelo del par (LRU)"""
+        self.cache.unpin(f'{source_lang}-{target_lang}')
+
+    def get_cache_stats(self) -> Dict:
+        """Métricas de la caché de modelos (cargas, hits, evicciones, memoria)"""
+        return self.cache.get_stats()
+
+    def _get_model(self, source_lang: str, target_lang: str) -> Optional[Tuple[MarianMTModel, MarianTokenizer]]:
+        """
+        Modelo y tokenizer del par desde la caché, cargándolos si hace falta
+
+        Peticiones simultáneas del mismo par esperan a una sola carga.
+        """
         model_key = f'{source_lang}-{target_lang}'
-        
-        if model_key in self.models:
-            logger.info(f'Model {model_key} already loaded')
-            return True
-        
+        entry = self.cache.get(model_key, lambda: self._load(model_key))
+        return (entry[0], entry[1]) if entry else None
+
+    def _load(self, model_key: str) -> Optional[Tuple[MarianMTModel, MarianTokenizer, int]]:
+        """
+        Carga un modelo Helsinki-NLP (None si falla)
+
+        Desde el almacén local (MARIAN_MODEL_DIR, pesos safetensors mapeados
+        en memoria) si el par está preparado; si no, desde el hub.
+        """
+        source = self.store.source(model_key)
+        if source is None:
+            return None
+
         try:
-            model_name = f'Helsinki-NLP/opus-mt-{source_lang}-{target_lang}'
+            model_name, options = source
             
             logger.info(f'Loading model: {model_name}')
-            self.tokenizers[model_key] = MarianTokenizer.from_pretrained(model_name)
-            self.models[model_key] = MarianMTModel.from_pretrained(model_name).to(self.device)
+            tokenizer = MarianTokenizer.from_pretrained(model_name, local_files_only=options.get('local_files_only', False))
+            model = MarianMTModel.from_pretrained(model_name, **options).to(self.device)
+            model.eval()
+
+            if self.quantize:
+                # Cuantización dinámica: pesos int8, activaciones cuantizadas
+                # al vuelo - ~4x menos memoria en las Linear y matmul int8 en CPU
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
             
-            logger.info(f'Model {model_key} loaded successfully')
-            return True
+            logger.info(f'Model {model_key} loaded successfully{" (int8)" if self.quantize else ""}')
+            return model, tokenizer, _model_size(model)
             
         except Exception as e:
             logger.error(f'Error loading model {model_key}: {str(e)}')
-            return False
+            return None
+
+    def _on_evict(self, model_key: str, entry: tuple):
+        """Libera la memoria de GPU de un modelo descargado"""
+        if self.device == 'cuda':
+            torch.cuda.empty_cache()
     
     def translate(
         self,
@@ -72,70 +194,310 @@ class MarianTranslator:
         Returns:
             str: Texto traducido o None si falla
         """
-        model_key = f'{source_lang}-{target_lang}'
-        
-        # Cargar modelo si no está cargado
-        if model_key not in self.models:
-            if not self.load_model(source_lang, target_lang):
-                return None
-        
-        try:
-            # Tokenizar
-            inputs = self.tokenizers[model_key](
-                text,
-                return_tensors='pt',
-                padding=True,
-                truncation=True,
-                max_length=max_length
-            ).to(self.device)
-            
-            # Traducir
-            with torch.no_grad():
-                outputs = self.models[model_key].generate(**inputs)
-            
-            # Decodificar
-            translated = self.tokenizers[model_key].decode(
-                outputs[0],
-                skip_special_tokens=True
-            )
-            
-            return translated
-            
-        except Exception as e:
-            logger.error(f'Translation error: {str(e)}')
-            return None
+        return self.translate_batch([text], source_lang, target_lang, max_length=max_length)[0]
     
     def translate_batch(
         self,
         texts: List[str],
         source_lang: str,
         target_lang: str,
-        batch_size: int = 8
+        batch_size: Optional[int] = None,
+        max_length: int = 512
     ) -> List[Optional[str]]:
         """
-        Traduce múltiples textos en batch para mayor eficiencia
+        Traduce múltiples textos con llamadas generate() por lotes
+
+        Los textos se tokenizan una vez y se ordenan por longitud (length
+        bucketing): cada lote agrupa textos de longitud parecida, así el
+        padding es mínimo. El tamaño de cada lote lo limita un presupuesto
+        de tokens (padding incluido) calculado con la memoria disponible;
+        si un lote se queda sin memoria se divide en dos y el presupuesto
+        se reduce para los siguientes.
         
         Args:
             texts: Lista de textos a traducir
             source_lang: Idioma origen
             target_lang: Idioma destino
-            batch_size: Tamaño del batch
+            batch_size: Máximo de textos por lote (default: settings.MARIAN_MAX_BATCH_SIZE)
+            max_length: Longitud máxima en tokens de cada texto
             
         Returns:
-            List[str]: Lista de textos traducidos
+            List[str]: Textos traducidos en el orden de entrada (None si falla)
         """
-        results = []
-        
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_results = [
-                self.translate(text, source_lang, target_lang)
-                for text in batch
-            ]
-            results.extend(batch_results)
-        
+        results: List[Optional[str]] = [None] * len(texts)
+
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return results
+
+        # Referencias locales: si la caché descarga el modelo mientras se
+        # traduce, este batch termina con él
+        loaded = self._get_model(source_lang, target_lang)
+        if loaded is None:
+            return results
+
+        model, tokenizer = loaded
+
+        try:
+            units, owners = self._prepare_units(tokenizer, texts, indices, source_lang, max_length)
+        except Exception as e:
+            logger.error(f'Tokenization error: {str(e)}')
+            return results
+
+        # (posición en units, input_ids) ordenados por longitud
+        items = sorted(enumerate(units), key=lambda item: len(item[1]))
+        translated: List[Optional[str]] = [None] * len(units)
+
+        for batch in self._plan_batches(items, batch_size or settings.MARIAN_MAX_BATCH_SIZE):
+            for position, text in self._generate(model, tokenizer, batch):
+                translated[position] = text
+
+        # Textos largos: se unen sus trozos con el espaciado original
+        chunks: Dict[int, list] = {}
+        for (index, span), text in zip(owners, translated):
+            if span is None:
+                results[index] = text
+            else:
+                chunks.setdefault(index, []).append((span, text))
+
+        for index, parts in chunks.items():
+            if all(text is not None for _, text in parts):
+                results[index] = SentenceSegmenter.join(
+                    texts[index],
+                    [span for span, _ in parts],
+                    [text for _, text in parts]
+                )
+
         return results
 
+    def _prepare_units(
+        self,
+        tokenizer: MarianTokenizer,
+        texts: List[str],
+        indices: List[int],
+        source_lang: str,
+        max_length: int
+    ) -> Tuple[List[List[int]], List[Tuple[int, Optional[Tuple[int, int]]]]]:
+        """
+        Tokeniza los textos y trocea los que superan max_length tokens
+
+        Antes se truncaban en silencio (truncation=True): el final de los
+        párrafos largos se perdía. Ahora se dividen en trozos que caben en
+        el modelo (ver _chunk_spans), que se traducen en el mismo batch.
+
+        Returns:
+            Tupla (input_ids por unidad, (posición en texts, span del trozo
+            o None si es el texto entero) por unidad)
+        """
+        encoded = tokenizer([texts[i] for i in indices])['input_ids']
+
+        units: List[List[int]] = []
+        owners: List[Tuple[int, Optional[Tuple[int, int]]]] = []
+        chunk_spans: List[Tuple[int, Tuple[int, int]]] = []
+        overflow = 0
+
+        for index, ids in zip(indices, encoded):
+            if len(ids) <= max_length:
+                units.append(ids)
+                owners.append((index, None))
+                continue
+
+            overflow += len(ids) - max_length
+            chunk_spans.extend(
+                (index, span)
+                for span in self._chunk_spans(tokenizer, texts[index], source_lang, max_length)
+            )
+
+        if not chunk_spans:
+            return units, owners
+
+        # truncation: red de seguridad para palabras más largas que max_length
+        chunk_ids = tokenizer(
+            [texts[index][start:end] for index, (start, end) in chunk_spans],
+            truncation=True,
+            max_length=max_length
+        )['input_ids']
+
+        units.extend(chunk_ids)
+        owners.extend(chunk_spans)
+
+        chunked_texts = len({index for index, _ in chunk_spans})
+        self.chunk_stats['texts'] += chunked_texts
+        self.chunk_stats['chunks'] += len(chunk_spans)
+        self.chunk_stats['overflow_tokens'] += overflow
+        logger.info(
+            f'Chunked {chunked_texts} of {len(indices)} texts into {len(chunk_spans)} chunks '
+            f'({overflow} tokens beyond max_length={max_length} would have been truncated)'
+        )
+
+        return units, owners
+
+    @staticmethod
+    def _chunk_spans(
+        tokenizer: MarianTokenizer,
+        text: str,
+        source_lang: str,
+        max_length: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Divide un texto largo en spans de menos de max_length tokens
+
+        Se agrupan frases consecutivas (SentenceSegmenter) mientras quepan;
+        una frase demasiado larga se divide entre palabras.
+        """
+        # </s> final y diferencias de tokenización al unir frases
+        limit = max_length - CHUNK_MARGIN_TOKENS
+
+        sentences = SentenceSegmenter.split(text, source_lang) or [(0, len(text))]
+        pieces: List[Tuple[int, int]] = []
+
+        for start, end in sentences:
+            # Cada token cubre al menos un carácter: una frase corta siempre cabe
+            if end - start > limit and _count_tokens(tokenizer, [text[start:end]])[0] > limit:
+                pieces.extend(
+                    (start + match.start(), start + match.end())
+                    for match in re.finditer(r'\S+', text[start:end])
+                )
+            else:
+                pieces.append((start, end))
+
+        lengths = _count_tokens(tokenizer, [text[start:end] for start, end in pieces])
+        spans: List[Tuple[int, int]] = []
+        current: Optional[List[int]] = None
+        current_tokens = 0
+
+        for (start, end), length in zip(pieces, lengths):
+            if current and current_tokens + length > limit:
+                spans.append((current[0], current[1]))
+                current = None
+
+            if current is None:
+                current, current_tokens = [start, end], 0
+
+            current[1] = end
+            current_tokens += length
+
+        if current:
+            spans.append((current[0], current[1]))
+
+        return spans
+
+    def _plan_batches(self, items: List[Tuple[int, List[int]]], batch_size: int) -> List[list]:
+        """
+        Agrupa items ordenados por longitud respetando el presupuesto de tokens
+
+        Un lote ocupa (número de textos × longitud del más largo) tokens
+        tras el padding.
+        """
+        budget = self._token_budget()
+        batches = []
+        batch: list = []
+
+        for item in items:
+            # items está ordenado: el último añadido es el más largo
+            if batch and ((len(batch) + 1) * len(item[1]) > budget or len(batch) >= batch_size):
+                batches.append(batch)
+                batch = []
+            batch.append(item)
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def _generate(self, model: MarianMTModel, tokenizer: MarianTokenizer, batch: list) -> List[Tuple[int, Optional[str]]]:
+        """
+        Ejecuta generate() para un lote con padding
+
+        Returns:
+            Lista de (posición, traducción o None)
+        """
+        try:
+            inputs = tokenizer.pad(
+                {'input_ids': [ids for _, ids in batch]},
+                padding=True,
+                return_tensors='pt'
+            ).to(self.device)
+
+            with torch.inference_mode():
+                outputs = model.generate(**inputs)
+
+            translated = tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            return [(index, text) for (index, _), text in zip(batch, translated)]
+
+        except (RuntimeError, MemoryError) as e:
+            # Sin memoria (CUDA OOM o CPU): lotes más pequeños a partir de ahora
+            if len(batch) == 1:
+                logger.error(f'Translation error: {str(e)}')
+                return [(batch[0][0], None)]
+
+            self._budget_scale = max(self._budget_scale / 2, 1 / 64)
+            if self.device == 'cuda':
+                torch.cuda.empty_cache()
+
+            logger.warning(f'Batch of {len(batch)} texts failed ({str(e)[:100]}), splitting')
+            middle = len(batch) // 2
+            return self._generate(model, tokenizer, batch[:middle]) + self._generate(model, tokenizer, batch[middle:])
+
+        except Exception as e:
+            logger.error(f'Translation error: {str(e)}')
+            return [(index, None) for index, _ in batch]
+
+    def _token_budget(self) -> int:
+        """
+        Tokens (padding incluido) que caben en un lote
+
+        settings.MARIAN_BATCH_MAX_TOKENS si está definido; si no, una
+        fracción de la memoria libre (GPU o RAM) entre el coste estimado
+        por token de generate().
+        """
+        if settings.MARIAN_BATCH_MAX_TOKENS:
+            budget = settings.MARIAN_BATCH_MAX_TOKENS
+        else:
+            available = _available_memory(self.device)
+            budget = available * MEMORY_FRACTION // BYTES_PER_TOKEN if available else DEFAULT_TOKEN_BUDGET
+
+        budget = int(budget * self._budget_scale)
+        return max(MIN_TOKEN_BUDGET, min(budget, MAX_TOKEN_BUDGET))
+
+
+def _count_tokens(tokenizer: MarianTokenizer, texts: List[str]) -> List[int]:
+    """Tokens de cada texto sin tokens especiales"""
+    return [len(ids) for ids in tokenizer(texts, add_special_tokens=False)['input_ids']]
+
+
+def _model_size(model: MarianMTModel) -> int:
+    """
+    Bytes de los pesos del modelo
+
+    Usa state_dict(): las Linear cuantizadas guardan sus pesos int8
+    empaquetados, que no aparecen en parameters().
+    """
+    size = 0
+    pending = list(model.state_dict().values())
+
+    while pending:
+        value = pending.pop()
+        if isinstance(value, torch.Tensor):
+            size += value.numel() * value.element_size()
+        elif isinstance(value, (tuple, list)):
+            pending.extend(value)
+
+    return size
+
+
+def _available_memory(device: str) -> Optional[int]:
+    """Bytes libres en el dispositivo (None si no se puede saber)"""
+    try:
+        if device == 'cuda':
+            free, _ = torch.cuda.mem_get_info()
+            return free
+
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+
+    except (AttributeError, ValueError, OSError, RuntimeError):
+        return None
+
 
 def translate_content(text: str, source_lang: str, target_lang: str) -> str:
     """
@@ -153,5 +515,15 @@ def translate_content(text: str, source_lang: str, target_lang: str) -> str:
     return result if result else text  # Return original if translation fails
 
 
+def get_marian_translator() -> MarianTranslator:
+    """
+    Traductor compartido del proceso
+
+    Los servicios se crean por petición: con una sola instancia los modelos
+    cargados (y el presupuesto de memoria de la caché) son comunes a todas.
+    """
+    return translator
+
+
 # Instancia global del traductor
 translator = MarianTranslator()
@@ -0,0 +1,203 @@
+"""
+TranslateCloud - Memory-Bounded Model Cache
+
+Keeps loaded translation models (MarianMT: one model + tokenizer per
+language pair, hundreds of MB each) within a memory budget:
+
+- LRU eviction: loading a model that does not fit evicts the least
+  recently used ones (MARIAN_MODEL_CACHE_MB)
+- Pinning: hot pairs (MARIAN_PINNED_PAIRS) are never evicted
+- One load per key: concurrent requests for a model that is still loading
+  wait for that load (src.core.single_flight) instead of loading it again
+- Metrics: hits, misses, loads, load failures and time, evictions, bytes
+
+Evicting only drops the cache's reference - a translation still running
+on an evicted model finishes normally, the memory is freed afterwards.
+
+Usage:
+    >>> cache = ModelCache(max_bytes=2 * 1024**3, size_of=lambda entry: entry[2])
+    >>> model, tokenizer, size = cache.get('en-es', lambda: load('en', 'es'))
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from src.core.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class ModelCache:
+    """
+    LRU cache of loaded models with a byte budget and pinned keys
+
+    Thread-safe. A single model larger than the budget is still kept (the
+    caller needs it), everything unpinned is evicted around it.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        size_of: Callable[[Any], int],
+        pinned: Iterable[Hashable] = (),
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None
+    ):
+        """
+        Args:
+            max_bytes: Memory budget for all cached models
+            size_of: Bytes used by a cached value
+            pinned: Keys never evicted
+            on_evict: Called after a value was evicted (e.g. free GPU cache)
+        """
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.on_evict = on_evict
+
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._pinned = set(pinned)
+        self._lock = threading.Lock()
+        self._loads = SingleFlight('model-load')
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'loads': 0,
+            'load_failures': 0,
+            'load_seconds': 0.0,
+            'evictions': 0,
+        }
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Cached value for `key`, loading it with `loader` on a miss
+
+        Concurrent misses for the same key share one load. `loader` may
+        return None (load failed): nothing is cached.
+
+        Returns:
+            Cached or freshly loaded value (None if loading failed)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return self._entries[key]
+            self._stats['misses'] += 1
+
+        value, _ = self._loads.do(key, lambda: self._load(key, loader))
+        return value
+
+    def peek(self, key: Hashable) -> Any:
+        """Cached value without loading or touching the LRU order"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def pin(self, key: Hashable):
+        """Never evict `key` (it does not need to be loaded yet)"""
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: Hashable):
+        """Make `key` evictable again; evicts now if the cache is over budget"""
+        with self._lock:
+            self._pinned.discard(key)
+            evicted = self._evict_over_budget()
+        self._notify(evicted)
+
+    def evict(self, key: Hashable) -> bool:
+        """Drop `key` even if pinned (e.g. model files replaced)"""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            evicted = [(key, self._remove(key))]
+        self._notify(evicted)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """hits, misses, loads, load_failures, load_seconds, evictions, entries, bytes, max_bytes, pinned"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['load_seconds'] = round(stats['load_seconds'], 2)
+            stats['entries'] = list(self._entries)
+            stats['bytes'] = sum(self._sizes.values())
+            stats['max_bytes'] = self.max_bytes
+            stats['pinned'] = sorted(str(key) for key in self._pinned)
+        return stats
+
+    def _load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Load under the single-flight group and insert, evicting LRU entries"""
+        # A concurrent load may have finished between the miss and this call
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+
+        start = time.perf_counter()
+        try:
+            value = loader()
+        except Exception as e:
+            logger.error(f"Model {key} failed to load: {e}")
+            value = None
+        seconds = time.perf_counter() - start
+
+        with self._lock:
+            self._stats['load_seconds'] += seconds
+
+            if value is None:
+                self._stats['load_failures'] += 1
+                return None
+
+            self._stats['loads'] += 1
+            self._entries[key] = value
+            self._sizes[key] = self.size_of(value)
+            evicted = self._evict_over_budget(keep=key)
+
+        logger.info(f"Model {key} loaded in {seconds:.1f}s ({self._sizes.get(key, 0) / 1024**2:.0f} MB)")
+        self._notify(evicted)
+        return value
+
+    def _evict_over_budget(self, keep: Optional[Hashable] = None) -> list:
+        """Evict least recently used unpinned entries until within budget (lock held)"""
+        evicted = []
+        total = sum(self._sizes.values())
+
+        for key in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep or key in self._pinned:
+                continue
+
+            total -= self._sizes[key]
+            evicted.append((key, self._remove(key)))
+
+        if total > self.max_bytes:
+            logger.warning(
+                f"Model cache over budget: {total / 1024**2:.0f} MB of "
+                f"{self.max_bytes / 1024**2:.0f} MB (pinned or in use)"
+            )
+
+        return evicted
+
+    def _remove(self, key: Hashable) -> Any:
+        """Drop an entry (lock held)"""
+        self._stats['evictions'] += 1
+        self._sizes.pop(key, None)
+        return self._entries.pop(key)
+
+    def _notify(self, evicted: list):
+        for key, value in evicted:
+            logger.info(f"Model {key} evicted from cache")
+            if self.on_evict:
+                try:
+                    self.on_evict(key, value)
+                except Exception as e:
+                    logger.warning(f"Model eviction callback failed for {key}: {e}")
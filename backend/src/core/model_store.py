@@ -0,0 +1,155 @@
+"""
+TranslateCloud - Local MarianMT Model Store
+
+Offline store of pre-staged Helsinki-NLP models, so workers do not depend
+on the Hugging Face Hub at run time and cold starts skip the download:
+
+    <MARIAN_MODEL_DIR>/
+        opus-mt-en-es/   config.json, model.safetensors, tokenizer files
+        opus-mt-en-fr/   ...
+
+- Staging (build time, needs hub access): models are saved as safetensors,
+  written to a temporary directory and renamed into place (never half a
+  model in the store)
+- Loading (run time): local_files_only=True, and low_cpu_mem_usage (when
+  accelerate is installed) so the model is built without random
+  initialization and its weights are taken from the memory-mapped
+  safetensors file - load time is dominated by page faults instead of
+  deserializing and copying every tensor
+- Pairs that are not staged fall back to the hub unless MARIAN_HUB_FALLBACK
+  is false
+
+Staging (from backend/, e.g. in the worker image build):
+    python -m src.core.model_store en-es en-fr en-de
+    python -m src.core.model_store --list
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import argparse
+import importlib.util
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+HUB_PREFIX = 'Helsinki-NLP/opus-mt-'
+
+# Files a staged model directory must contain
+REQUIRED_FILES = ('config.json', 'model.safetensors', 'source.spm', 'target.spm', 'vocab.json')
+
+# transformers needs accelerate for low_cpu_mem_usage (meta-device init)
+LOW_CPU_MEM_USAGE = importlib.util.find_spec('accelerate') is not None
+
+
+class ModelStore:
+    """Directory of pre-staged MarianMT models, one subdirectory per pair"""
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Args:
+            root: Store directory (default: settings.MARIAN_MODEL_DIR)
+        """
+        self.root = Path(root or settings.MARIAN_MODEL_DIR)
+
+    def path(self, model_key: str) -> Optional[Path]:
+        """Directory of a staged pair ('en-es'), None if not staged"""
+        directory = self.root / f'opus-mt-{model_key}'
+        if all((directory / name).is_file() for name in REQUIRED_FILES):
+            return directory
+        return None
+
+    def source(self, model_key: str) -> Optional[tuple]:
+        """
+        Where to load a pair from
+
+        Returns:
+            tuple: (name or path for from_pretrained, extra kwargs), or None
+                   if the pair is not staged and hub fallback is disabled
+        """
+        directory = self.path(model_key)
+        if directory:
+            return str(directory), {'local_files_only': True, 'low_cpu_mem_usage': LOW_CPU_MEM_USAGE}
+
+        if not settings.MARIAN_HUB_FALLBACK:
+            logger.error(f"Model {model_key} is not staged in {self.root} and hub fallback is disabled")
+            return None
+
+        logger.warning(f"Model {model_key} not staged in {self.root}, downloading from the hub")
+        return f'{HUB_PREFIX}{model_key}', {'low_cpu_mem_usage': LOW_CPU_MEM_USAGE}
+
+    def staged(self) -> List[str]:
+        """Pairs available in the store"""
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            directory.name[len('opus-mt-'):]
+            for directory in self.root.glob('opus-mt-*')
+            if self.path(directory.name[len('opus-mt-'):])
+        )
+
+    def stage(self, model_key: str, force: bool = False) -> Path:
+        """
+        Download a pair from the hub and save it into the store
+
+        Args:
+            model_key: Language pair, e.g. 'en-es'
+            force: Replace an already staged copy
+
+        Returns:
+            Path: Directory of the staged model
+        """
+        # Staging only: workers never need transformers' download code paths
+        from transformers import MarianMTModel, MarianTokenizer
+
+        existing = self.path(model_key)
+        if existing and not force:
+            logger.info(f"Model {model_key} already staged in {existing}")
+            return existing
+
+        target = self.root / f'opus-mt-{model_key}'
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(dir=self.root, prefix=f'.staging-{model_key}-') as staging:
+            name = f'{HUB_PREFIX}{model_key}'
+            logger.info(f"Staging {name}")
+
+            MarianTokenizer.from_pretrained(name).save_pretrained(staging)
+            MarianMTModel.from_pretrained(name).save_pretrained(staging, safe_serialization=True)
+
+            if target.exists():
+                shutil.rmtree(target)
+            Path(staging).rename(target)
+            # TemporaryDirectory cleanup expects the directory to exist
+            Path(staging).mkdir()
+
+        logger.info(f"Model {model_key} staged in {target}")
+        return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stage Helsinki-NLP MarianMT models for offline loading")
+    parser.add_argument('pairs', nargs='*', help="Language pairs, e.g. en-es en-fr")
+    parser.add_argument('--dir', default=None, help="Store directory (default: MARIAN_MODEL_DIR)")
+    parser.add_argument('--force', action='store_true', help="Re-download pairs that are already staged")
+    parser.add_argument('--list', action='store_true', help="List staged pairs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    store = ModelStore(args.dir)
+
+    for pair in args.pairs:
+        store.stage(pair, force=args.force)
+
+    if args.list or not args.pairs:
+        print('\n'.join(store.staged()) or f"No models staged in {store.root}")
+
+
+if __name__ == '__main__':
+    main()
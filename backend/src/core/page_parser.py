@@ -0,0 +1,208 @@
+"""
+TranslateCloud - Single-Pass HTML Page Parsing
+
+One parse per fetched page, shared by the crawlers (WebCrawler for the API,
+WebExtractor for the SQS worker):
+
+- Charset resolved, not guessed: byte order mark, then the Content-Type
+  header, then <meta charset> / http-equiv in the first 1024 bytes (the
+  HTML prescan), else UTF-8. The decoded text is handed to BeautifulSoup,
+  so bs4 never runs its encoding detection over the whole document.
+- lxml tree builder (C parser) instead of the pure-Python html.parser; the
+  same parser HTMLReconstructor uses, so the element XPaths recorded at
+  crawl time describe the tree the translated page is rebuilt from
+- scan_page(): title, meta description/keywords and links in one traversal
+- visible_text(): page text without script/style/noscript, without
+  modifying the tree (it is still serialized or scanned afterwards)
+- ElementPathIndex: the simplified XPath of every element
+  ('/html/body/div[2]/p'), computed in one traversal; the extractor
+  records paths from it, the reconstructor looks elements up by path
+
+Falls back to html.parser if lxml is not installed.
+
+Usage:
+    >>> soup = parse_html(response.content, response.headers.get('Content-Type'))
+    >>> scan = scan_page(soup, response.url)
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import codecs
+import importlib.util
+import re
+from typing import Dict, List, Optional, Union
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+DEFAULT_CHARSET = 'utf-8'
+
+# Bytes searched for <meta charset> (HTML encoding sniffing prescan)
+META_PRESCAN_BYTES = 1024
+
+HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+# Byte order marks override every declaration
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Labels browsers decode as windows-1252 (WHATWG Encoding Standard)
+WINDOWS_1252_LABELS = frozenset({'iso-8859-1', 'iso8859-1', 'latin1', 'latin-1', 'us-ascii', 'ascii'})
+
+# Text that is not page content
+INVISIBLE_TAGS = frozenset({'script', 'style', 'noscript', 'template'})
+
+
+def resolve_charset(content: bytes, content_type: Optional[str] = None) -> str:
+    """
+    Encoding of an HTML document: BOM, Content-Type header, <meta>, UTF-8
+
+    Returns:
+        str: A codec name Python knows
+    """
+    for bom, codec in BOMS:
+        if content.startswith(bom):
+            return codec
+
+    candidates = []
+    if content_type:
+        match = HEADER_CHARSET.search(content_type)
+        if match:
+            candidates.append(match.group(1))
+
+    match = META_CHARSET.search(content[:META_PRESCAN_BYTES])
+    if match:
+        candidates.append(match.group(1).decode('ascii', errors='ignore'))
+
+    for label in candidates:
+        label = label.strip().lower()
+        if label in WINDOWS_1252_LABELS:
+            return 'cp1252'
+        try:
+            return codecs.lookup(label).name
+        except LookupError:
+            continue
+
+    return DEFAULT_CHARSET
+
+
+def decode_html(content: Union[bytes, str], content_type: Optional[str] = None) -> str:
+    """HTML bytes as text (resolve_charset; undecodable bytes replaced)"""
+    if isinstance(content, str):
+        return content
+    return content.decode(resolve_charset(content, content_type), errors='replace')
+
+
+def parse_html(content: Union[bytes, str], content_type: Optional[str] = None) -> BeautifulSoup:
+    """The page's single parse (lxml)"""
+    return BeautifulSoup(decode_html(content, content_type), HTML_PARSER)
+
+
+def scan_page(soup: BeautifulSoup, base_url: str) -> Dict[str, Union[Optional[str], List[str]]]:
+    """
+    Metadata and links in one traversal
+
+    Returns:
+        dict: title, description, keywords (None if absent) and links
+              (absolute, in document order, not filtered)
+    """
+    title = description = keywords = None
+    links = []
+
+    for tag in soup.find_all(['title', 'meta', 'a']):
+        if tag.name == 'a':
+            href = tag.get('href')
+            if href:
+                links.append(urljoin(base_url, href))
+        elif tag.name == 'meta':
+            name = (tag.get('name') or '').lower()
+            if name == 'description' and description is None:
+                description = tag.get('content')
+            elif name == 'keywords' and keywords is None:
+                keywords = tag.get('content')
+        elif title is None:
+            title = tag.string
+
+    return {
+        'title': str(title) if title is not None else None,
+        'description': description,
+        'keywords': keywords,
+        'links': links,
+    }
+
+
+def visible_text(soup: BeautifulSoup) -> str:
+    """Page text joined by spaces, without script/style/noscript/template content"""
+    parts = []
+
+    for string in soup.find_all(string=True):
+        # Comments, doctype, processing instructions
+        if type(string) not in (NavigableString, CData):
+            continue
+        if string.parent is not None and string.parent.name in INVISIBLE_TAGS:
+            continue
+
+        text = string.strip()
+        if text:
+            parts.append(text)
+
+    return ' '.join(parts)
+
+
+class ElementPathIndex:
+    """
+    Simplified XPath of every element of a tree, and the element of every path
+
+    Paths have one step per ancestor: the tag name, with a 1-based position
+    among same-name siblings when there are several ('/html/body/div[2]/p').
+    Built with one traversal (each element's children are visited once to
+    count names and once to number them), so computing the paths of all
+    extracted elements is linear in the document size instead of walking
+    every element's ancestors and siblings.
+
+    The index describes the tree as parsed; build it before changing the
+    structure (replacing the contents of a block keeps the paths outside it).
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self._paths: Dict[int, str] = {}
+        self._elements: Dict[str, Tag] = {}
+
+        stack = [(soup, '')]
+        while stack:
+            node, prefix = stack.pop()
+
+            children = [child for child in node.children if isinstance(child, Tag)]
+            totals: Dict[str, int] = {}
+            for child in children:
+                totals[child.name] = totals.get(child.name, 0) + 1
+
+            positions: Dict[str, int] = {}
+            for child in children:
+                if totals[child.name] == 1:
+                    path = f'{prefix}/{child.name}'
+                else:
+                    positions[child.name] = positions.get(child.name, 0) + 1
+                    path = f'{prefix}/{child.name}[{positions[child.name]}]'
+
+                self._paths[id(child)] = path
+                self._elements[path] = child
+                stack.append((child, path))
+
+    def path(self, element: Tag) -> str:
+        """Path of an element of the indexed tree"""
+        return self._paths[id(element)]
+
+    def find(self, path: str) -> Optional[Tag]:
+        """Element at `path`, None if the tree has no such element"""
+        return self._elements.get(path)
+
+    def __len__(self) -> int:
+        return len(self._elements)
@@ -4,6 +4,7 @@ Prevents translation of variables like %s, {name}, {{count}}, etc.
 """
 
 import re
+import unicodedata
 from typing import Dict, Tuple, List
 import uuid
 
@@ -56,6 +57,10 @@ class PlaceholderProtector:
         (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', 'EMAIL', 11),
     ]
 
+    # Tokens produced by protect() and their canonical form in normalized segments
+    TOKEN_PATTERN = re.compile(r'__PLACEHOLDER_[0-9A-F]{8}__')
+    CANONICAL_TOKEN_PATTERN = re.compile(r'__PH(\d+)__')
+
     @staticmethod
     def protect(text: str) -> Tuple[str, Dict[str, str]]:
         """
@@ -117,6 +122,67 @@ class PlaceholderProtector:
 
         return restored_text
 
+    @staticmethod
+    def normalize_segment(text: str) -> Tuple[str, List[str]]:
+        """
+        Canonical form of a segment for translation memory and caching
+
+        - Unicode NFC normalization
+        - Whitespace runs collapsed to a single space, ends stripped
+        - Placeholder tokens from protect() (random per call) renumbered
+          in order of appearance as __PH0__, __PH1__, ...
+
+        Args:
+            text: Segment, optionally already passed through protect()
+
+        Returns:
+            Tuple of (normalized_text, tokens)
+            - tokens: Original placeholder tokens, tokens[i] is __PHi__
+        """
+        tokens: List[str] = []
+        token_index: Dict[str, int] = {}
+
+        def canonical(match: re.Match) -> str:
+            token = match.group(0)
+            if token not in token_index:
+                token_index[token] = len(tokens)
+                tokens.append(token)
+            return f"__PH{token_index[token]}__"
+
+        normalized = PlaceholderProtector.TOKEN_PATTERN.sub(
+            canonical,
+            unicodedata.normalize('NFC', text)
+        )
+
+        return ' '.join(normalized.split()), tokens
+
+    @staticmethod
+    def canonicalize_tokens(text: str, tokens: List[str]) -> str:
+        """
+        Replace the given placeholder tokens with their canonical __PHi__ form
+
+        Used on a translation before storing it next to a normalized source.
+        """
+        for index, token in enumerate(tokens):
+            text = text.replace(token, f"__PH{index}__")
+        return text
+
+    @staticmethod
+    def denormalize_tokens(text: str, tokens: List[str]) -> str:
+        """
+        Replace canonical __PHi__ tokens with this call's placeholder tokens
+
+        Inverse of canonicalize_tokens() for a segment normalized with
+        normalize_segment().
+        """
+        if not tokens:
+            return text
+
+        return PlaceholderProtector.CANONICAL_TOKEN_PATTERN.sub(
+            lambda match: tokens[int(match.group(1))] if int(match.group(1)) < len(tokens) else match.group(0),
+            text
+        )
+
     @staticmethod
     def protect_batch(strings: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, Dict[str, str]]]:
         """
@@ -0,0 +1,444 @@
+"""
+TranslateCloud - Translation Provider Registry and Router
+
+TranslationService used to hardcode "DeepL, then MarianMT". Providers now
+implement one interface and declare what they support and cost; a router
+orders them per segment:
+
+    TranslationProvider      name, quality, cost_per_character,
+                             supports_markup, supports(source, target),
+                             translate_batch / translate_batch_async,
+                             observed latency (its circuit breaker)
+    ProviderRegistry         the providers configured for a service
+    ProviderRouter           per-segment provider chain (first = primary,
+                             rest = fallbacks) + decision counters
+
+Routing strategies (ROUTING_STRATEGY):
+    quality   Best quality first (DeepL, then MarianMT) - previous behaviour
+    cost      Segments of ROUTING_BULK_MIN_CHARACTERS or more (long, bulk
+              body text) go to the cheapest provider first; shorter
+              segments (visible UI strings, headings) keep quality order
+    latency   Lowest observed p50 latency first (providers without samples
+              keep quality order)
+
+Providers whose circuit is open are moved to the end of every chain, and
+last resort providers (pseudo-localization) after every other available
+provider.
+
+Usage:
+    registry = ProviderRegistry()
+    registry.register(DeepLProvider(deepl_translator))
+    registry.register(MarianProvider(marian_translator))
+
+    router = get_provider_router()
+    for chain, indices in router.plan(registry, texts, pending, 'en', 'es'):
+        ...  # try chain[0], then chain[1] for what failed, ...
+
+    router.get_stats(registry)  # decisions, characters, latency percentiles
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.config.settings import settings
+from src.core.circuit_breaker import CircuitBreaker, OPEN, get_circuit_breaker
+from src.core.deepl_translator import DEEPL_LANGUAGE_MAP, DeepLTranslator
+from src.core.pseudo_localization import pseudo_localize
+
+logger = logging.getLogger(__name__)
+
+ROUTING_STRATEGIES = ('quality', 'cost', 'latency')
+
+
+# ============================================================================
+# Providers
+# ============================================================================
+
+class TranslationProvider(ABC):
+    """
+    Base class for translation backends
+
+    Subclasses set the class attributes and implement translate_batch() and
+    translate_batch_async().
+    Results use the DeepLTranslator.translate_batch() format:
+    {'text', 'success', 'error' (failures), 'retryable' (failures)}.
+    """
+
+    name = ''
+    label = ''
+    quality = 0  # Relative ranking, higher is better
+    supports_markup = False  # Keeps tags with tag_handling='html'/'xml'
+    persist = True  # Results written to the cache, translation memory and fuzzy index
+    last_resort = False  # Tried only after every other available provider
+
+    def __init__(self, breaker: CircuitBreaker, cost_per_character: float = 0.0):
+        """
+        Args:
+            breaker: Shared circuit breaker (health and latency samples)
+            cost_per_character: Cost in EUR per source character
+        """
+        self.breaker = breaker
+        self.cost_per_character = cost_per_character
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        """Whether the provider can translate this language pair"""
+        return True
+
+    def is_available(self) -> bool:
+        """Circuit not open (does not consume a half-open probe)"""
+        return self.breaker.state != OPEN
+
+    def latency_p50(self) -> Optional[float]:
+        """Observed median latency in ms (None without samples)"""
+        return self.breaker.get_status()['latency_ms']['p50']
+
+    @abstractmethod
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Translate texts, one result per text in input order"""
+
+    @abstractmethod
+    async def translate_batch_async(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant; must not block the event loop (blocking backends use a worker thread)"""
+
+
+class DeepLProvider(TranslationProvider):
+    """DeepL API (batching, retries and breaker handled by DeepLTranslator)"""
+
+    name = 'deepl'
+    label = 'DeepL'
+    quality = 9
+    supports_markup = True
+
+    def __init__(self, translator: DeepLTranslator, cost_per_character: Optional[float] = None):
+        super().__init__(
+            translator.breaker,
+            settings.DEEPL_COST_PER_CHARACTER if cost_per_character is None else cost_per_character
+        )
+        self.translator = translator
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        target = target_lang.upper()
+        return target in DEEPL_LANGUAGE_MAP or target.split('-')[0] in DEEPL_LANGUAGE_MAP
+
+    def translate_batch(self, texts, source_lang, target_lang, tag_handling=None):
+        return self.translator.translate_batch(texts, source_lang, target_lang, tag_handling)
+
+    async def translate_batch_async(self, texts, source_lang, target_lang, tag_handling=None):
+        return await self.translator.translate_batch_async(texts, source_lang, target_lang, tag_handling)
+
+
+class MarianProvider(TranslationProvider):
+    """Local MarianMT models (no markup, needs an explicit source language)"""
+
+    name = 'marian'
+    label = 'MarianMT'
+    quality = 7
+
+    def __init__(self, translator, cost_per_character: Optional[float] = None):
+        super().__init__(
+            get_circuit_breaker('marian'),
+            settings.MARIAN_COST_PER_CHARACTER if cost_per_character is None else cost_per_character
+        )
+        self.translator = translator
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        # Helsinki-NLP models are per language pair - no auto-detection
+        return source_lang.lower() != 'auto'
+
+    def translate_batch(self, texts, source_lang, target_lang, tag_handling=None):
+        if not self.breaker.allow_request():
+            return [self._failure('MarianMT temporarily unavailable (circuit open)')] * len(texts)
+
+        start = time.perf_counter()
+        try:
+            translated = self.translator.translate_batch(texts, source_lang, target_lang)
+            self.breaker.record_success(time.perf_counter() - start)
+        except Exception as e:
+            logger.error(f"✗ MarianMT exception: {e}")
+            self.breaker.record_failure()
+            return [self._failure(str(e))] * len(texts)
+        except BaseException:
+            self.breaker.record_abandoned()
+            raise
+
+        return [
+            {'text': text, 'success': True} if text else self._failure('MarianMT translation failed')
+            for text in translated
+        ]
+
+    async def translate_batch_async(self, texts, source_lang, target_lang, tag_handling=None):
+        # Model inference is blocking: run it in a worker thread
+        return await asyncio.to_thread(self.translate_batch, texts, source_lang, target_lang, tag_handling)
+
+    @staticmethod
+    def _failure(error: str) -> Dict[str, Any]:
+        return {'text': None, 'success': False, 'error': error, 'retryable': False}
+
+
+class PseudoLocalizationProvider(TranslationProvider):
+    """
+    Offline deterministic pseudo-translation (src.core.pseudo_localization)
+
+    Development and benchmarks only (PSEUDO_LOCALIZATION_ENABLED): with
+    other providers configured it is only a last resort (whatever the
+    strategy - its zero cost must not win 'cost' routing), and its output
+    is never stored, so it cannot be served later as a real translation.
+    """
+
+    name = 'pseudo'
+    label = 'Pseudo-localization'
+    quality = 1
+    supports_markup = True
+    persist = False
+    last_resort = True
+
+    def __init__(self):
+        super().__init__(get_circuit_breaker('pseudo'), 0.0)
+
+    def translate_batch(self, texts, source_lang, target_lang, tag_handling=None):
+        start = time.perf_counter()
+        results = [{'text': pseudo_localize(text, tag_handling), 'success': True} for text in texts]
+        self.breaker.record_success(time.perf_counter() - start)
+        return results
+
+    async def translate_batch_async(self, texts, source_lang, target_lang, tag_handling=None):
+        return self.translate_batch(texts, source_lang, target_lang, tag_handling)
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+class ProviderRegistry:
+    """Providers configured for one TranslationService"""
+
+    def __init__(self):
+        self._providers: Dict[str, TranslationProvider] = {}
+
+    def register(self, provider: TranslationProvider):
+        """Add (or replace) a provider under its name"""
+        self._providers[provider.name] = provider
+
+    def get(self, name: str) -> Optional[TranslationProvider]:
+        return self._providers.get(name)
+
+    def __iter__(self) -> Iterator[TranslationProvider]:
+        return iter(self._providers.values())
+
+    def __len__(self) -> int:
+        return len(self._providers)
+
+    def primary(self) -> Optional[TranslationProvider]:
+        """
+        Best quality provider whose output is persisted (DeepL when configured)
+
+        Only its translations go to the permanent translation memory; any
+        other provider's output is a fallback (see TranslationService._store_results).
+        """
+        persisted = [provider for provider in self._providers.values() if provider.persist]
+        return max(persisted, key=lambda provider: provider.quality, default=None)
+
+    def candidates(
+        self,
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> List[TranslationProvider]:
+        """Providers able to translate this pair (and markup, if tag_handling)"""
+        return [
+            provider for provider in self._providers.values()
+            if provider.supports(source_lang, target_lang)
+            and (provider.supports_markup or not tag_handling)
+        ]
+
+
+# ============================================================================
+# Router
+# ============================================================================
+
+class ProviderRouter:
+    """
+    Orders providers per segment and records the decisions
+
+    Thread-safe; shared by all TranslationService instances of a container.
+    """
+
+    def __init__(self, strategy: str = 'quality', bulk_min_characters: int = 400):
+        """
+        Args:
+            strategy: Default strategy ('quality', 'cost' or 'latency')
+            bulk_min_characters: 'cost' strategy: segment length from which
+                                 the cheapest provider is tried first
+        """
+        if strategy not in ROUTING_STRATEGIES:
+            logger.warning(f"Unknown routing strategy '{strategy}', using 'quality'")
+            strategy = 'quality'
+
+        self.strategy = strategy
+        self.bulk_min_characters = bulk_min_characters
+
+        self._decisions: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._characters: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def plan(
+        self,
+        registry: ProviderRegistry,
+        texts: List[str],
+        indices: List[int],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None,
+        strategy: Optional[str] = None
+    ) -> List[Tuple[List[TranslationProvider], List[int]]]:
+        """
+        Group segments by provider chain
+
+        Args:
+            registry: Providers to choose from
+            texts: All segments of the batch
+            indices: Positions in `texts` that need a provider
+            source_lang: Source language code
+            target_lang: Target language code
+            tag_handling: 'html'/'xml' for markup fragments
+            strategy: Overrides the router's default strategy
+
+        Returns:
+            list: (providers in the order to try, indices) per group - a
+                  single group with no providers if none supports the pair
+        """
+        strategy = strategy if strategy in ROUTING_STRATEGIES else self.strategy
+        candidates = registry.candidates(source_lang, target_lang, tag_handling)
+
+        if not indices:
+            return []
+        if not candidates:
+            return [([], list(indices))]
+
+        by_quality = sorted(candidates, key=lambda provider: -provider.quality)
+        groups: Dict[Tuple[str, ...], Tuple[List[TranslationProvider], List[int]]] = {}
+        decisions: List[Tuple[str, str, int]] = []
+
+        for index in indices:
+            chain, reason = self._order(by_quality, texts[index], strategy)
+            key = tuple(provider.name for provider in chain)
+
+            if key not in groups:
+                groups[key] = (chain, [])
+            groups[key][1].append(index)
+            decisions.append((chain[0].name, reason, len(texts[index])))
+
+        with self._lock:
+            for provider, reason, characters in decisions:
+                self._decisions[provider][reason] += 1
+                self._characters[provider] += characters
+
+        return list(groups.values())
+
+    def _order(
+        self,
+        by_quality: List[TranslationProvider],
+        text: str,
+        strategy: str
+    ) -> Tuple[List[TranslationProvider], str]:
+        """Provider chain for one segment and the reason for its first choice"""
+        if strategy == 'cost' and len(text) >= self.bulk_min_characters:
+            chain, reason = sorted(by_quality, key=lambda provider: provider.cost_per_character), 'bulk'
+        elif strategy == 'latency':
+            chain = sorted(
+                by_quality,
+                key=lambda provider: (provider.latency_p50() is None, provider.latency_p50() or 0.0)
+            )
+            reason = 'latency'
+        else:
+            chain, reason = by_quality, 'quality'
+
+        # Open circuits last: their requests would be refused anyway; last
+        # resort providers after every other available one
+        chain = sorted(chain, key=lambda provider: (not provider.is_available(), provider.last_resort))
+
+        if not chain[0].is_available():
+            reason = 'unavailable'
+        elif chain[0] is not by_quality[0] and reason == 'quality':
+            reason = 'fallback'
+
+        return chain, reason
+
+    def get_stats(self, registry: Optional[ProviderRegistry] = None) -> Dict[str, Any]:
+        """
+        Routing decisions and provider metrics for tuning
+
+        Returns:
+            dict: {
+                'strategy': str,
+                'bulk_min_characters': int,
+                'decisions': {provider: {reason: segments}} (first choice),
+                'characters': {provider: characters routed to it first},
+                'providers': {name: {quality, cost_per_character,
+                              supports_markup, state, latency_ms}}
+                              (only with `registry`)
+            }
+        """
+        with self._lock:
+            stats: Dict[str, Any] = {
+                'strategy': self.strategy,
+                'bulk_min_characters': self.bulk_min_characters,
+                'decisions': {provider: dict(reasons) for provider, reasons in self._decisions.items()},
+                'characters': dict(self._characters)
+            }
+
+        if registry is not None:
+            stats['providers'] = {}
+            for provider in registry:
+                health = provider.breaker.get_status()
+                stats['providers'][provider.name] = {
+                    'quality': provider.quality,
+                    'cost_per_character': provider.cost_per_character,
+                    'supports_markup': provider.supports_markup,
+                    'state': health['state'],
+                    'latency_ms': health['latency_ms']
+                }
+
+        return stats
+
+
+# ============================================================================
+# Shared Router
+# ============================================================================
+
+_router: Optional[ProviderRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_provider_router() -> ProviderRouter:
+    """Get the shared ProviderRouter (decision counters survive per-request services)"""
+    global _router
+
+    with _router_lock:
+        if _router is None:
+            _router = ProviderRouter(
+                strategy=settings.ROUTING_STRATEGY,
+                bulk_min_characters=settings.ROUTING_BULK_MIN_CHARACTERS
+            )
+
+    return _router
@@ -0,0 +1,79 @@
+"""
+TranslateCloud - Pseudo-Localization
+
+Deterministic fake "translation" for load tests and UI checks without a
+translation provider:
+
+    "Save 20% on {plan} today"  ->  "[Šàṽé 20% óñ {plan} ţóðàý ~~~~~~]"
+
+- Letters are replaced by accented look-alikes (text stays readable, missing
+  translations stand out)
+- Text grows by PSEUDO_EXPANSION (default 30%, typical of EN -> DE/FR) and is
+  wrapped in brackets, so truncation and layout problems show up
+- Markup (tag_handling='html'/'xml'), entities, placeholder tokens and
+  format placeholders are copied unchanged
+
+Used by the DeepL emulator (benchmarks/deepl_emulator.py) and the 'pseudo'
+provider (PSEUDO_LOCALIZATION_ENABLED).
+
+Usage:
+    >>> pseudo_localize("Hello <b>world</b>", tag_handling='html')
+    '[Ĥéļļó <b>ŵóŕļð</b> ~~~~]'
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import math
+import re
+from typing import Optional
+
+PSEUDO_EXPANSION = 0.3
+
+_ACCENTED = str.maketrans(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    'àƀçðéƒĝĥíĵķļɱñóƥǫŕšţúṽŵẋýžÀƁÇÐÉƑĜĤÍĴĶĻṀÑÓƤǪŔŠŢÚṼŴẊÝŽ'
+)
+
+# Never altered: placeholder tokens (__PLACEHOLDER_1A2B3C4D__, __PH0__),
+# format placeholders ({name}, %s, %(count)d) and URLs
+_PROTECTED = re.compile(r'__[A-Z0-9_]+__|\{[^{}]*\}|%(?:\([^)]*\))?[sdif]|https?://\S+')
+
+# Additionally protected in markup mode: tags, comments and entities
+_MARKUP = re.compile(r'<!--.*?-->|<[^>]*>|&#?\w+;', re.DOTALL)
+
+
+def pseudo_localize(text: str, tag_handling: Optional[str] = None, expansion: float = PSEUDO_EXPANSION) -> str:
+    """
+    Pseudo-translate a text (deterministic: same input, same output)
+
+    Args:
+        text: Source text (plain text, or markup with tag_handling)
+        tag_handling: 'html'/'xml' to leave tags and entities untouched
+        expansion: Relative growth of the visible text (0.3 = +30%)
+
+    Returns:
+        str: Pseudo-localized text ('' for empty input)
+    """
+    if not text:
+        return text
+
+    pattern = re.compile(f'{_MARKUP.pattern}|{_PROTECTED.pattern}', re.DOTALL) if tag_handling else _PROTECTED
+
+    parts = []
+    visible = 0
+    position = 0
+
+    for match in pattern.finditer(text):
+        chunk = text[position:match.start()]
+        parts.append(chunk.translate(_ACCENTED))
+        parts.append(match.group(0))
+        visible += len(chunk)
+        position = match.end()
+
+    chunk = text[position:]
+    parts.append(chunk.translate(_ACCENTED))
+    visible += len(chunk)
+
+    padding = math.ceil(visible * expansion)
+    return f"[{''.join(parts)} {'~' * padding}]" if padding else f"[{''.join(parts)}]"
@@ -0,0 +1,339 @@
+"""
+TranslateCloud - Adaptive Rate Limiting and Retry Controller
+
+Shared by every DeepL call (sync worker path and async route path) so that
+throttling seen by one request slows down all of them.
+
+Features:
+- Error classification: throttled (429), server (5xx), network, quota (456),
+  auth (403), invalid (400/413) - only the first three are retried
+- Retry-After honoured (seconds), otherwise jittered exponential backoff
+  ("full jitter": uniform(0, min(max_delay, base_delay * 2^attempt)))
+- Shared cooldown: after a 429 every caller waits out the same pause
+- AIMD concurrency: +1/limit per success (about +1 per round of requests),
+  halved on throttling, between min_concurrency and max_concurrency
+
+Usage:
+    controller = get_rate_controller('deepl')
+
+    # Sync (SQS worker)
+    result = controller.call(translator.translate_text, texts, target_lang='ES')
+
+    # Async (FastAPI routes)
+    texts = await controller.call_async(client.translate, texts, 'ES')
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import deepl
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Error classes that are worth retrying (and worth an end-of-job retry pass)
+TRANSIENT_ERRORS = frozenset({'throttled', 'server', 'network'})
+
+
+def classify_error(error: Exception) -> str:
+    """
+    Classify a provider exception
+
+    Works with the official `deepl` exceptions (sync path) and
+    DeepLAPIError from the async client (anything with a `status` attribute).
+
+    Returns:
+        str: 'throttled' | 'server' | 'network' | 'quota' | 'auth' | 'invalid' | 'unknown'
+    """
+    if isinstance(error, deepl.TooManyRequestsException):
+        return 'throttled'
+    if isinstance(error, deepl.QuotaExceededException):
+        return 'quota'
+    if isinstance(error, deepl.AuthorizationException):
+        return 'auth'
+    if isinstance(error, (deepl.ConnectionException, asyncio.TimeoutError, ConnectionError)):
+        return 'network'
+
+    status = getattr(error, 'status', None) or getattr(error, 'http_status_code', None)
+
+    if status is None:
+        # DeepLAPIError without status = timeout / transport failure
+        return 'network' if hasattr(error, 'status') else 'unknown'
+    if status == 429:
+        return 'throttled'
+    if status == 456:
+        return 'quota'
+    if status in (401, 403):
+        return 'auth'
+    if status >= 500:
+        return 'server'
+    if status in (400, 413):
+        return 'invalid'
+    return 'unknown'
+
+
+def is_transient(error: Exception) -> bool:
+    """True if the error is worth retrying later"""
+    return classify_error(error) in TRANSIENT_ERRORS
+
+
+class AdaptiveRateController:
+    """
+    Retry policy + AIMD concurrency limit for one provider
+
+    Thread-safe. The in-flight count is shared by every event loop; async
+    callers wait on one asyncio.Condition per loop (conditions are bound to
+    the loop that created them) and a released slot wakes all loops.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_concurrency: int = 1,
+        max_concurrency: int = 8,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0
+    ):
+        """
+        Args:
+            name: Provider name (logging and stats)
+            min_concurrency: Lower bound of the adaptive limit
+            max_concurrency: Upper bound (and initial value) of the adaptive limit
+            max_retries: Retries per call for transient errors
+            base_delay: First backoff step in seconds
+            max_delay: Backoff and Retry-After cap in seconds
+        """
+        self.name = name
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._conditions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Condition]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._notify_tasks: set = set()  # strong references until they ran
+        self._stats = {
+            'calls': 0,
+            'successes': 0,
+            'retries': 0,
+            'throttled': 0,
+            'failures': 0
+        }
+
+    # ========================================================================
+    # Policy
+    # ========================================================================
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retry number `attempt` (0-based)
+
+        Retry-After wins when the provider sent one; otherwise full jitter.
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def record_success(self):
+        """Additive increase: about +1 to the limit per round of successful requests"""
+        with self._lock:
+            self._stats['successes'] += 1
+            self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+
+    def record_throttle(self, delay: float):
+        """Multiplicative decrease and a shared cooldown for every caller"""
+        with self._lock:
+            self._stats['throttled'] += 1
+            self._limit = max(self.min_concurrency, self._limit / 2)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+        logger.warning(f"{self.name} throttled: concurrency limit {int(self._limit)}, pausing {delay:.1f}s")
+
+    def cooldown_remaining(self) -> float:
+        """Seconds left of the shared cooldown"""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    # ========================================================================
+    # Execution
+    # ========================================================================
+
+    def call(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking provider call under the retry policy
+
+        Raises:
+            Exception: The last error when it is not transient or retries
+                       are exhausted
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+
+        for attempt in range(self.max_retries + 1):
+            time.sleep(self.cooldown_remaining())
+
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                delay = self._handle_error(e, attempt)
+                time.sleep(delay)
+                continue
+
+            self.record_success()
+            return result
+
+    async def call_async(self, function: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Async variant of call(): also waits for a slot under the adaptive
+        concurrency limit before each attempt
+
+        Raises:
+            Exception: Same as call()
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+
+        condition = self._get_condition()
+
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self.cooldown_remaining())
+
+            async with condition:
+                await condition.wait_for(self._try_acquire)
+
+            # The slot is freed on every exit, including cancellation
+            # (streams cancel their pending tasks, clients disconnect)
+            try:
+                result = await function(*args, **kwargs)
+            except Exception as e:
+                self._release()
+                delay = self._handle_error(e, attempt)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self._release()
+                raise
+
+            self._release()
+            self.record_success()
+            return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """calls, successes, retries, throttled, failures, concurrency_limit, in_flight, cooldown_seconds"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['concurrency_limit'] = int(self._limit)
+            stats['in_flight'] = self._in_flight
+
+        stats['cooldown_seconds'] = round(self.cooldown_remaining(), 2)
+        return stats
+
+    def _handle_error(self, error: Exception, attempt: int) -> float:
+        """
+        Account for a failed attempt and return the delay before the next one
+
+        Raises:
+            Exception: `error` itself when it must not be retried
+        """
+        kind = classify_error(error)
+
+        if kind not in TRANSIENT_ERRORS or attempt >= self.max_retries:
+            with self._lock:
+                self._stats['failures'] += 1
+            raise error
+
+        delay = self.backoff_delay(attempt, getattr(error, 'retry_after', None))
+
+        if kind == 'throttled':
+            self.record_throttle(delay)
+
+        with self._lock:
+            self._stats['retries'] += 1
+
+        logger.info(f"{self.name} {kind} error, retry {attempt + 1}/{self.max_retries} in {delay:.1f}s: {error}")
+        return delay
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Condition for the running event loop"""
+        loop = asyncio.get_running_loop()
+        condition = self._conditions.get(loop)
+
+        if condition is None:
+            condition = self._conditions[loop] = asyncio.Condition()
+
+        return condition
+
+    def _try_acquire(self) -> bool:
+        """Take an in-flight slot if one is free (wait_for predicate)"""
+        with self._lock:
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            return True
+
+    def _release(self):
+        """
+        Free an in-flight slot and wake the waiters of every event loop
+
+        Synchronous, so it cannot be interrupted by a second cancellation
+        while the slot is still counted.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            conditions = list(self._conditions.items())
+
+        for loop, condition in conditions:
+            try:
+                loop.call_soon_threadsafe(self._schedule_notify, loop, condition)
+            except RuntimeError:
+                # Loop already closed: nobody is waiting on it
+                pass
+
+    def _schedule_notify(self, loop: asyncio.AbstractEventLoop, condition: asyncio.Condition):
+        """Runs on `loop`: notify its waiters (the condition's lock must be held)"""
+        task = loop.create_task(self._notify(condition))
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
+    @staticmethod
+    async def _notify(condition: asyncio.Condition):
+        async with condition:
+            condition.notify_all()
+
+
+# ============================================================================
+# Shared Controllers
+# ============================================================================
+
+_controllers: Dict[str, AdaptiveRateController] = {}
+
+
+def get_rate_controller(name: str) -> AdaptiveRateController:
+    """Get (or create) the shared controller for a provider"""
+    controller = _controllers.get(name)
+
+    if controller is None:
+        controller = AdaptiveRateController(
+            name,
+            max_concurrency=settings.DEEPL_MAX_CONCURRENT_REQUESTS,
+            max_retries=settings.PROVIDER_MAX_RETRIES,
+            max_delay=settings.PROVIDER_MAX_BACKOFF_SECONDS
+        )
+        _controllers[name] = controller
+
+    return controller
@@ -0,0 +1,183 @@
+"""
+SentenceSegmenter - Splits element text into sentences with offsets
+
+Extracted elements are whole blocks (a <p>, an <li>, ...). Translating and
+caching them whole means a paragraph that changed by one sentence misses the
+cache and translation memory and is billed again in full. TranslationService
+splits every text into sentences, translates/caches those and reassembles
+the translations at the original offsets.
+
+Rules:
+    - Boundary: sentence terminator (. ! ? …), optional closing quotes or
+      brackets, whitespace, then more text
+    - CJK terminators (。！？) end a sentence without trailing whitespace
+    - Not a boundary: known abbreviations of the source language ("Dr.",
+      "z.B.", "Sra."), single-letter initials ("J. Smith") and a period
+      followed by a lowercase letter
+    - Decimals, URLs, e-mails and placeholder tokens never contain
+      "terminator + whitespace", so they are never split
+
+Performance: one precompiled regex scan per text, texts without an inner
+terminator return immediately (tens of thousands of elements per job).
+"""
+
+import re
+from typing import Dict, FrozenSet, List, Tuple
+
+# Abbreviations (lowercase, including the final period) per source language
+_COMMON_ABBREVIATIONS = frozenset({
+    'etc.', 'vs.', 'e.g.', 'i.e.', 'approx.', 'no.', 'nr.', 'fig.', 'vol.', 'p.', 'pp.', 'ca.',
+})
+
+ABBREVIATIONS: Dict[str, FrozenSet[str]] = {
+    'en': _COMMON_ABBREVIATIONS | {
+        'mr.', 'mrs.', 'ms.', 'dr.', 'prof.', 'sr.', 'jr.', 'st.', 'mt.', 'inc.', 'ltd.', 'co.',
+        'corp.', 'dept.', 'est.', 'jan.', 'feb.', 'mar.', 'apr.', 'jun.', 'jul.', 'aug.', 'sep.',
+        'sept.', 'oct.', 'nov.', 'dec.', 'a.m.', 'p.m.', 'u.s.', 'u.k.',
+    },
+    'es': _COMMON_ABBREVIATIONS | {
+        'sr.', 'sra.', 'srta.', 'dr.', 'dra.', 'lic.', 'ing.', 'prof.', 'av.', 'avda.', 'pág.',
+        'núm.', 'tel.', 'ud.', 'uds.', 'dto.', 'admón.', 'aprox.', 'cía.', 's.a.', 'ee.uu.',
+    },
+    'fr': _COMMON_ABBREVIATIONS | {
+        'm.', 'mm.', 'mme.', 'mmes.', 'mlle.', 'dr.', 'pr.', 'av.', 'bd.', 'cf.', 'env.', 'tél.',
+    },
+    'de': _COMMON_ABBREVIATIONS | {
+        'z.b.', 'u.a.', 'usw.', 'bzw.', 'ca.', 'dr.', 'prof.', 'hr.', 'fr.', 'str.', 'tel.',
+        'inkl.', 'evtl.', 'ggf.', 'vgl.', 'd.h.', 'gmbh.', 'bspw.',
+    },
+    'it': _COMMON_ABBREVIATIONS | {
+        'sig.', 'sig.ra', 'dott.', 'ing.', 'avv.', 'prof.', 'tel.', 'pag.', 'ecc.',
+    },
+    'pt': _COMMON_ABBREVIATIONS | {
+        'sr.', 'sra.', 'dr.', 'dra.', 'prof.', 'av.', 'pág.', 'tel.', 'lda.',
+    },
+    'nl': _COMMON_ABBREVIATIONS | {
+        'dhr.', 'mevr.', 'dr.', 'prof.', 'bijv.', 'o.a.', 'enz.', 'blz.', 'tel.',
+    },
+}
+
+# Latin-script boundary: terminator(s), closing quotes/brackets, whitespace
+# and a following non-space character (lookahead - not consumed)
+_LATIN_BOUNDARY = re.compile(r'([.!?…]+)(["\'”’»)\]]*)\s+(?=\S)')
+
+# CJK boundary: full-width terminator(s) and closing brackets, optional spaces
+_CJK_BOUNDARY = re.compile(r'[。！？]+[」』”’)）]*\s*(?=\S)')
+
+# Cheap pre-check: any terminator at all before the last character
+_TERMINATOR = re.compile(r'[.!?…。！？].')
+
+_INITIAL = re.compile(r'^[A-Za-z]$')
+
+
+class SentenceSegmenter:
+    """
+    Language-aware sentence splitter that keeps character offsets
+
+    Usage:
+        >>> text = "Welcome to Acme. Dr. Smith will see you. Call now!"
+        >>> spans = SentenceSegmenter.split(text, 'en')
+        >>> [text[start:end] for start, end in spans]
+        ['Welcome to Acme.', 'Dr. Smith will see you.', 'Call now!']
+        >>> SentenceSegmenter.join(text, spans, ['Bienvenido a Acme.', 'El Dr. Smith le atenderá.', '¡Llame ya!'])
+        'Bienvenido a Acme. El Dr. Smith le atenderá. ¡Llame ya!'
+    """
+
+    @staticmethod
+    def split(text: str, lang: str = 'auto') -> List[Tuple[int, int]]:
+        """
+        Split text into sentences
+
+        Args:
+            text: Element text
+            lang: Source language code (selects abbreviations; 'auto' uses
+                  the common set)
+
+        Returns:
+            List of (start, end) character offsets into `text`, one per
+            sentence, leading/trailing whitespace excluded. Texts that are
+            empty or whitespace only return [].
+        """
+        start = len(text) - len(text.lstrip())
+        end = len(text.rstrip())
+
+        if start >= end:
+            return []
+
+        if not _TERMINATOR.search(text, start, end):
+            return [(start, end)]
+
+        abbreviations = ABBREVIATIONS.get(lang.lower()[:2], _COMMON_ABBREVIATIONS)
+        boundaries = [
+            (match.end(2), match.end())
+            for match in _LATIN_BOUNDARY.finditer(text, start, end)
+            if SentenceSegmenter._is_boundary(text, match, abbreviations)
+        ]
+        boundaries.extend(
+            (len(match.group(0).rstrip()) + match.start(), match.end())
+            for match in _CJK_BOUNDARY.finditer(text, start, end)
+        )
+
+        if not boundaries:
+            return [(start, end)]
+
+        spans = []
+        for sentence_end, next_start in sorted(boundaries):
+            if sentence_end > start:
+                spans.append((start, sentence_end))
+            start = max(start, next_start)
+        spans.append((start, end))
+
+        return spans
+
+    @staticmethod
+    def sentences(text: str, lang: str = 'auto') -> List[str]:
+        """Sentence strings of `text` (see split())"""
+        return [text[start:end] for start, end in SentenceSegmenter.split(text, lang)]
+
+    @staticmethod
+    def join(text: str, spans: List[Tuple[int, int]], translations: List[str]) -> str:
+        """
+        Replace each sentence span of `text` with its translation
+
+        Whitespace between and around sentences is kept from the original.
+
+        Args:
+            text: Original text passed to split()
+            spans: Offsets returned by split()
+            translations: One translation per span
+
+        Returns:
+            str: Reassembled translated text
+        """
+        parts = []
+        position = 0
+
+        for (start, end), translation in zip(spans, translations):
+            parts.append(text[position:start])
+            parts.append(translation)
+            position = end
+
+        parts.append(text[position:])
+        return ''.join(parts)
+
+    @staticmethod
+    def _is_boundary(text: str, match: re.Match, abbreviations: FrozenSet[str]) -> bool:
+        """Reject abbreviation, initial and lowercase-continuation false positives"""
+        next_char = text[match.end()]
+
+        # "... and so on. then" / "approx. three" - not a new sentence
+        if next_char.islower():
+            return False
+
+        if match.group(1) != '.':
+            return True
+
+        # Word before the period (back to the previous whitespace)
+        word_start = max(text.rfind(' ', 0, match.start()), text.rfind('\n', 0, match.start())) + 1
+        word = text[word_start:match.start()].lstrip('(["\'“‘«¿¡')
+
+        if _INITIAL.match(word):
+            return False
+
+        return (word.lower() + '.') not in abbreviations
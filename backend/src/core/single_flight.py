@@ -0,0 +1,188 @@
+"""
+TranslateCloud - Single-Flight Request Coalescing
+
+Identical work that is already in flight is not started again: the first
+caller for a key becomes the leader and does the work, concurrent callers
+for the same key wait for the leader's result.
+
+Used for:
+- Translation segments (TranslationService): several users translating the
+  same marketing string into the same language at once cost one DeepL call,
+  keyed by (language pair, tag handling, normalized segment)
+- Page crawls (WebExtractor.crawl_page): concurrent crawls of the same URL
+  make one HTTP request
+
+Waiters may be threads (sync pipeline, SQS worker) or coroutines (FastAPI
+routes) - a leader on the event loop can serve followers in worker threads
+and the other way round. A leader that fails or is cancelled publishes
+None; followers then do the work themselves.
+
+Usage:
+    >>> flights = get_single_flight('crawl')
+    >>> page, shared = flights.do(url, lambda: fetch(url))
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Flight:
+    """One in-flight unit of work; resolved exactly once by its leader"""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._futures: list = []  # (loop, future) of waiting coroutines
+        self.result: Any = None
+
+    def resolve(self, result: Any):
+        """Publish the leader's result (None = leader gave up) and wake all waiters"""
+        with self._lock:
+            self.result = result
+            self._done.set()
+            futures, self._futures = self._futures, []
+
+        for loop, future in futures:
+            try:
+                loop.call_soon_threadsafe(_set_result, future, result)
+            except RuntimeError:
+                # Waiter's event loop already closed
+                pass
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """Block until resolved; None if the leader gave up or on timeout"""
+        if not self._done.wait(timeout):
+            return None
+        return self.result
+
+    async def wait_async(self, timeout: Optional[float] = None) -> Any:
+        """Await resolution without blocking the event loop; None on timeout"""
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            if self._done.is_set():
+                return self.result
+            future = loop.create_future()
+            self._futures.append((loop, future))
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+def _set_result(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
+
+
+class SingleFlight:
+    """
+    Registry of in-flight work by key
+
+    Thread-safe. Callers either use do() (sync convenience) or the
+    acquire()/release() pair, which lets a batch lead some keys and follow
+    others. A leader must always release(), also on errors - otherwise its
+    followers wait until their timeout.
+    """
+
+    def __init__(self, name: str, timeout: Optional[float] = None):
+        """
+        Args:
+            name: Group name (logs and stats)
+            timeout: Maximum seconds a follower waits before doing the work itself
+        """
+        self.name = name
+        self.timeout = timeout
+        self._flights: Dict[Hashable, Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = {'leaders': 0, 'coalesced': 0, 'abandoned': 0}
+
+    def acquire(self, key: Hashable) -> Tuple[Flight, bool]:
+        """
+        Join the flight for `key`, starting it if none is in flight
+
+        Returns:
+            tuple: (flight, is_leader)
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._stats['coalesced'] += 1
+                return flight, False
+
+            flight = Flight()
+            self._flights[key] = flight
+            self._stats['leaders'] += 1
+            return flight, True
+
+    def release(self, key: Hashable, flight: Flight, result: Any):
+        """End a flight led by the caller and hand `result` to its followers"""
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if result is None:
+                self._stats['abandoned'] += 1
+
+        flight.resolve(result)
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run `function` once for concurrent callers with the same key
+
+        Followers whose leader failed (raised or returned None) run
+        `function` themselves.
+
+        Returns:
+            tuple: (result, shared) - shared is True if another caller's
+                   result was returned (do not mutate it)
+        """
+        flight, leader = self.acquire(key)
+
+        if not leader:
+            result = flight.wait(self.timeout)
+            if result is not None:
+                return result, True
+            return function(), False
+
+        result = None
+        try:
+            result = function()
+            return result, False
+        finally:
+            self.release(key, flight, result)
+
+    def get_stats(self) -> Dict[str, int]:
+        """leaders, coalesced (followers served or waiting), abandoned, in_flight"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._flights)
+        return stats
+
+
+# ============================================================================
+# Shared Groups
+# ============================================================================
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_single_flight(name: str, timeout: Optional[float] = None) -> SingleFlight:
+    """
+    Get the process-wide SingleFlight group for `name`
+
+    Routes create a TranslationService (and extractors) per request, so
+    coalescing state must live at module level to span requests.
+    """
+    with _groups_lock:
+        if name not in _groups:
+            _groups[name] = SingleFlight(name, timeout=timeout)
+        return _groups[name]
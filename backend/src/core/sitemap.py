@@ -0,0 +1,200 @@
+"""
+TranslateCloud - Sitemap Discovery
+
+Seeds a crawl with the site's own page list instead of discovering pages
+one fetch at a time through <a href> links:
+
+- Sitemaps listed in robots.txt (Sitemap: lines), else /sitemap.xml
+- Sitemap indexes (<sitemapindex>) are followed, up to CRAWL_MAX_SITEMAPS
+  files per crawl
+- Gzipped sitemaps (.xml.gz served without Content-Encoding) are
+  decompressed; plain-text sitemaps (one URL per line) are accepted too
+- Page URLs are kept only for the crawled host, deduplicated and ordered by
+  <lastmod>, newest first (undated pages last, in sitemap order), so
+  max_pages keeps the most recently changed pages
+
+The collector does no I/O: the sync crawler (WebExtractor) and the async
+one (WebCrawler) fetch each sitemap with their own client and feed the
+bytes back.
+
+Usage:
+    >>> collector = SitemapCollector(start_url, robots.site_maps())
+    >>> while (sitemap_url := collector.next()):
+    ...     collector.feed(sitemap_url, fetch(sitemap_url))
+    >>> urls = collector.urls()
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import gzip
+import io
+import logging
+import xml.etree.ElementTree as ElementTree
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Protocol limits: 50,000 URLs and 50 MB (uncompressed) per sitemap file
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+MAX_URLS_PER_SITEMAP = 50_000
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def parse_sitemap(content: bytes) -> Tuple[List[Tuple[str, Optional[float]]], List[str]]:
+    """
+    Parse one sitemap file (XML urlset or sitemapindex, gzipped or not, or plain text)
+
+    Returns:
+        tuple: ([(page url, lastmod timestamp or None)], [child sitemap urls])
+    """
+    if content[:2] == GZIP_MAGIC:
+        try:
+            with gzip.GzipFile(fileobj=io.BytesIO(content)) as compressed:
+                content = compressed.read(MAX_SITEMAP_BYTES + 1)
+        except (OSError, EOFError) as e:
+            logger.warning(f"Invalid gzipped sitemap: {e}")
+            return [], []
+
+    if len(content) > MAX_SITEMAP_BYTES:
+        logger.warning("Sitemap larger than 50 MB, ignoring the rest")
+        content = content[:MAX_SITEMAP_BYTES]
+
+    # XML (possibly after a UTF-8 BOM) or plain text
+    if content.lstrip(b'\xef\xbb\xbf \t\r\n')[:1] != b'<':
+        return _parse_text(content), []
+
+    pages: List[Tuple[str, Optional[float]]] = []
+    children: List[str] = []
+    loc = lastmod = None
+
+    try:
+        for _, element in ElementTree.iterparse(io.BytesIO(content)):
+            # Namespaces vary ({http://www.sitemaps.org/...}, none, legacy Google)
+            tag = element.tag.rsplit('}', 1)[-1]
+
+            if tag == 'loc':
+                loc = (element.text or '').strip()
+            elif tag == 'lastmod':
+                lastmod = (element.text or '').strip()
+            elif tag in ('url', 'sitemap'):
+                if loc:
+                    if tag == 'sitemap':
+                        children.append(loc)
+                    elif len(pages) < MAX_URLS_PER_SITEMAP:
+                        pages.append((loc, _parse_lastmod(lastmod)))
+                loc = lastmod = None
+                element.clear()
+
+    except ElementTree.ParseError as e:
+        # Keep what was parsed before the error
+        logger.warning(f"Invalid sitemap XML: {e}")
+
+    return pages, children
+
+
+def _parse_text(content: bytes) -> List[Tuple[str, Optional[float]]]:
+    """Plain-text sitemap: one absolute URL per line"""
+    lines = content.decode('utf-8', errors='replace').splitlines()
+    return [
+        (line.strip(), None)
+        for line in lines[:MAX_URLS_PER_SITEMAP]
+        if line.strip().startswith(('http://', 'https://'))
+    ]
+
+
+def _parse_lastmod(value: Optional[str]) -> Optional[float]:
+    """W3C datetime (2025-10-01, 2025-10-01T12:00:00Z, ...) as a UTC timestamp"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class SitemapCollector:
+    """
+    Sitemap files still to fetch and the page URLs found so far, for one crawl
+    """
+
+    def __init__(
+        self,
+        start_url: str,
+        sitemap_urls: Optional[Iterable[str]] = None,
+        normalize: Optional[Callable[[str], str]] = None,
+        accept: Optional[Callable[[str], bool]] = None,
+        max_sitemaps: Optional[int] = None
+    ):
+        """
+        Args:
+            start_url: First page of the crawl (its host bounds the page URLs)
+            sitemap_urls: Sitemaps from robots.txt (default: /sitemap.xml)
+            normalize: Crawler's URL normalization (deduplication)
+            accept: Extra filter for page URLs (e.g. not should_skip_url)
+            max_sitemaps: Sitemap files fetched at most (default: CRAWL_MAX_SITEMAPS)
+        """
+        parsed = urlparse(start_url)
+        self.host = parsed.netloc
+        self.normalize = normalize or (lambda url: url)
+        self.accept = accept or (lambda url: True)
+        self.max_sitemaps = settings.CRAWL_MAX_SITEMAPS if max_sitemaps is None else max_sitemaps
+
+        self._queue: deque = deque()
+        self._queued: set = set()
+        self._fetched = 0
+        self._pages: dict = {}  # url -> (lastmod, position)
+
+        for sitemap_url in sitemap_urls or [f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"]:
+            self._enqueue(sitemap_url)
+
+    def next(self) -> Optional[str]:
+        """Next sitemap to fetch, None when done (or the file limit is reached)"""
+        if not self._queue or self._fetched >= self.max_sitemaps:
+            return None
+        self._fetched += 1
+        return self._queue.popleft()
+
+    def feed(self, sitemap_url: str, content: Optional[bytes]):
+        """Add a fetched sitemap (None or b'' if the fetch failed)"""
+        if not content:
+            return
+
+        pages, children = parse_sitemap(content)
+
+        for child in children:
+            self._enqueue(child)
+
+        for url, lastmod in pages:
+            if urlparse(url).netloc != self.host or not self.accept(url):
+                continue
+            url = self.normalize(url)
+            if url not in self._pages:
+                self._pages[url] = (lastmod, len(self._pages))
+
+        logger.info(f"Sitemap {sitemap_url}: {len(pages)} URLs, {len(children)} sitemaps")
+
+    def urls(self) -> List[str]:
+        """Page URLs, most recently modified first (undated last, sitemap order)"""
+        return sorted(
+            self._pages,
+            key=lambda url: (
+                self._pages[url][0] is None,
+                -(self._pages[url][0] or 0.0),
+                self._pages[url][1],
+            )
+        )
+
+    def _enqueue(self, sitemap_url: str):
+        if urlparse(sitemap_url).scheme in ('http', 'https') and sitemap_url not in self._queued:
+            self._queued.add(sitemap_url)
+            self._queue.append(sitemap_url)
@@ -0,0 +1,427 @@
+"""
+TranslateCloud - Tiered Translation Cache
+
+Container-local cache checked by TranslationService before the Postgres
+translation memory. Warm API and worker Lambdas keep re-translating the same
+UI strings, titles and navigation labels; this serves them without a network
+round trip.
+
+Tiers:
+    1. In-process LRU with TTL (OrderedDict, bounded by entry count)
+    2. SQLite file under /tmp (bounded by size, survives warm invocations
+       of the same container even after tier 1 evicted an entry)
+
+Keys are (source_lang, target_lang, SHA-256 of the normalized segment) - the
+same normalization as the translation memory
+(PlaceholderProtector.normalize_segment), so protected placeholders and
+whitespace differences still hit.
+
+Configuration (Settings):
+    TRANSLATION_CACHE_ENABLED       - Turn both tiers on/off
+    TRANSLATION_CACHE_MAX_ENTRIES   - Tier 1 size cap (entries)
+    TRANSLATION_CACHE_TTL_SECONDS   - Entry lifetime in both tiers
+    TRANSLATION_DISK_CACHE_PATH     - Tier 2 SQLite file ('' disables tier 2)
+    TRANSLATION_DISK_CACHE_MAX_MB   - Tier 2 size cap
+
+Usage:
+    >>> cache = get_translation_cache()
+    >>> cache.store_many([("Sign in", "Iniciar sesión")], "en", "es")
+    >>> cache.lookup_many(["Sign in", "Sign out"], "en", "es")
+    {0: 'Iniciar sesión'}
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.config.settings import settings
+from src.core.placeholder_protector import PlaceholderProtector
+from src.core.translation_memory import TranslationMemory
+
+logger = logging.getLogger(__name__)
+
+# Disk tier: recount the stored size from SQLite after this many writes (the
+# running total misses writes by other processes sharing the file)
+SIZE_RECOUNT_EVERY = 100
+
+# SQLite limits bound parameters per statement (999 on old builds)
+SQLITE_MAX_PARAMETERS = 500
+
+
+class LRUTTLCache:
+    """
+    Thread-safe in-memory LRU cache with per-entry expiry
+
+    Eviction:
+        - Least recently used entry when max_entries is exceeded
+        - Expired entries on access
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 86400):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value or None (moves the entry to MRU position)"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        """Insert or refresh an entry (default lifetime: ttl_seconds), evicting LRU entries over the cap"""
+        with self._lock:
+            lifetime = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+            self._entries[key] = (value, time.time() + lifetime)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """hits, misses, evictions, expirations, entries, max_entries"""
+        with self._lock:
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries
+            }
+
+
+class DiskTranslationCache:
+    """
+    SQLite-backed cache under /tmp, bounded by total value size
+
+    When the stored values exceed max_bytes, least recently accessed entries
+    are deleted until the cache is back under 90% of the cap. The stored size
+    is kept as a running total (recounted every SIZE_RECOUNT_EVERY writes and
+    before evicting), so writes do not scan the table.
+    """
+
+    def __init__(self, path: str, max_bytes: int, ttl_seconds: float = 86400):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS translation_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            '''
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_translation_cache_last_access ON translation_cache(last_access)'
+        )
+
+        self._size = self._count_size()
+        self._writes = 0
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Return {key: value} for the keys present and not expired"""
+        if not keys:
+            return {}
+
+        now = time.time()
+        found: Dict[str, str] = {}
+        unique_keys = list(set(keys))
+
+        with self._lock:
+            for start in range(0, len(unique_keys), SQLITE_MAX_PARAMETERS):
+                chunk = unique_keys[start:start + SQLITE_MAX_PARAMETERS]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT key, value, size, expires_at FROM translation_cache WHERE key IN ({placeholders})',
+                    chunk
+                ).fetchall()
+
+                expired = [(key, size) for key, _, size, expires_at in rows if expires_at < now]
+                found.update({key: value for key, value, _, expires_at in rows if expires_at >= now})
+
+                if expired:
+                    self._conn.executemany('DELETE FROM translation_cache WHERE key = ?', [(k,) for k, _ in expired])
+                    self._size -= sum(size for _, size in expired)
+                    self._stats['expirations'] += len(expired)
+
+            if found:
+                self._conn.executemany(
+                    'UPDATE translation_cache SET last_access = ? WHERE key = ?',
+                    [(now, key) for key in found]
+                )
+
+            self._stats['hits'] += len(found)
+            self._stats['misses'] += len(unique_keys) - len(found)
+
+        return found
+
+    def set_many(self, items: Dict[str, str], ttl_seconds: Optional[float] = None):
+        """Insert or refresh entries (default lifetime: ttl_seconds), then enforce the size cap"""
+        if not items:
+            return
+
+        now = time.time()
+        expires_at = now + (self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds))
+        rows = [
+            (key, value, len(key) + len(value.encode('utf-8')), expires_at, now)
+            for key, value in items.items()
+        ]
+
+        with self._lock:
+            try:
+                self._conn.execute('BEGIN')
+                replaced = self._stored_size(list(items))
+                self._conn.executemany(
+                    '''
+                    INSERT INTO translation_cache (key, value, size, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        value = excluded.value, size = excluded.size,
+                        expires_at = excluded.expires_at, last_access = excluded.last_access
+                    ''',
+                    rows
+                )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                # Never leave the shared connection inside a failed transaction
+                if self._conn.in_transaction:
+                    self._conn.execute('ROLLBACK')
+                raise
+
+            self._size += sum(row[2] for row in rows) - replaced
+            self._writes += 1
+
+            if self._size > self.max_bytes or self._writes % SIZE_RECOUNT_EVERY == 0:
+                self._enforce_size_cap()
+
+    def _stored_size(self, keys: List[str]) -> int:
+        """Size of the entries already stored under `keys` (lock held)"""
+        size = 0
+        for start in range(0, len(keys), SQLITE_MAX_PARAMETERS):
+            chunk = keys[start:start + SQLITE_MAX_PARAMETERS]
+            placeholders = ','.join('?' * len(chunk))
+            size += self._conn.execute(
+                f'SELECT COALESCE(SUM(size), 0) FROM translation_cache WHERE key IN ({placeholders})',
+                chunk
+            ).fetchone()[0]
+        return size
+
+    def _count_size(self) -> int:
+        """Stored size recounted from the table (full scan)"""
+        return self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM translation_cache').fetchone()[0]
+
+    def _enforce_size_cap(self):
+        """Delete least recently accessed entries while over max_bytes (lock held)"""
+        total = self._size = self._count_size()
+
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+
+        for key, size in self._conn.execute(
+            'SELECT key, size FROM translation_cache ORDER BY last_access'
+        ).fetchall():
+            if total <= target:
+                break
+            self._conn.execute('DELETE FROM translation_cache WHERE key = ?', (key,))
+            total -= size
+            evicted += 1
+
+        self._size = total
+        self._stats['evictions'] += evicted
+        logger.info(f"Disk translation cache over {self.max_bytes} bytes: evicted {evicted} entries")
+
+    def get_stats(self) -> Dict[str, int]:
+        """hits, misses, evictions, expirations, entries, size_bytes, max_bytes"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM translation_cache'
+            ).fetchone()
+            return {
+                **self._stats,
+                'entries': entries,
+                'size_bytes': size,
+                'max_bytes': self.max_bytes
+            }
+
+
+class TieredTranslationCache:
+    """
+    Memory tier in front of an optional disk tier
+
+    Same lookup_many/store_many interface as TranslationMemory so
+    TranslationService can treat both as ordered lookup stores.
+    """
+
+    def __init__(self, memory: LRUTTLCache, disk: Optional[DiskTranslationCache] = None):
+        self.memory = memory
+        self.disk = disk
+
+    @staticmethod
+    def _key(segment: str, source_lang: str, target_lang: str) -> str:
+        """Cache key for a normalized segment"""
+        return f"{source_lang.lower()}:{target_lang.lower()}:{TranslationMemory.segment_hash(segment)}"
+
+    def lookup_many(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> Dict[int, str]:
+        """
+        Look up segments in memory, then on disk (disk hits are promoted)
+
+        Returns:
+            Dict[int, str]: Index into `texts` -> cached translation, with
+                            placeholder tokens mapped back to this call's tokens
+        """
+        normalized = [PlaceholderProtector.normalize_segment(text) for text in texts]
+        keys = [self._key(segment, source_lang, target_lang) for segment, _ in normalized]
+
+        values: Dict[str, str] = {}
+        for key in set(keys):
+            value = self.memory.get(key)
+            if value is not None:
+                values[key] = value
+
+        if self.disk:
+            missing = [key for key in set(keys) if key not in values]
+            try:
+                from_disk = self.disk.get_many(missing)
+            except Exception as e:
+                logger.warning(f"Disk translation cache lookup failed: {e}")
+                from_disk = {}
+
+            for key, value in from_disk.items():
+                self.memory.set(key, value)
+            values.update(from_disk)
+
+        return {
+            index: PlaceholderProtector.denormalize_tokens(values[key], tokens)
+            for index, (key, (_, tokens)) in enumerate(zip(keys, normalized))
+            if key in values
+        }
+
+    def store_many(
+        self,
+        entries: List[Tuple[str, str]],
+        source_lang: str,
+        target_lang: str,
+        provider: Optional[str] = None,
+        ttl_seconds: Optional[float] = None
+    ) -> int:
+        """
+        Store (source, translation) pairs in both tiers
+
+        Args:
+            ttl_seconds: Shorter lifetime for these entries (e.g. fallback
+                         provider output); default: the tiers' TTL
+
+        Returns:
+            int: Number of entries stored
+        """
+        items: Dict[str, str] = {}
+
+        for source_text, translated_text in entries:
+            segment, tokens = PlaceholderProtector.normalize_segment(source_text)
+            if segment and translated_text:
+                items[self._key(segment, source_lang, target_lang)] = (
+                    PlaceholderProtector.canonicalize_tokens(translated_text, tokens)
+                )
+
+        for key, value in items.items():
+            self.memory.set(key, value, ttl_seconds)
+
+        if self.disk:
+            try:
+                self.disk.set_many(items, ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Disk translation cache store failed: {e}")
+
+        return len(items)
+
+    def get_stats(self) -> Dict[str, Optional[Dict[str, int]]]:
+        """Per-tier statistics: {'memory': {...}, 'disk': {...} or None}"""
+        disk_stats = None
+        if self.disk:
+            try:
+                disk_stats = self.disk.get_stats()
+            except Exception as e:
+                logger.warning(f"Disk translation cache stats failed: {e}")
+
+        return {'memory': self.memory.get_stats(), 'disk': disk_stats}
+
+
+# ============================================================================
+# Shared Instance
+# ============================================================================
+
+# Module level so the cache outlives the per-request TranslationService
+# instances and stays warm for the lifetime of the Lambda container
+_translation_cache: Optional[TieredTranslationCache] = None
+
+
+def get_translation_cache() -> Optional[TieredTranslationCache]:
+    """Get the shared tiered cache, or None if TRANSLATION_CACHE_ENABLED is false"""
+    global _translation_cache
+
+    if not settings.TRANSLATION_CACHE_ENABLED:
+        return None
+
+    if _translation_cache is None:
+        disk = None
+        if settings.TRANSLATION_DISK_CACHE_PATH:
+            try:
+                disk = DiskTranslationCache(
+                    settings.TRANSLATION_DISK_CACHE_PATH,
+                    max_bytes=settings.TRANSLATION_DISK_CACHE_MAX_MB * 1024 * 1024,
+                    ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS
+                )
+            except Exception as e:
+                # Read-only filesystem, corrupt file, ... - memory tier only
+                logger.warning(f"Disk translation cache unavailable: {e}")
+
+        _translation_cache = TieredTranslationCache(
+            LRUTTLCache(
+                max_entries=settings.TRANSLATION_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS
+            ),
+            disk
+        )
+
+    return _translation_cache
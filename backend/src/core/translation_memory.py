@@ -0,0 +1,303 @@
+"""
+TranslateCloud - Translation Memory (TM)
+
+Persistent store of every segment we have already paid a provider to
+translate, checked by TranslationService before calling DeepL or MarianMT.
+Only the primary provider's translations are stored (DeepL when
+configured): fallback output would otherwise be served instead of DeepL
+forever after an outage.
+
+Storage:
+    PostgreSQL table `translation_memory`
+    (migration: scripts/database/add-translation-memory.sql)
+
+    Key: (source_lang, target_lang, source_hash)
+    source_hash = SHA-256 of the normalized source segment, see
+    PlaceholderProtector.normalize_segment() - whitespace and placeholder
+    tokens do not cause misses.
+
+Features:
+    - Bulk lookup: one SELECT per batch (source_hash = ANY(...))
+    - Bulk upsert: one INSERT ... ON CONFLICT per batch (execute_values)
+    - MarianMT entries never overwrite DeepL entries
+    - Hit/miss counters and DeepL characters saved (get_stats)
+
+Error Handling:
+    The TM is an optimization: database errors are logged and treated as
+    misses (lookup) or skipped (store). Translation never fails because of it.
+
+Usage:
+    >>> tm = get_translation_memory()
+    >>> tm.lookup_many(["Hello", "Goodbye"], "en", "es")
+    {0: 'Hola'}
+    >>> tm.store_many([("Goodbye", "Adiós")], "en", "es", provider="deepl")
+    1
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from psycopg2.extras import execute_values
+
+from src.config.database import Database
+from src.config.settings import settings
+from src.core.placeholder_protector import PlaceholderProtector
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationMemory:
+    """
+    Postgres-backed exact-match translation memory
+
+    Uses its own Database connection so TM writes are committed
+    independently of the request transaction opened by get_db().
+    """
+
+    def __init__(self, database: Optional[Database] = None):
+        """
+        Args:
+            database: Database connection manager (default: a dedicated one)
+        """
+        self.database = database or Database()
+        self._lock = threading.Lock()
+        self._stats = {
+            'lookups': 0,
+            'hits': 0,
+            'misses': 0,
+            'characters_saved': 0,
+            'stored': 0,
+            'errors': 0
+        }
+
+    @staticmethod
+    def segment_hash(normalized_text: str) -> str:
+        """SHA-256 hex digest of a normalized segment"""
+        return hashlib.sha256(normalized_text.encode('utf-8')).hexdigest()
+
+    def lookup_many(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> Dict[int, str]:
+        """
+        Look up many segments in one query
+
+        Args:
+            texts: Source segments (raw or protected by PlaceholderProtector)
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Dict[int, str]: Index into `texts` -> stored translation, with
+                            placeholder tokens mapped back to this call's
+                            tokens. Misses are absent.
+        """
+        if not texts:
+            return {}
+
+        normalized = [PlaceholderProtector.normalize_segment(text) for text in texts]
+        hashes = [self.segment_hash(segment) for segment, _ in normalized]
+
+        try:
+            with self._lock:
+                cursor = self.database.get_cursor()
+                try:
+                    cursor.execute(
+                        '''
+                        SELECT source_hash, translated_text FROM translation_memory
+                        WHERE source_lang = %s AND target_lang = %s AND source_hash = ANY(%s)
+                        ''',
+                        (source_lang.lower(), target_lang.lower(), list(set(hashes)))
+                    )
+                    rows = cursor.fetchall()
+                    self.database.conn.commit()
+                finally:
+                    cursor.close()
+
+        except Exception as e:
+            logger.warning(f"Translation memory lookup failed: {e}")
+            self._rollback()
+            self._record(lookups=len(texts), misses=len(texts), errors=1)
+            return {}
+
+        stored = {row['source_hash']: row['translated_text'] for row in rows}
+        found: Dict[int, str] = {}
+
+        for index, (segment_hash, (_, tokens)) in enumerate(zip(hashes, normalized)):
+            if segment_hash in stored:
+                found[index] = PlaceholderProtector.denormalize_tokens(stored[segment_hash], tokens)
+
+        self._record(
+            lookups=len(texts),
+            hits=len(found),
+            misses=len(texts) - len(found),
+            characters_saved=sum(len(texts[index]) for index in found)
+        )
+
+        return found
+
+    def store_many(
+        self,
+        entries: List[Tuple[str, str]],
+        source_lang: str,
+        target_lang: str,
+        provider: str
+    ) -> int:
+        """
+        Insert or update many (source, translation) pairs in one statement
+
+        Args:
+            entries: (source_text, translated_text) pairs
+            source_lang: Source language code
+            target_lang: Target language code
+            provider: Provider that produced the translations ('deepl', 'marian')
+
+        Returns:
+            int: Number of entries written (0 on error)
+        """
+        rows = {}
+
+        for source_text, translated_text in entries:
+            segment, tokens = PlaceholderProtector.normalize_segment(source_text)
+            if not segment or not translated_text:
+                continue
+
+            segment_hash = self.segment_hash(segment)
+            rows[segment_hash] = (
+                source_lang.lower(),
+                target_lang.lower(),
+                segment_hash,
+                segment,
+                PlaceholderProtector.canonicalize_tokens(translated_text, tokens),
+                provider,
+                len(segment)
+            )
+
+        if not rows:
+            return 0
+
+        try:
+            with self._lock:
+                cursor = self.database.get_cursor()
+                try:
+                    # Never replace a DeepL translation with a MarianMT one
+                    execute_values(
+                        cursor,
+                        '''
+                        INSERT INTO translation_memory
+                        (source_lang, target_lang, source_hash, source_text, translated_text, provider, char_count)
+                        VALUES %s
+                        ON CONFLICT (source_lang, target_lang, source_hash) DO UPDATE
+                        SET translated_text = EXCLUDED.translated_text,
+                            provider = EXCLUDED.provider,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE translation_memory.provider <> 'deepl' OR EXCLUDED.provider = 'deepl'
+                        ''',
+                        list(rows.values())
+                    )
+                    self.database.conn.commit()
+                finally:
+                    cursor.close()
+
+        except Exception as e:
+            logger.warning(f"Translation memory store failed: {e}")
+            self._rollback()
+            self._record(errors=1)
+            return 0
+
+        self._record(stored=len(rows))
+        return len(rows)
+
+    def recent_entries(self, source_lang: str, target_lang: str, limit: int) -> List[Tuple[str, str]]:
+        """
+        Most recently updated entries for a language pair
+
+        Used to preload the fuzzy match index (src/core/fuzzy_memory.py).
+
+        Returns:
+            List of (normalized_source, canonical_translation), empty on error
+        """
+        try:
+            with self._lock:
+                cursor = self.database.get_cursor()
+                try:
+                    cursor.execute(
+                        '''
+                        SELECT source_text, translated_text FROM translation_memory
+                        WHERE source_lang = %s AND target_lang = %s
+                        ORDER BY updated_at DESC
+                        LIMIT %s
+                        ''',
+                        (source_lang.lower(), target_lang.lower(), limit)
+                    )
+                    rows = cursor.fetchall()
+                    self.database.conn.commit()
+                finally:
+                    cursor.close()
+
+        except Exception as e:
+            logger.warning(f"Translation memory preload failed: {e}")
+            self._rollback()
+            self._record(errors=1)
+            return []
+
+        return [(row['source_text'], row['translated_text']) for row in rows]
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Cumulative statistics for this TM instance (warm container lifetime)
+
+        Returns:
+            dict: lookups, hits, misses, hit_rate, characters_saved, stored, errors
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        stats['hit_rate'] = round(stats['hits'] / stats['lookups'], 4) if stats['lookups'] else 0.0
+        return stats
+
+    def _record(self, **counters: int):
+        """Add to the statistics counters"""
+        with self._lock:
+            for name, value in counters.items():
+                self._stats[name] += value
+
+    def _rollback(self):
+        """Roll back a failed TM transaction so the connection stays usable"""
+        try:
+            if self.database.conn and not self.database.conn.closed:
+                self.database.conn.rollback()
+        except Exception:
+            pass
+
+
+# ============================================================================
+# Shared Instance
+# ============================================================================
+
+_translation_memory: Optional[TranslationMemory] = None
+
+
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """
+    Get the shared TranslationMemory, or None if it is disabled
+
+    The TM is disabled when TRANSLATION_MEMORY_ENABLED is false or no
+    database is configured (e.g. local development without Postgres).
+    """
+    global _translation_memory
+
+    if not settings.TRANSLATION_MEMORY_ENABLED or not settings.DB_HOST:
+        return None
+
+    if _translation_memory is None:
+        _translation_memory = TranslationMemory()
+
+    return _translation_memory
@@ -10,7 +10,20 @@ FEATURES:
     - Batch translation: Process multiple texts efficiently
     - Health monitoring: Track provider availability
     - Usage statistics: Monitor DeepL API consumption
-    - Async-ready: All methods support asyncio
+    - Translation memory: Never pay twice for the same segment (Postgres)
+    - Translation cache: In-process LRU/TTL + SQLite under /tmp for warm containers
+    - Fuzzy matching: Reuse translations of near-duplicate segments
+    - Sentence segmentation: Caches and memory work per sentence, so an
+      edited paragraph only re-bills the sentences that changed
+    - Markup fragments: tag_handling='html' translates the inner HTML of a
+      block in one unit, inline tags (<a>, <b>, <em>) stay in place
+    - Provider routing: providers are registered with their quality, cost
+      and observed latency; the router picks the order per segment
+      (ROUTING_STRATEGY, see src.core.providers)
+    - Request coalescing: a segment already in flight for another request
+      (same language pair and normalized text) is waited for instead of
+      translated again (SINGLE_FLIGHT_ENABLED, see src.core.single_flight)
+    - Async-ready: translate_async/translate_batch_async never block the event loop
 
 ARCHITECTURE:
     ┌─────────────────────────────────────┐
@@ -28,6 +41,9 @@ ARCHITECTURE:
 
 TRANSLATION FLOW:
     1. Text Input → translate(text, source, target)
+       ├─ Found in container cache (memory → /tmp) → Return cached translation
+       ├─ Found in translation memory (Postgres) → Return stored translation
+       └─ Near-duplicate in fuzzy index → Return adapted stored translation
     2. Try DeepL API (if available)
        ├─ Success → Return translated text
        └─ Failure → Continue to step 3
@@ -52,19 +68,22 @@ USAGE EXAMPLES:
 
     # Example 1: Initialize with DeepL only (production)
     >>> service = TranslationService(deepl_api_key="your_api_key")
-    >>> result = await service.translate("Hello", "en", "es")
+    >>> result = service.translate("Hello", "en", "es")
     >>> print(result)
     {'text': 'Hola', 'provider': 'deepl', 'success': True}
 
+    # From async code (FastAPI routes) use the non-blocking variants
+    >>> result = await service.translate_async("Hello", "en", "es")
+
     # Example 2: Automatic fallback (DeepL fails, MarianMT works)
     >>> # If DeepL API key is invalid or rate limited...
-    >>> result = await service.translate("Hello", "en", "es")
+    >>> result = service.translate("Hello", "en", "es")
     >>> print(result)
     {'text': 'Hola', 'provider': 'marian', 'success': True}
 
     # Example 3: Batch translation
     >>> texts = ["Hello", "Goodbye", "Thank you"]
-    >>> results = await service.translate_batch(texts, "en", "es")
+    >>> results = service.translate_batch(texts, "en", "es")
     >>> for r in results:
     ...     print(f"{r['provider']}: {r['text']}")
     deepl: Hola
@@ -98,7 +117,7 @@ CONFIGURATION:
 PERFORMANCE:
     - DeepL API: ~100-500ms per translation (network dependent)
     - MarianMT: ~2-10s per translation (CPU/GPU dependent)
-    - Batch processing: Sequential (can be parallelized in future)
+    - Batch processing: Up to 50 texts per DeepL request (see translate_batch)
     - Memory: ~50MB (DeepL only) or ~2GB (with MarianMT models)
 
 DEPLOYMENT:
@@ -113,8 +132,6 @@ DEPLOYMENT:
         - Can work offline with MarianMT only
 
 FUTURE ENHANCEMENTS:
-    - Add caching layer for repeated translations
-    - Implement parallel batch processing
     - Add more providers (Google Translate, Azure)
     - Support context-aware translations
     - Add translation quality scoring
@@ -124,15 +141,34 @@ Last Updated: October 20, 2025
 Version: 1.1.0
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Collection
+from src.config.settings import settings
 from src.core.deepl_translator import DeepLTranslator
+from src.core.segmenter import SentenceSegmenter
+from src.core.circuit_breaker import get_circuit_breaker
+from src.core.translation_memory import TranslationMemory, get_translation_memory
+from src.core.translation_cache import TieredTranslationCache, get_translation_cache
+from src.core.fuzzy_memory import FuzzyMatchIndex, get_fuzzy_index
+from src.core.usage_ledger import UsageLedger, get_usage_ledger
+from src.core.single_flight import SingleFlight, get_single_flight
+from src.core.placeholder_protector import PlaceholderProtector
+from src.core.providers import (
+    DeepLProvider,
+    MarianProvider,
+    ProviderRegistry,
+    PseudoLocalizationProvider,
+    ProviderRouter,
+    TranslationProvider,
+    get_provider_router
+)
 
 logger = logging.getLogger(__name__)
 
 # Try to import MarianMT (optional, requires PyTorch)
 try:
-    from src.core.marian_translator import MarianTranslator
+    from src.core.marian_translator import MarianTranslator, get_marian_translator
     MARIAN_AVAILABLE = True
 except ImportError:
     logger.warning("MarianMT not available (PyTorch not installed). Only DeepL will be used.")
@@ -150,11 +186,22 @@ class TranslationService:
 
     Usage:
         service = TranslationService(deepl_api_key="your_key")
-        result = await service.translate("Hello", "en", "es")
+        result = service.translate("Hello", "en", "es")          # SQS worker
+        result = await service.translate_async("Hello", "en", "es")  # routes
         # result = {'text': 'Hola', 'provider': 'deepl', 'success': True}
     """
 
-    def __init__(self, deepl_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        deepl_api_key: Optional[str] = None,
+        translation_memory: Optional[TranslationMemory] = None,
+        translation_cache: Optional[TieredTranslationCache] = None,
+        fuzzy_index: Optional[FuzzyMatchIndex] = None,
+        usage_ledger: Optional[UsageLedger] = None,
+        user_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        routing_strategy: Optional[str] = None
+    ):
         """
         Initialize translation service with automatic provider setup.
 
@@ -168,6 +215,21 @@ class TranslationService:
                 - If provided: Enables DeepL as primary translator
                 - If None: Only MarianMT will be available (if installed)
                 - Format: "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx:fx"
+            translation_memory (Optional[TranslationMemory]): Memory checked
+                before any provider. Default: the shared Postgres memory
+                (None if TRANSLATION_MEMORY_ENABLED is false or no database).
+            translation_cache (Optional[TieredTranslationCache]): In-process
+                + /tmp cache checked before the memory. Default: the shared
+                container cache (None if TRANSLATION_CACHE_ENABLED is false).
+            fuzzy_index (Optional[FuzzyMatchIndex]): Near-duplicate index
+                checked after the memory. Default: the shared index
+                (None if FUZZY_MATCH_ENABLED is false).
+            usage_ledger (Optional[UsageLedger]): Where translated characters
+                are counted. Default: the shared ledger.
+            user_id (Optional[str]): User translated characters are attributed to
+            job_id (Optional[str]): Job translated characters are attributed to
+            routing_strategy (Optional[str]): 'quality', 'cost' or 'latency'
+                (see src.core.providers). Default: ROUTING_STRATEGY.
 
         Raises:
             No exceptions raised. Service degrades gracefully:
@@ -231,10 +293,10 @@ class TranslationService:
 
         if MARIAN_AVAILABLE and MarianTranslator:
             try:
-                # Create MarianMT translator instance
-                # This loads pre-trained models (~1-2GB) into memory
-                # First initialization is slow (~5-10s), subsequent calls are fast
-                self.marian = MarianTranslator()
+                # Shared MarianMT translator: models are loaded on first use per
+                # language pair and kept in a memory-bounded LRU cache
+                # (MARIAN_MODEL_CACHE_MB) common to all services in the process
+                self.marian = get_marian_translator()
                 logger.info("MarianMT translator enabled (fallback)")
 
             except Exception as e:
@@ -246,17 +308,68 @@ class TranslationService:
             # PyTorch not installed (expected in Lambda production environment)
             logger.info("MarianMT not available - DeepL will be the only translator")
 
+        # Shared health state of the fallback provider (DeepL's breaker lives
+        # on DeepLTranslator so it also covers direct translator calls)
+        self.marian_breaker = get_circuit_breaker('marian')
+
+        # Provider registry: the router picks the order per segment
+        # (default 'quality': DeepL first, MarianMT as fallback)
+        self.registry = ProviderRegistry()
+        if self.deepl:
+            self.registry.register(DeepLProvider(self.deepl))
+        if self.marian:
+            self.registry.register(MarianProvider(self.marian))
+        if settings.PSEUDO_LOCALIZATION_ENABLED:
+            self.registry.register(PseudoLocalizationProvider())
+
+        self.router: ProviderRouter = get_provider_router()
+        self.routing_strategy = routing_strategy
+
         # ============================================================================
         # STEP 3: Validation - Check At Least One Provider Available
         # ============================================================================
         # Service can operate with DeepL only, MarianMT only, or both
         # If neither available, all translation requests will fail
 
-        if not self.deepl and not self.marian:
+        if not len(self.registry):
             # This is a configuration error - service will be non-functional
             # All translate() calls will return errors
             logger.warning("No translators available - DeepL API key required for functionality")
 
+        # ============================================================================
+        # STEP 4: Translation Cache + Memory (checked before any provider)
+        # ============================================================================
+        # 1. Container cache (in-process LRU + SQLite under /tmp) - no network
+        # 2. Translation memory (Postgres) - segments translated before are
+        #    served from the database instead of being billed again by DeepL
+        # 3. Fuzzy index - near-duplicates ("Save 10% today" / "Save 20% today")
+        #    reuse a stored translation with the differing spans substituted
+
+        self.cache: Optional[TieredTranslationCache] = translation_cache or get_translation_cache()
+        self.memory: Optional[TranslationMemory] = translation_memory or get_translation_memory()
+        self.fuzzy: Optional[FuzzyMatchIndex] = fuzzy_index or get_fuzzy_index()
+
+        # ============================================================================
+        # STEP 5: Usage Ledger (local character accounting)
+        # ============================================================================
+        # Every successful sentence is counted per provider, user and job, so
+        # usage reporting never needs a live DeepL /v2/usage call
+
+        self.ledger: UsageLedger = usage_ledger or get_usage_ledger()
+        self.user_id = user_id
+        self.job_id = job_id
+
+        # ============================================================================
+        # STEP 6: Single-Flight Coalescing (shared by all requests in the container)
+        # ============================================================================
+        # A segment already being translated for another request (same language
+        # pair, same normalized text) is waited for instead of sent again
+
+        self.flights: Optional[SingleFlight] = (
+            get_single_flight('translation', timeout=settings.SINGLE_FLIGHT_TIMEOUT_SECONDS)
+            if settings.SINGLE_FLIGHT_ENABLED else None
+        )
+
     def translate(
         self,
         text: str,
@@ -267,9 +380,10 @@ class TranslationService:
         Translate text using best available translator
 
         Process:
-        1. Try DeepL (if available)
-        2. Fall back to MarianMT if DeepL fails
-        3. Return error if both fail
+        1. Check the translation cache and translation memory
+        2. Try DeepL (if available)
+        3. Fall back to MarianMT if DeepL fails
+        4. Return error if both fail
 
         Args:
             text: Text to translate
@@ -279,105 +393,700 @@ class TranslationService:
         Returns:
             dict: {
                 'text': translated_text or None,
-                'provider': 'deepl' | 'marian' | None,
+                'provider': 'cache' | 'memory' | 'fuzzy' | 'deepl' | 'marian' | None,
                 'success': True | False,
-                'error': error_message (only if success=False)
+                'error': error_message (only if success=False),
+                'retryable': True if DeepL failed transiently (only if success=False)
             }
         """
-        if not text or not text.strip():
-            return {
-                'text': text,
-                'provider': None,
-                'success': False,
-                'error': 'Empty text provided'
-            }
+        # Single texts go through the same pipeline as batches
+        # (translation memory, provider fallback)
+        return self.translate_batch([text], source_lang, target_lang)[0]
 
-        # STRATEGY 1: Try DeepL (primary)
-        if self.deepl:
-            logger.info(f"Attempting DeepL translation: {source_lang} -> {target_lang}")
-            result = self.deepl.translate_text(text, source_lang, target_lang)
-
-            if result:
-                logger.info(f"✓ DeepL translation successful ({len(result)} chars)")
-                return {
-                    'text': result,
-                    'provider': 'deepl',
-                    'success': True
+    def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> list[Dict[str, Any]]:
+        """
+        Translate multiple texts with batched provider requests
+
+        Process:
+        1. Split texts into sentences (SentenceSegmenter), deduplicated
+           across the batch
+        2. Look up all sentences in the container cache, then the
+           translation memory (one query), then the fuzzy match index
+        3. Send the misses to DeepL in multi-text requests
+        4. Retry the sentences DeepL failed on with MarianMT (batched)
+        5. Store new translations in the cache, translation memory and
+           fuzzy index
+        6. Mark the remaining sentences as failed and reassemble each
+           text from its sentence translations
+
+        Markup fragments (tag_handling='html' or 'xml', e.g. the inner HTML
+        of a <p> with <a>/<b> children) are translated whole by DeepL so tags
+        stay around the words they wrap. They are not split into sentences,
+        not fuzzy matched and not sent to MarianMT (which cannot keep tags);
+        a fragment DeepL could not translate fails.
+
+        Args:
+            texts: List of texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            tag_handling: 'html' or 'xml' for markup fragments, None for plain text
+
+        Returns:
+            list: One result per input text, in input order
+                  (same format as translate())
+        """
+        segments, layout = self._split_sentences(texts, source_lang, tag_handling)
+        results = self._translate_segments(segments, source_lang, target_lang, tag_handling)
+        return self._join_sentences(texts, layout, results)
+
+    def _translate_segments(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> list[Dict[str, Any]]:
+        """Stores → DeepL → MarianMT pipeline of translate_batch() for sentences"""
+        results, pending = self._start_batch(texts)
+        pending = self._lookup_stored(texts, results, pending, source_lang, target_lang, tag_handling)
+
+        # Segments another request is already translating are waited for
+        pending, leading, following = self._join_flights(texts, pending, source_lang, target_lang, tag_handling)
+        completed = False
+        try:
+            self._translate_pending(texts, results, pending, source_lang, target_lang, tag_handling)
+            completed = True
+        finally:
+            self._land_flights(texts, results, leading, completed)
+
+        if following:
+            timeout = self.flights.timeout
+            outcomes = [flight.wait(timeout) for flight, _ in following.values()]
+            retry = self._collect_flights(results, following, outcomes)
+            if retry:
+                # The other request gave up - translate these ourselves
+                self._translate_pending(texts, results, retry, source_lang, target_lang, tag_handling)
+
+        self._record_usage(texts, results, source_lang, target_lang, coalesced=following)
+        return results
+
+    def _translate_pending(
+        self,
+        texts: list[str],
+        results: list,
+        pending: list[int],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ):
+        """Translate `pending` indices with the routed provider chains and store the new translations"""
+        to_translate = list(pending)
+
+        # STRATEGY 1-2: Provider chain chosen by the router (primary, then fallbacks)
+        failed = []
+        for chain, indices in self._plan(texts, pending, source_lang, target_lang, tag_handling):
+            for position, provider in enumerate(chain):
+                if not indices:
+                    break
+
+                logger.info(
+                    f"Attempting {provider.label} batch translation: "
+                    f"{source_lang} -> {target_lang} ({len(indices)} texts)"
+                )
+                provider_results = provider.translate_batch(
+                    [texts[i] for i in indices],
+                    source_lang,
+                    target_lang,
+                    tag_handling
+                )
+                indices = self._merge_provider_results(
+                    results, indices, provider_results, provider, chain[position + 1:]
+                )
+            failed.extend(indices)
+        pending = failed
+
+        self._store_results(texts, results, to_translate, source_lang, target_lang, tag_handling)
+
+        # STRATEGY 3: Every provider failed
+        self._finish_batch(results, pending)
+
+    async def translate_async(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> Dict[str, Any]:
+        """
+        Async variant of translate() for FastAPI routes
+
+        DeepL is called through the non-blocking, connection-pooled client
+        and MarianMT runs in a worker thread, so the event loop keeps serving
+        other requests while translations are in flight.
+
+        Returns:
+            dict: Same format as translate()
+        """
+        return (await self.translate_batch_async([text], source_lang, target_lang))[0]
+
+    async def translate_batch_async(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> list[Dict[str, Any]]:
+        """
+        Async variant of translate_batch() for FastAPI routes
+
+        Returns:
+            list: Same format as translate_batch()
+        """
+        segments, layout = self._split_sentences(texts, source_lang, tag_handling)
+        results = await self._translate_segments_async(segments, source_lang, target_lang, tag_handling)
+        return self._join_sentences(texts, layout, results)
+
+    async def _translate_segments_async(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> list[Dict[str, Any]]:
+        """Async variant of _translate_segments()"""
+        results, pending = self._start_batch(texts)
+        pending = await asyncio.to_thread(
+            self._lookup_stored, texts, results, pending, source_lang, target_lang, tag_handling
+        )
+
+        # Segments another request is already translating are awaited
+        pending, leading, following = self._join_flights(texts, pending, source_lang, target_lang, tag_handling)
+        completed = False
+        try:
+            await self._translate_pending_async(texts, results, pending, source_lang, target_lang, tag_handling)
+            completed = True
+        finally:
+            # Also on cancellation: followers must never wait for a dead leader
+            self._land_flights(texts, results, leading, completed)
+
+        if following:
+            timeout = self.flights.timeout
+            outcomes = await asyncio.gather(*(flight.wait_async(timeout) for flight, _ in following.values()))
+            retry = self._collect_flights(results, following, outcomes)
+            if retry:
+                await self._translate_pending_async(texts, results, retry, source_lang, target_lang, tag_handling)
+
+        self._record_usage(texts, results, source_lang, target_lang, coalesced=following)
+        return results
+
+    async def _translate_pending_async(
+        self,
+        texts: list[str],
+        results: list,
+        pending: list[int],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ):
+        """Async variant of _translate_pending()"""
+        to_translate = list(pending)
+
+        # STRATEGY 1-2: Provider chain chosen by the router (MarianMT runs in a
+        # worker thread - CPU bound, keep it off the loop)
+        failed = []
+        for chain, indices in self._plan(texts, pending, source_lang, target_lang, tag_handling):
+            for position, provider in enumerate(chain):
+                if not indices:
+                    break
+
+                logger.info(
+                    f"Attempting {provider.label} batch translation: "
+                    f"{source_lang} -> {target_lang} ({len(indices)} texts)"
+                )
+                provider_results = await provider.translate_batch_async(
+                    [texts[i] for i in indices],
+                    source_lang,
+                    target_lang,
+                    tag_handling
+                )
+                indices = self._merge_provider_results(
+                    results, indices, provider_results, provider, chain[position + 1:]
+                )
+            failed.extend(indices)
+        pending = failed
+
+        await asyncio.to_thread(
+            self._store_results, texts, results, to_translate, source_lang, target_lang, tag_handling
+        )
+
+        # STRATEGY 3: Every provider failed
+        self._finish_batch(results, pending)
+
+    def _split_sentences(
+        self,
+        texts: list[str],
+        source_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> tuple[list[str], Optional[list]]:
+        """
+        Split texts into the sentences to translate
+
+        Identical sentences are translated once per batch. Texts with a
+        single sentence (and empty texts) are passed through whole.
+
+        Returns:
+            tuple: (segments to translate,
+                    layout: per text, a list of (span, segment index) where
+                    span is the (start, end) sentence offset or None for a
+                    whole text - None if SENTENCE_SEGMENTATION_ENABLED is false
+                    or the texts are markup fragments)
+        """
+        if tag_handling or not settings.SENTENCE_SEGMENTATION_ENABLED:
+            # A sentence boundary inside <a>...</a> would split the tag pair
+            return texts, None
+
+        segments: list[str] = []
+        positions: Dict[Any, int] = {}
+        layout = []
+
+        def position(segment):
+            if segment not in positions:
+                positions[segment] = len(segments)
+                segments.append(segment)
+            return positions[segment]
+
+        for text in texts:
+            spans = SentenceSegmenter.split(text, source_lang) if text else []
+
+            if len(spans) <= 1:
+                layout.append([(None, position(text))])
+            else:
+                layout.append([(span, position(text[span[0]:span[1]])) for span in spans])
+
+        return segments, layout
+
+    def _join_sentences(
+        self,
+        texts: list[str],
+        layout: Optional[list],
+        results: list[Dict[str, Any]]
+    ) -> list[Dict[str, Any]]:
+        """
+        Reassemble per-text results from sentence results
+
+        A text fails if any of its sentences failed. Its provider is the
+        least reliable source used for any sentence (marian > deepl > fuzzy
+        > memory > cache).
+        """
+        if layout is None:
+            return results
+
+        joined = []
+
+        for text, units in zip(texts, layout):
+            if units[0][0] is None:
+                # Copy - deduplicated segments share one result dict
+                joined.append(dict(results[units[0][1]]))
+                continue
+
+            parts = [results[index] for _, index in units]
+            failed = [part for part in parts if not part['success']]
+
+            if failed:
+                joined.append({
+                    'text': None,
+                    'provider': None,
+                    'success': False,
+                    'error': f"Translation failed for {len(failed)} of {len(parts)} sentences: {failed[0].get('error')}",
+                    'retryable': all(part.get('retryable') for part in failed)
+                })
+                continue
+
+            providers = {part['provider'] for part in parts}
+            joined.append({
+                'text': SentenceSegmenter.join(text, [span for span, _ in units], [part['text'] for part in parts]),
+                'provider': next(
+                    (provider for provider in ('marian', 'deepl', 'fuzzy', 'memory', 'cache') if provider in providers),
+                    parts[0]['provider']
+                ),
+                'success': True
+            })
+
+        return joined
+
+    def _start_batch(self, texts: list[str]) -> tuple[list, list[int]]:
+        """
+        Create the result list for a batch and reject empty texts
+
+        Returns:
+            tuple: (results with empty-text errors filled in,
+                    indices of texts that still need translation)
+        """
+        results: list[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending = []
+
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                results[index] = {
+                    'text': text,
+                    'provider': None,
+                    'success': False,
+                    'error': 'Empty text provided'
                 }
             else:
-                logger.warning("✗ DeepL failed, falling back to MarianMT")
+                pending.append(index)
 
-        # STRATEGY 2: Fall back to MarianMT
-        if self.marian:
-            logger.info(f"Attempting MarianMT translation: {source_lang} -> {target_lang}")
-            try:
-                result = self.marian.translate(text, source_lang, target_lang)
+        return results, pending
 
-                if result:
-                    logger.info(f"✓ MarianMT translation successful (fallback)")
-                    return {
-                        'text': result,
-                        'provider': 'marian',
+    def _lookup_stored(
+        self,
+        texts: list[str],
+        results: list,
+        pending: list[int],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ) -> list[int]:
+        """
+        Fill `results` from the translation cache, the translation memory,
+        then the fuzzy match index
+
+        Translation memory hits are copied into the cache so the next lookup
+        in this container does not need a database round trip. Fuzzy matches
+        are adapted translations and are not cached. Markup fragments skip
+        the fuzzy index (a substituted span could land inside a tag).
+
+        Returns:
+            list: Indices (from `pending`) found in neither store
+        """
+        stores = (('cache', self.cache), ('memory', self.memory), ('fuzzy', None if tag_handling else self.fuzzy))
+
+        for name, store in stores:
+            if not store or not pending:
+                continue
+
+            found = store.lookup_many([texts[i] for i in pending], source_lang, target_lang)
+
+            if not found:
+                continue
+
+            logger.info(f"✓ Translation {name}: {len(found)} of {len(pending)} texts found")
+
+            if name == 'memory' and self.cache:
+                self.cache.store_many(
+                    [(texts[pending[position]], text) for position, text in found.items()],
+                    source_lang,
+                    target_lang
+                )
+
+            misses = []
+            for position, index in enumerate(pending):
+                if position in found:
+                    results[index] = {
+                        'text': found[position],
+                        'provider': name,
                         'success': True
                     }
                 else:
-                    logger.error("✗ MarianMT returned None")
+                    misses.append(index)
+            pending = misses
 
-            except Exception as e:
-                logger.error(f"✗ MarianMT exception: {e}")
+        return pending
 
-        # STRATEGY 3: Both failed
-        error_msg = "All translation providers failed"
-        logger.error(f"✗ {error_msg}")
-
-        return {
-            'text': None,
-            'provider': None,
-            'success': False,
-            'error': error_msg
-        }
+    def _store_results(
+        self,
+        texts: list[str],
+        results: list,
+        translated: list[int],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str] = None
+    ):
+        """
+        Write new provider translations for `translated` indices to the cache, memory and fuzzy index
+
+        Only providers with `persist` are stored (not pseudo-localization).
+        The translation memory (no expiry) and the fuzzy index only receive
+        the primary provider's output: memory hits are served before any
+        provider is called, so a MarianMT fallback stored there during a
+        DeepL outage would never be replaced by DeepL. Fallback output is
+        cached for TRANSLATION_FALLBACK_TTL_SECONDS only.
+        """
+        if not translated or not (self.cache or self.memory or self.fuzzy):
+            return
+
+        # Pseudo-localized text must never come back as a translation
+        persisted = {provider.name for provider in self.registry if provider.persist}
+        primary = self.registry.primary()
+
+        entries_by_provider: Dict[str, list] = {}
+        for index in translated:
+            result = results[index]
+            if result and result['success'] and result['provider'] in persisted:
+                entries_by_provider.setdefault(result['provider'], []).append(
+                    (texts[index], result['text'])
+                )
+
+        for provider, entries in entries_by_provider.items():
+            is_primary = primary is not None and provider == primary.name
+
+            if self.cache:
+                self.cache.store_many(
+                    entries,
+                    source_lang,
+                    target_lang,
+                    provider,
+                    ttl_seconds=None if is_primary else settings.TRANSLATION_FALLBACK_TTL_SECONDS
+                )
+            if not is_primary:
+                continue
+            if self.memory:
+                self.memory.store_many(entries, source_lang, target_lang, provider)
+            if self.fuzzy and not tag_handling:
+                self.fuzzy.add_many(entries, source_lang, target_lang)
+
+    def _record_usage(
+        self,
+        texts: list[str],
+        results: list,
+        source_lang: str,
+        target_lang: str,
+        coalesced: Collection[int] = ()
+    ):
+        """
+        Count the characters of every translated sentence in the usage ledger (per provider)
 
-    def translate_batch(
+        Sentences served by another request's provider call (`coalesced`
+        indices) are recorded as 'coalesced' - the leader was billed.
+        Pseudo-localized sentences are not usage and are not recorded.
+        """
+        skipped = {provider.name for provider in self.registry if not provider.persist}
+
+        usage: Dict[str, list] = {}
+        for index, (text, result) in enumerate(zip(texts, results)):
+            if result and result['success'] and result['provider'] and result['provider'] not in skipped:
+                provider = 'coalesced' if index in coalesced else result['provider']
+                counts = usage.setdefault(provider, [0, 0])
+                counts[0] += len(text)
+                counts[1] += 1
+
+        for provider, (characters, segments) in usage.items():
+            self.ledger.record(
+                provider,
+                characters,
+                source_lang,
+                target_lang,
+                user_id=self.user_id,
+                job_id=self.job_id,
+                segments=segments
+            )
+
+    def _join_flights(
         self,
         texts: list[str],
+        pending: list[int],
         source_lang: str,
-        target_lang: str
-    ) -> list[Dict[str, Any]]:
+        target_lang: str,
+        tag_handling: Optional[str]
+    ) -> tuple[list[int], Dict[int, tuple], Dict[int, tuple]]:
         """
-        Translate multiple texts
+        Claim the pending segments in the shared single-flight group
 
-        Args:
-            texts: List of texts to translate
-            source_lang: Source language code
-            target_lang: Target language code
+        Keys are (language pair, tag handling, normalized segment) - the
+        cache normalization, so segments differing only in whitespace or
+        placeholder tokens share one provider call.
 
         Returns:
-            list: List of translation results (same format as translate())
+            tuple: (indices to translate here,
+                    leading: {index: (key, flight, placeholder tokens)},
+                    following: {index: (flight, placeholder tokens)})
         """
-        results = []
+        if not self.flights or not pending:
+            return pending, {}, {}
 
-        for text in texts:
-            result = self.translate(text, source_lang, target_lang)
-            results.append(result)
+        own, leading, following = [], {}, {}
+
+        for index in pending:
+            segment, tokens = PlaceholderProtector.normalize_segment(texts[index])
+            key = (source_lang.lower(), target_lang.lower(), tag_handling, segment)
+            flight, leader = self.flights.acquire(key)
+
+            if leader:
+                own.append(index)
+                leading[index] = (key, flight, tokens)
+            else:
+                following[index] = (flight, tokens)
+
+        if following:
+            logger.info(f"✓ Coalesced: {len(following)} of {len(pending)} texts already in flight")
+
+        return own, leading, following
+
+    def _land_flights(self, texts: list[str], results: list, leading: Dict[int, tuple], completed: bool):
+        """
+        Publish the results of the segments this batch led
+
+        Translations are shared with canonical placeholder tokens (each
+        follower substitutes its own). An interrupted batch publishes None
+        so followers translate themselves.
+        """
+        for index, (key, flight, tokens) in leading.items():
+            result = results[index] if completed else None
+
+            if result and result['success']:
+                result = {**result, 'text': PlaceholderProtector.canonicalize_tokens(result['text'], tokens)}
+            elif result:
+                result = dict(result)
+
+            self.flights.release(key, flight, result)
+
+    @staticmethod
+    def _collect_flights(results: list, following: Dict[int, tuple], outcomes: list) -> list[int]:
+        """
+        Fill `results` from the leaders' published results
+
+        Returns:
+            list: Indices whose leader gave up (or timed out) - translate these here
+        """
+        retry = []
+
+        for (index, (_, tokens)), outcome in zip(following.items(), outcomes):
+            if outcome is None:
+                retry.append(index)
+            elif outcome['success']:
+                results[index] = {**outcome, 'text': PlaceholderProtector.denormalize_tokens(outcome['text'], tokens)}
+            else:
+                results[index] = dict(outcome)
+
+        return retry
+
+    def _plan(
+        self,
+        texts: list[str],
+        pending: list[int],
+        source_lang: str,
+        target_lang: str,
+        tag_handling: Optional[str]
+    ) -> list:
+        """Provider chains for the pending texts (see ProviderRouter.plan)"""
+        return self.router.plan(
+            self.registry,
+            texts,
+            pending,
+            source_lang,
+            target_lang,
+            tag_handling,
+            strategy=self.routing_strategy
+        )
+
+    def _merge_provider_results(
+        self,
+        results: list,
+        pending: list[int],
+        provider_results: list[Dict[str, Any]],
+        provider: TranslationProvider,
+        fallbacks: list[TranslationProvider]
+    ) -> list[int]:
+        """
+        Merge one provider's batch results, returning indices that failed
+
+        Failures are recorded in `results` until a fallback provider
+        overwrites them; 'retryable' stays True if any provider in the chain
+        failed transiently.
+        """
+        failed = []
+
+        for index, provider_result in zip(pending, provider_results):
+            if provider_result['success']:
+                results[index] = {
+                    'text': provider_result['text'],
+                    'provider': provider.name,
+                    'success': True
+                }
+                continue
+
+            previous = results[index] or {}
+            results[index] = {
+                'text': None,
+                'provider': None,
+                'success': False,
+                'error': provider_result.get('error'),
+                'retryable': provider_result.get('retryable', False) or previous.get('retryable', False)
+            }
+            failed.append(index)
+
+        if failed:
+            fallback = f", falling back to {fallbacks[0].label}" if fallbacks else ""
+            logger.warning(f"✗ {provider.label} failed for {len(failed)} texts{fallback}")
+
+        return failed
+
+    def _finish_batch(self, results: list, pending: list[int]) -> list[Dict[str, Any]]:
+        """
+        Mark texts no provider could translate as failed
+
+        'retryable' is True when DeepL failed transiently (throttling, 5xx,
+        network) - the SQS worker retries those at the end of the job.
+        """
+        if pending:
+            logger.error(f"✗ All translation providers failed for {len(pending)} of {len(results)} texts")
+
+        for index in pending:
+            previous = results[index] or {}
+            results[index] = {
+                'text': None,
+                'provider': None,
+                'success': False,
+                'error': 'All translation providers failed',
+                'retryable': previous.get('retryable', False)
+            }
 
         return results
 
+    def get_routing_stats(self) -> Dict[str, Any]:
+        """
+        Provider routing decisions and per-provider latency percentiles
+
+        Returns:
+            dict: strategy, bulk_min_characters, decisions, characters,
+                  providers (see ProviderRouter.get_stats), coalescing
+                  (SingleFlight.get_stats, if enabled)
+        """
+        stats = self.router.get_stats(self.registry)
+        if self.routing_strategy:
+            stats['strategy'] = self.routing_strategy
+        if self.flights:
+            stats['coalescing'] = self.flights.get_stats()
+        return stats
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get service status and translator availability
 
+        Availability comes from the providers' circuit breakers (cached
+        health of real traffic) - no network call is made.
+
         Returns:
             dict: {
                 'deepl_available': bool,
                 'marian_available': bool,
-                'primary_provider': 'deepl' | 'marian' | None
+                'primary_provider': 'deepl' | 'marian' | None,
+                'providers': {
+                    'deepl': breaker status or None (not configured),
+                    'marian': breaker status or None (not installed)
+                }
             }
         """
-        deepl_available = self.deepl is not None and (
-            self.deepl.check_availability() if hasattr(self.deepl, 'check_availability') else True
-        )
+        deepl_health = self.deepl.breaker.get_status() if self.deepl else None
+        marian_health = self.marian_breaker.get_status() if self.marian else None
 
-        marian_available = self.marian is not None
+        deepl_available = bool(deepl_health and deepl_health['available'])
+        marian_available = bool(marian_health and marian_health['available'])
 
         primary = None
         if deepl_available:
@@ -388,16 +1097,93 @@ class TranslationService:
         return {
             'deepl_available': deepl_available,
             'marian_available': marian_available,
-            'primary_provider': primary
+            'primary_provider': primary,
+            'providers': {
+                'deepl': deepl_health,
+                'marian': marian_health
+            }
         }
 
-    def get_deepl_usage(self) -> Optional[Dict[str, Any]]:
+    def get_memory_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get translation memory statistics
+
+        Returns:
+            dict or None: lookups, hits, misses, hit_rate, characters_saved,
+                          stored, errors (None if the memory is disabled)
+        """
+        if self.memory:
+            return self.memory.get_stats()
+        return None
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get translation cache statistics per tier
+
+        Returns:
+            dict or None: {'memory': {...}, 'disk': {...} or None} with hits,
+                          misses, evictions, expirations and size (None if
+                          the cache is disabled)
+        """
+        if self.cache:
+            return self.cache.get_stats()
+        return None
+
+    def get_model_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get MarianMT model cache statistics
+
+        Returns:
+            dict or None: hits, misses, loads, load_failures, load_seconds,
+                          evictions, entries, bytes, max_bytes, pinned
+                          (None if MarianMT is not available)
+        """
+        if self.marian:
+            return self.marian.get_cache_stats()
+        return None
+
+    def get_fuzzy_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get fuzzy match index statistics
+
+        Returns:
+            dict or None: lookups, hits, hit_rate, rejected, characters_saved,
+                          entries (None if fuzzy matching is disabled)
+        """
+        if self.fuzzy:
+            return self.fuzzy.get_stats()
+        return None
+
+    def get_deepl_usage(self, force: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get DeepL API usage statistics
 
+        Served from the usage ledger: DeepL's counter is fetched at most every
+        USAGE_RECONCILE_SECONDS (or when `force`), in between the characters
+        billed by this container are added to the last fetched count.
+
+        Args:
+            force: Reconcile with DeepL now
+
         Returns:
             dict or None: Usage stats if DeepL is available
+                          (character_count, character_limit, percentage_used,
+                          estimated, reconciled_at, drift)
         """
         if self.deepl:
-            return self.deepl.get_usage()
+            return self.ledger.get_deepl_usage(self.deepl.get_usage, force=force)
         return None
+
+    def get_usage_summary(
+        self,
+        user_id: Optional[str] = None,
+        job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Characters translated this month, from the usage ledger
+
+        Returns:
+            dict: since, billed_characters, total_characters, by_provider,
+                  by_language_pair (see UsageLedger.get_summary)
+        """
+        return self.ledger.get_summary(user_id=user_id, job_id=job_id)
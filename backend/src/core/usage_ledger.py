@@ -0,0 +1,416 @@
+"""
+TranslateCloud - Character Usage Ledger
+
+Local record of the characters every provider translated, per user, job and
+language pair. Replaces live DeepL /v2/usage calls on the hot path:
+
+- record():  in-memory aggregation as translations happen (no I/O)
+- flush():   batched upsert into the Postgres `translation_usage` table
+             (migration: scripts/database/add-translation-usage.sql), run in
+             a background thread every USAGE_LEDGER_FLUSH_SECONDS and at the
+             end of every worker job
+- reconcile: DeepL's own counter is fetched at most every
+             USAGE_RECONCILE_SECONDS; between reconciliations the DeepL usage
+             is estimated as "last DeepL count + characters billed since"
+
+Only 'deepl' characters are billed. Other providers ('marian', the
+'cache', 'memory' and 'fuzzy' stores, and 'coalesced' segments served by
+another request's in-flight call) are recorded too so dashboards can show
+what was served without a DeepL call.
+
+Usage:
+    >>> ledger = get_usage_ledger()
+    >>> ledger.record('deepl', 120, 'en', 'es', user_id='u1', job_id='j1')
+    >>> ledger.get_local_totals()['deepl']
+    120
+    >>> ledger.flush()
+    1
+
+Author: TranslateCloud Team
+Last Updated: October 2025
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from psycopg2.extras import execute_values
+
+from src.config.database import Database
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# (usage_date, user_id, job_id, provider, source_lang, target_lang)
+UsageKey = Tuple[date, str, str, str, str, str]
+
+
+class UsageLedger:
+    """
+    In-memory usage aggregation with periodic Postgres flushes
+
+    Thread-safe. Database errors never affect translation: unflushed counts
+    are kept and retried on the next flush.
+    """
+
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        flush_interval: float = 60.0,
+        reconcile_interval: float = 3600.0
+    ):
+        """
+        Args:
+            database: Database connection manager (None = memory only)
+            flush_interval: Seconds between background flushes
+            reconcile_interval: Minimum seconds between DeepL usage calls
+        """
+        self.database = database
+        self.flush_interval = flush_interval
+        self.reconcile_interval = reconcile_interval
+
+        self._pending: Dict[UsageKey, list] = defaultdict(lambda: [0, 0])
+        self._totals: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._flushing = False
+
+        # DeepL reconciliation state
+        self._deepl_usage: Optional[Dict[str, Any]] = None
+        self._deepl_billed_since = 0
+        self._reconciled_at = 0.0
+
+    # ========================================================================
+    # Recording
+    # ========================================================================
+
+    def record(
+        self,
+        provider: str,
+        characters: int,
+        source_lang: str,
+        target_lang: str,
+        user_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        segments: int = 1
+    ):
+        """
+        Count translated characters (in memory; flushed in the background)
+
+        Args:
+            provider: 'deepl', 'marian', 'cache', 'memory', 'fuzzy', 'coalesced'
+            characters: Source characters translated
+            source_lang: Source language code
+            target_lang: Target language code
+            user_id: User the translation is attributed to
+            job_id: Job the translation belongs to
+            segments: Number of segments the characters came from
+        """
+        if characters <= 0:
+            return
+
+        key = (
+            date.today(),
+            user_id or '',
+            job_id or '',
+            provider,
+            source_lang.lower(),
+            target_lang.lower()
+        )
+
+        with self._lock:
+            entry = self._pending[key]
+            entry[0] += characters
+            entry[1] += segments
+            self._totals[provider] += characters
+
+            if provider == 'deepl':
+                self._deepl_billed_since += characters
+
+            due = (
+                self.database is not None and
+                not self._flushing and
+                time.monotonic() - self._last_flush >= self.flush_interval
+            )
+            if due:
+                self._flushing = True
+
+        if due:
+            # Never block the caller (may be the event loop) on Postgres
+            threading.Thread(target=self._background_flush, daemon=True).start()
+
+    def flush(self) -> int:
+        """
+        Write pending counts to Postgres (one upsert statement)
+
+        Returns:
+            int: Rows written (0 if nothing pending, no database or on error)
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = defaultdict(lambda: [0, 0])
+            self._last_flush = time.monotonic()
+
+        if not pending or self.database is None:
+            if pending:
+                # Memory only - keep aggregating
+                self._merge_back(pending)
+            return 0
+
+        rows = [
+            (*key, characters, segments)
+            for key, (characters, segments) in pending.items()
+        ]
+
+        try:
+            with self._db_lock:
+                cursor = self.database.get_cursor()
+                try:
+                    execute_values(
+                        cursor,
+                        '''
+                        INSERT INTO translation_usage
+                        (usage_date, user_id, job_id, provider, source_lang, target_lang, characters, segments)
+                        VALUES %s
+                        ON CONFLICT (usage_date, user_id, job_id, provider, source_lang, target_lang) DO UPDATE
+                        SET characters = translation_usage.characters + EXCLUDED.characters,
+                            segments = translation_usage.segments + EXCLUDED.segments,
+                            updated_at = CURRENT_TIMESTAMP
+                        ''',
+                        rows
+                    )
+                    self.database.conn.commit()
+                finally:
+                    cursor.close()
+
+        except Exception as e:
+            logger.warning(f"Usage ledger flush failed ({len(rows)} rows kept for retry): {e}")
+            self._rollback()
+            self._merge_back(pending)
+            return 0
+
+        logger.info(f"Usage ledger flushed {len(rows)} rows")
+        return len(rows)
+
+    # ========================================================================
+    # Reporting
+    # ========================================================================
+
+    def get_local_totals(self) -> Dict[str, int]:
+        """Characters per provider recorded by this process (container lifetime)"""
+        with self._lock:
+            return dict(self._totals)
+
+    def get_summary(
+        self,
+        user_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        since: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Aggregated usage for dashboards and quota checks
+
+        Pending counts are flushed first so the result includes them.
+
+        Args:
+            user_id: Only this user's usage
+            job_id: Only this job's usage
+            since: First day included (default: first day of the current month)
+
+        Returns:
+            dict: {
+                'since': 'YYYY-MM-DD',
+                'billed_characters': int (DeepL),
+                'total_characters': int (all providers),
+                'by_provider': {provider: characters},
+                'by_language_pair': {'en-es': characters}
+            }
+        """
+        since = since or date.today().replace(day=1)
+        summary = {
+            'since': since.isoformat(),
+            'billed_characters': 0,
+            'total_characters': 0,
+            'by_provider': {},
+            'by_language_pair': {}
+        }
+
+        self.flush()
+
+        if self.database is None:
+            return summary
+
+        conditions = ['usage_date >= %s']
+        params: list = [since]
+        if user_id is not None:
+            conditions.append('user_id = %s')
+            params.append(user_id)
+        if job_id is not None:
+            conditions.append('job_id = %s')
+            params.append(job_id)
+
+        try:
+            with self._db_lock:
+                cursor = self.database.get_cursor()
+                try:
+                    cursor.execute(
+                        f'''
+                        SELECT provider, source_lang, target_lang, SUM(characters) AS characters
+                        FROM translation_usage
+                        WHERE {' AND '.join(conditions)}
+                        GROUP BY provider, source_lang, target_lang
+                        ''',
+                        params
+                    )
+                    rows = cursor.fetchall()
+                    self.database.conn.commit()
+                finally:
+                    cursor.close()
+
+        except Exception as e:
+            logger.warning(f"Usage ledger query failed: {e}")
+            self._rollback()
+            return summary
+
+        for row in rows:
+            characters = int(row['characters'])
+            pair = f"{row['source_lang']}-{row['target_lang']}"
+
+            summary['total_characters'] += characters
+            summary['by_provider'][row['provider']] = summary['by_provider'].get(row['provider'], 0) + characters
+            summary['by_language_pair'][pair] = summary['by_language_pair'].get(pair, 0) + characters
+
+            if row['provider'] == 'deepl':
+                summary['billed_characters'] += characters
+
+        return summary
+
+    def get_deepl_usage(
+        self,
+        fetch_usage: Callable[[], Dict[str, Any]],
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        DeepL account usage without a live call on every request
+
+        DeepL's counter (`fetch_usage`, e.g. DeepLTranslator.get_usage) is
+        called at most every reconcile_interval seconds (or when `force`);
+        in between, characters billed by this process are added to the last
+        reconciled count.
+
+        Returns:
+            dict: character_count, character_limit, percentage_used,
+                  reconciled_at (ISO timestamp), estimated (bool),
+                  drift (reconciled count minus local estimate, None on
+                  first reconciliation), error (only if the fetch failed)
+        """
+        with self._lock:
+            stale = (
+                force or
+                self._deepl_usage is None or
+                time.monotonic() - self._reconciled_at >= self.reconcile_interval
+            )
+
+        if stale:
+            self._reconcile(fetch_usage)
+
+        with self._lock:
+            usage = dict(self._deepl_usage or {'character_count': 0, 'character_limit': 0})
+            billed_since = self._deepl_billed_since
+
+        usage['character_count'] += billed_since
+        usage['estimated'] = billed_since > 0
+        limit = usage['character_limit']
+        usage['percentage_used'] = (usage['character_count'] / limit) * 100 if limit > 0 else 0
+        return usage
+
+    def _reconcile(self, fetch_usage: Callable[[], Dict[str, Any]]):
+        """Replace the local estimate with DeepL's counter"""
+        # Characters recorded while the fetch is in flight are not in DeepL's
+        # answer: only what was billed before it is replaced by the counter
+        with self._lock:
+            billed_before = self._deepl_billed_since
+
+        usage = fetch_usage()
+
+        with self._lock:
+            if usage.get('error') and self._deepl_usage is not None:
+                # Keep estimating from the previous reconciliation, try again later
+                self._reconciled_at = time.monotonic()
+                return
+
+            drift = None
+            if self._deepl_usage is not None:
+                estimate = self._deepl_usage['character_count'] + billed_before
+                drift = usage['character_count'] - estimate
+
+            self._deepl_usage = {
+                'character_count': usage['character_count'],
+                'character_limit': usage['character_limit'],
+                'reconciled_at': datetime.utcnow().isoformat() + 'Z',
+                'drift': drift
+            }
+            if usage.get('error'):
+                self._deepl_usage['error'] = usage['error']
+
+            self._deepl_billed_since -= billed_before
+            self._reconciled_at = time.monotonic()
+
+        if drift:
+            logger.info(f"DeepL usage reconciled: local estimate off by {drift} characters")
+
+    def _background_flush(self):
+        """Flush from a daemon thread"""
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._flushing = False
+
+    def _merge_back(self, pending: Dict[UsageKey, list]):
+        """Return unflushed counts to the pending aggregation"""
+        with self._lock:
+            for key, (characters, segments) in pending.items():
+                entry = self._pending[key]
+                entry[0] += characters
+                entry[1] += segments
+
+    def _rollback(self):
+        """Roll back a failed transaction so the connection stays usable"""
+        try:
+            if self.database.conn and not self.database.conn.closed:
+                self.database.conn.rollback()
+        except Exception:
+            pass
+
+
+# ============================================================================
+# Shared Instance
+# ============================================================================
+
+_usage_ledger: Optional[UsageLedger] = None
+_usage_ledger_lock = threading.Lock()
+
+
+def get_usage_ledger() -> UsageLedger:
+    """
+    Get the shared UsageLedger
+
+    Without a database (DB_HOST unset) the ledger still aggregates in
+    memory and estimates DeepL usage, it just never persists.
+    """
+    global _usage_ledger
+
+    with _usage_ledger_lock:
+        if _usage_ledger is None:
+            _usage_ledger = UsageLedger(
+                database=Database() if settings.DB_HOST else None,
+                flush_interval=settings.USAGE_LEDGER_FLUSH_SECONDS,
+                reconcile_interval=settings.USAGE_RECONCILE_SECONDS
+            )
+
+    return _usage_ledger
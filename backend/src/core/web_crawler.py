@@ -4,12 +4,17 @@ Crawls websites and extracts translatable content
 """
 
 import asyncio
+import time
 import aiohttp
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.parse import urlparse, urlunparse
 from typing import List, Dict, Set, Optional
 import logging
-import re
+
+from src.config.settings import settings
+from src.core.crawl_cache import CrawlCache, get_crawl_cache
+from src.core.crawl_frontier import CrawlFrontier, CrawlStats, HostPoliteness, should_skip_url
+from src.core.page_parser import decode_html, parse_html, scan_page, visible_text
+from src.core.sitemap import SitemapCollector
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,12 @@ class WebCrawler:
     - Extracts text content and structure
     - Word count calculation
     - Configurable page limit
+    - Concurrent fetching (CRAWL_CONCURRENCY) with adaptive per-host delay
+      honouring robots.txt Crawl-delay
+    - Sitemap discovery: pages listed in sitemap.xml / sitemap indexes are
+      queued up front (newest lastmod first), links are followed after them
+    - Shared crawl cache (src.core.crawl_cache): fresh pages are not
+      fetched again, stale ones are revalidated with ETag / Last-Modified
     """
 
     def __init__(self, max_pages: int = 50, timeout: int = 10):
@@ -73,37 +84,11 @@ class WebCrawler:
         - Non-HTML files (images, PDFs, etc.)
         - Social media links
         - Mailto/tel links
+
+        Rules are precompiled once (src.core.crawl_frontier); fragments
+        are already removed by normalize_url().
         """
-        skip_extensions = [
-            '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp',  # Images
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx',  # Documents
-            '.zip', '.tar', '.gz',  # Archives
-            '.mp3', '.mp4', '.avi',  # Media
-            '.css', '.js', '.json', '.xml'  # Assets
-        ]
-
-        skip_patterns = [
-            r'mailto:',
-            r'tel:',
-            r'javascript:',
-            r'#',  # Anchor-only links
-            r'facebook\.com',
-            r'twitter\.com',
-            r'linkedin\.com',
-            r'instagram\.com'
-        ]
-
-        url_lower = url.lower()
-
-        # Check extensions
-        if any(url_lower.endswith(ext) for ext in skip_extensions):
-            return True
-
-        # Check patterns
-        if any(re.search(pattern, url_lower) for pattern in skip_patterns):
-            return True
-
-        return False
+        return should_skip_url(url)
 
     def extract_links(self, html: str, base_url: str) -> List[str]:
         """
@@ -116,15 +101,18 @@ class WebCrawler:
         Returns:
             List of absolute URLs
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        links = []
+        return self.filter_links(scan_page(parse_html(html), base_url)['links'], base_url)
 
-        for anchor in soup.find_all('a', href=True):
-            href = anchor['href']
+    def filter_links(self, urls: List[str], base_url: str) -> List[str]:
+        """
+        Normalized same-domain page links (assets and social networks skipped)
 
-            # Convert to absolute URL
-            absolute_url = urljoin(base_url, href)
+        Visited and queued URLs are skipped by the crawl frontier, so links
+        are cached with the page independently of the current crawl.
+        """
+        links = []
 
+        for absolute_url in urls:
             # Normalize
             normalized_url = self.normalize_url(absolute_url)
 
@@ -136,9 +124,7 @@ class WebCrawler:
             if not self.is_same_domain(normalized_url, base_url):
                 continue
 
-            # Skip if already visited or queued
-            if normalized_url not in self.visited_urls:
-                links.append(normalized_url)
+            links.append(normalized_url)
 
         return links
 
@@ -152,20 +138,10 @@ class WebCrawler:
         Returns:
             tuple: (text_content, word_count)
         """
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Remove script and style elements
-        for element in soup(['script', 'style', 'noscript']):
-            element.decompose()
-
-        # Get text
-        text = soup.get_text(separator=' ', strip=True)
+        text = visible_text(parse_html(html))
 
         # Count words (split by whitespace)
-        words = text.split()
-        word_count = len([w for w in words if len(w) > 0])
-
-        return text, word_count
+        return text, len(text.split())
 
     def extract_metadata(self, html: str) -> Dict[str, Optional[str]]:
         """
@@ -177,69 +153,80 @@ class WebCrawler:
         Returns:
             dict: metadata
         """
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Extract title
-        title_tag = soup.find('title')
-        title = title_tag.string if title_tag else None
-
-        # Extract meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        description = meta_desc.get('content') if meta_desc else None
-
-        # Extract meta keywords
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        keywords = meta_keywords.get('content') if meta_keywords else None
+        scan = scan_page(parse_html(html), '')
 
         return {
-            'title': title,
-            'description': description,
-            'keywords': keywords
+            'title': scan['title'],
+            'description': scan['description'],
+            'keywords': scan['keywords']
         }
 
-    async def fetch_page(self, session: aiohttp.ClientSession, url: str) -> Optional[Dict]:
+    async def fetch_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        politeness: Optional[HostPoliteness] = None
+    ) -> Optional[Dict]:
         """
         Fetch single page and extract data
 
+        Fresh crawl cache entries are returned without a request; stale
+        ones are revalidated and a 304 reuses the cached page.
+
         Args:
             session: aiohttp session
             url: URL to fetch
+            politeness: Per-host delay policy (waits for the host's next
+                        slot and reports the response time and status)
 
         Returns:
             dict with page data or None if failed
         """
+        host = urlparse(url).netloc
+        cache = get_crawl_cache()
+        entry = None
+
+        if cache:
+            entry = await asyncio.to_thread(cache.lookup, url)
+            if entry and cache.is_fresh(entry):
+                cache.record_hit()
+                return await self._cached_page(cache, entry)
+
+        if politeness:
+            await asyncio.sleep(politeness.reserve(host))
+
+        start = time.monotonic()
+        status = None
+        retry_after = None
+
         try:
-            async with session.get(url, timeout=self.timeout) as response:
+            headers = cache.validators(entry) if cache else None
+            async with session.get(url, headers=headers, timeout=self.timeout) as response:
+                status = response.status
+                retry_after = response.headers.get('Retry-After')
+
+                if response.status == 304 and entry:
+                    entry = await asyncio.to_thread(cache.revalidated, entry, response.headers)
+                    return await self._cached_page(cache, entry)
+
+                if response.status >= 400:
+                    logger.warning(f"HTTP {response.status} fetching: {url}")
+                    return None
+
                 # Only process HTML
                 content_type = response.headers.get('Content-Type', '')
                 if 'text/html' not in content_type:
                     logger.warning(f"Skipping non-HTML: {url} ({content_type})")
                     return None
 
-                html = await response.text()
-
-                # Extract content
-                text_content, word_count = self.extract_text_content(html)
-                metadata = self.extract_metadata(html)
-                links = self.extract_links(html, url)
-
-                # Get URL path for filename
-                parsed_url = urlparse(url)
-                url_path = parsed_url.path.rstrip('/') or '/index'
-                if not url_path.endswith('.html'):
-                    url_path += '.html'
-                url_path = url_path.lstrip('/')
-
-                return {
-                    'url': url,
-                    'url_path': url_path,
-                    'html': html,
-                    'text': text_content,
-                    'word_count': word_count,
-                    'title': metadata['title'],
-                    'meta_description': metadata['description'],
-                    'links': links
-                }
+                body = await response.read()
+                page = self.parse_page(url, body, content_type)
+
+                if cache:
+                    await asyncio.to_thread(
+                        cache.store, url, response.status, response.headers, body, str(response.url), 'crawler', page
+                    )
+                return page
 
         except asyncio.TimeoutError:
             logger.error(f"Timeout fetching: {url}")
@@ -247,6 +234,122 @@ class WebCrawler:
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
+        finally:
+            if politeness:
+                politeness.record(
+                    host,
+                    time.monotonic() - start,
+                    status,
+                    float(retry_after) if retry_after and retry_after.isdigit() else None
+                )
+
+    def parse_page(self, url: str, body: bytes, content_type: Optional[str] = None) -> Dict:
+        """
+        Extract page data from one parse of the page (src.core.page_parser)
+
+        Args:
+            url: Page URL (base for relative links)
+            body: Response body
+            content_type: Content-Type header (charset; else <meta charset>)
+
+        Returns:
+            dict: url, url_path, html, text, word_count, title,
+                  meta_description, links
+        """
+        html = decode_html(body, content_type)
+        soup = parse_html(html)
+
+        # Extract content
+        text_content = visible_text(soup)
+        word_count = len(text_content.split())
+        metadata = scan_page(soup, url)
+        links = self.filter_links(metadata['links'], url)
+
+        # Get URL path for filename
+        parsed_url = urlparse(url)
+        url_path = parsed_url.path.rstrip('/') or '/index'
+        if not url_path.endswith('.html'):
+            url_path += '.html'
+        url_path = url_path.lstrip('/')
+
+        return {
+            'url': url,
+            'url_path': url_path,
+            'html': html,
+            'text': text_content,
+            'word_count': word_count,
+            'title': metadata['title'],
+            'meta_description': metadata['description'],
+            'links': links
+        }
+
+    async def _cached_page(self, cache: CrawlCache, entry: Dict) -> Optional[Dict]:
+        """Page data of a cache entry (parsed now if only another consumer parsed it)"""
+        page = entry['pages'].get('crawler')
+
+        if page is None:
+            if 'text/html' not in entry['content_type']:
+                return None
+            page = self.parse_page(entry['url'], entry['body'], entry['content_type'])
+            await asyncio.to_thread(cache.add_page, entry, 'crawler', page)
+
+        return page
+
+    async def load_robots(self, session: aiohttp.ClientSession, url: str, politeness: HostPoliteness):
+        """
+        Fetch the host's robots.txt and apply its Crawl-delay
+
+        Returns:
+            Parsed robots.txt (for its Sitemap: lines), None if there is none
+        """
+        parsed = urlparse(url)
+        robots_txt = None
+
+        try:
+            async with session.get(f"{parsed.scheme}://{parsed.netloc}/robots.txt", timeout=self.timeout) as response:
+                if response.status == 200:
+                    robots_txt = await response.text()
+        except Exception as e:
+            logger.info(f"robots.txt not available for {parsed.netloc}: {e}")
+
+        return politeness.set_robots(parsed.netloc, robots_txt)
+
+    async def discover_sitemap_urls(
+        self,
+        session: aiohttp.ClientSession,
+        start_url: str,
+        robots,
+        politeness: HostPoliteness
+    ) -> List[str]:
+        """
+        Page URLs listed in the site's sitemaps, newest first
+
+        Sitemaps come from robots.txt Sitemap: lines (default /sitemap.xml);
+        sitemap indexes and gzipped sitemaps are followed.
+
+        Returns:
+            list: Normalized same-host URLs ([] if the site has no sitemap)
+        """
+        collector = SitemapCollector(
+            start_url,
+            robots.site_maps() if robots else None,
+            normalize=self.normalize_url,
+            accept=lambda url: not self.should_skip_url(url)
+        )
+
+        while (sitemap_url := collector.next()):
+            await asyncio.sleep(politeness.reserve(urlparse(sitemap_url).netloc))
+            try:
+                async with session.get(sitemap_url, timeout=self.timeout) as response:
+                    if response.status == 200:
+                        collector.feed(sitemap_url, await response.read())
+            except Exception as e:
+                logger.info(f"Sitemap not available {sitemap_url}: {e}")
+
+        urls = collector.urls()
+        if urls:
+            logger.info(f"Sitemaps list {len(urls)} pages for {urlparse(start_url).netloc}")
+        return urls
 
     async def crawl(self, start_url: str) -> Dict:
         """
@@ -260,15 +363,20 @@ class WebCrawler:
                 'pages': List of page data,
                 'pages_count': Total pages crawled,
                 'word_count': Total words,
-                'base_url': Starting URL
+                'base_url': Starting URL,
+                'stats': pages, errors, bytes, seconds, pages_per_second,
+                         sitemap_urls, hosts
             }
         """
         # Normalize start URL
         start_url = self.normalize_url(start_url)
 
-        # Initialize
-        to_visit = [start_url]
+        # Initialize: adaptive per-host delay
+        politeness = HostPoliteness()
+        stats = CrawlStats()
+        concurrency = max(1, settings.CRAWL_CONCURRENCY)
         total_words = 0
+        pages = []
 
         # Create session with proper headers
         headers = {
@@ -276,40 +384,68 @@ class WebCrawler:
         }
 
         async with aiohttp.ClientSession(headers=headers, timeout=self.timeout) as session:
-            while to_visit and len(self.pages_data) < self.max_pages:
-                url = to_visit.pop(0)
+            robots = await self.load_robots(session, start_url, politeness)
+
+            # O(1) frontier, seeded with the sitemap's pages when there is one
+            sitemap_urls = []
+            if settings.CRAWL_SITEMAPS_ENABLED:
+                sitemap_urls = await self.discover_sitemap_urls(session, start_url, robots, politeness)
+            follow_links = settings.CRAWL_FOLLOW_LINKS or not sitemap_urls
+            frontier = CrawlFrontier([start_url, *sitemap_urls])
+
+            in_flight: Dict[asyncio.Task, tuple] = {}
+            order = 0
+
+            while frontier or in_flight:
+                # Fill free slots (pages in flight count against max_pages)
+                while frontier and len(in_flight) < concurrency and len(pages) + len(in_flight) < self.max_pages:
+                    url = frontier.pop()
+                    order += 1
+
+                    logger.info(f"Crawling: {url} ({len(pages) + len(in_flight) + 1}/{self.max_pages})")
+
+                    # Mark as visited
+                    self.visited_urls.add(url)
+                    in_flight[asyncio.create_task(self.fetch_page(session, url, politeness))] = order
 
-                # Skip if already visited
-                if url in self.visited_urls:
-                    continue
+                if not in_flight:
+                    break
 
-                logger.info(f"Crawling: {url} ({len(self.pages_data) + 1}/{self.max_pages})")
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
 
-                # Mark as visited
-                self.visited_urls.add(url)
+                for task in done:
+                    page_order = in_flight.pop(task)
+                    page_data = task.result()
 
-                # Fetch page
-                page_data = await self.fetch_page(session, url)
+                    if not page_data:
+                        stats.record_error()
+                        continue
 
-                if page_data:
-                    self.pages_data.append(page_data)
+                    stats.record_page(len(page_data['html']))
+                    pages.append((page_order, page_data))
                     total_words += page_data['word_count']
 
-                    # Add new links to queue
-                    for link in page_data['links']:
-                        if link not in self.visited_urls and link not in to_visit:
-                            to_visit.append(link)
+                    # Add new links to queue (the frontier skips known URLs)
+                    if follow_links:
+                        for link in page_data['links']:
+                            frontier.add(link)
 
-                # Small delay to be polite
-                await asyncio.sleep(0.5)
+        # Discovery order, independent of which fetch finished first
+        self.pages_data = [page for _, page in sorted(pages, key=lambda item: item[0])]
+        crawl_stats = stats.as_dict(politeness)
+        crawl_stats['sitemap_urls'] = len(sitemap_urls)
 
-        logger.info(f"Crawl complete: {len(self.pages_data)} pages, {total_words} words")
+        logger.info(
+            f"Crawl complete: {len(self.pages_data)} pages, {total_words} words "
+            f"({crawl_stats['pages_per_second']} pages/s)"
+        )
 
         return {
             'pages': self.pages_data,
             'pages_count': len(self.pages_data),
             'word_count': total_words,
-            'base_url': start_url
+            'base_url': start_url,
+            'stats': crawl_stats
         }
 
 
@@ -3,29 +3,72 @@ TranslateCloud - Web Content Extractor
 Extrae contenido traducible de sitios web manteniendo estructura
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+import copy
 import requests
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 import logging
 
+from src.config.settings import settings
+from src.core.crawl_cache import CrawlCache, get_crawl_cache
+from src.core.crawl_frontier import CrawlFrontier, CrawlStats, HostPoliteness, USER_AGENT, should_skip_url
+from src.core.page_parser import ElementPathIndex, parse_html, scan_page
+from src.core.single_flight import get_single_flight
+from src.core.sitemap import SitemapCollector
+
 logger = logging.getLogger(__name__)
 
+# Tags que contienen texto traducible
+TEXT_TAGS = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'span', 'div', 'a']
+
+# Tags de bloque: un elemento que contiene alguno es un contenedor, no un fragmento
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'dd', 'details', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5',
+    'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+    'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'ul',
+})
+
+# Contenido que no debe enviarse a DeepL como parte de un fragmento
+NON_TRANSLATABLE_TAGS = frozenset({
+    'script', 'style', 'noscript', 'template', 'svg', 'math', 'iframe', 'canvas', 'object',
+})
+
 
 class WebExtractor:
     """
     Extractor de contenido web para traducción
     """
     
-    def __init__(self):
+    def __init__(self, fragment_mode: Optional[bool] = None):
+        """
+        Args:
+            fragment_mode: Extraer el HTML interno de cada bloque de texto
+                           (default: settings.HTML_FRAGMENT_MODE)
+        """
+        self.fragment_mode = settings.HTML_FRAGMENT_MODE if fragment_mode is None else fragment_mode
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'TranslateCloud-Bot/1.0'
+            'User-Agent': USER_AGENT
         })
+        # Una conexión keep-alive por página en paralelo
+        adapter = HTTPAdapter(pool_maxsize=max(10, settings.CRAWL_CONCURRENCY))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Política de cortesía por host (solo durante crawl_website)
+        self.politeness: Optional[HostPoliteness] = None
     
     def crawl_page(self, url: str) -> Optional[Dict]:
         """
         Crawlea una página y extrae contenido traducible
+
+        Crawls simultáneos de la misma URL (varios usuarios o jobs a la vez)
+        hacen una sola petición HTTP: el resto espera su resultado.
         
         Args:
             url: URL de la página a crawlear
@@ -33,57 +76,154 @@ class WebExtractor:
         Returns:
             Dict con estructura de la página y contenido
         """
+        if not settings.SINGLE_FLIGHT_ENABLED:
+            return self._fetch_page(url)
+
+        flights = get_single_flight('crawl', timeout=settings.SINGLE_FLIGHT_TIMEOUT_SECONDS)
+        page, shared = flights.do((url, self.fragment_mode), lambda: self._fetch_page(url))
+
+        # Copia: el resultado compartido no debe modificarse
+        return copy.deepcopy(page) if shared else page
+
+    def _fetch_page(self, url: str) -> Optional[Dict]:
+        """
+        Descarga y analiza una página (ver crawl_page)
+
+        Con la caché de crawl, una entrada fresca no hace ninguna petición
+        (ni análisis, si la página ya se analizó en este modo); una entrada
+        caducada se revalida con If-None-Match / If-Modified-Since y un 304
+        reutiliza el cuerpo y el análisis guardados.
+        """
+        cache = get_crawl_cache()
+        consumer = 'extractor:fragments' if self.fragment_mode else 'extractor:elements'
+
         try:
-            response = self.session.get(url, timeout=30)
+            entry = cache.lookup(url) if cache else None
+            if entry and cache.is_fresh(entry):
+                cache.record_hit()
+                return self._cached_page(cache, entry, consumer)
+
+            response = self._get(url, headers=cache.validators(entry) if cache else None)
+            if response.status_code == 304 and entry:
+                return self._cached_page(cache, cache.revalidated(entry, response.headers), consumer)
+
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extraer metadatos
-            title = soup.find('title')
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            
-            # Extraer elementos traducibles
-            elements = self._extract_translatable_elements(soup)
-            
-            # Contar palabras
-            word_count = sum(len(el['text'].split()) for el in elements)
-            
-            return {
-                'url': url,
-                'title': title.string if title else '',
-                'meta_description': meta_desc.get('content', '') if meta_desc else '',
-                'elements': elements,
-                'word_count': word_count,
-                'html_original': str(soup)
-            }
-            
+            page = self._parse_page(url, response.content, response.url or url, response.headers.get('Content-Type'))
+
+            if cache:
+                cache.store(url, response.status_code, response.headers, response.content, response.url, consumer, page)
+            return page
+
         except Exception as e:
             logger.error(f'Error crawling {url}: {str(e)}')
             return None
+
+    def _cached_page(self, cache: CrawlCache, entry: Dict, consumer: str) -> Dict:
+        """Página de una entrada de caché, analizando el cuerpo si este modo aún no lo hizo"""
+        page = entry['pages'].get(consumer)
+
+        if page is None:
+            page = self._parse_page(entry['url'], entry['body'], entry['final_url'], entry['content_type'])
+            cache.add_page(entry, consumer, page)
+
+        return page
+
+    def _parse_page(self, url: str, content: bytes, final_url: str, content_type: Optional[str] = None) -> Dict:
+        """
+        Extrae metadatos, elementos traducibles y enlaces con un solo
+        análisis lxml (charset de la cabecera o de <meta>, ver page_parser)
+        """
+        soup = parse_html(content, content_type)
+        
+        # Extraer metadatos y enlaces (un solo recorrido)
+        scan = scan_page(soup, final_url)
+        
+        # Extraer elementos traducibles
+        elements = self._extract_translatable_elements(soup)
+        
+        # Contar palabras
+        word_count = sum(len(el['text'].split()) for el in elements)
+        
+        return {
+            'url': url,
+            'title': scan['title'] or '',
+            'meta_description': scan['description'] or '',
+            'elements': elements,
+            'word_count': word_count,
+            'html_original': str(soup),
+            'links': self._filter_links(scan['links'])
+        }
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        GET con timeout; durante crawl_website espera el turno del host y
+        adapta su retardo a la latencia y a los 429/503
+        """
+        timeout = (min(5.0, settings.CRAWL_TIMEOUT_SECONDS), settings.CRAWL_TIMEOUT_SECONDS)
+        politeness = self.politeness
+
+        if politeness is None:
+            return self.session.get(url, headers=headers, timeout=timeout)
+
+        host = urlparse(url).netloc
+        time.sleep(politeness.reserve(host))
+
+        start = time.monotonic()
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout)
+        except requests.RequestException:
+            politeness.record(host, time.monotonic() - start)
+            raise
+
+        politeness.record(
+            host,
+            time.monotonic() - start,
+            response.status_code,
+            _parse_retry_after(response.headers.get('Retry-After'))
+        )
+        return response
+
+    def _filter_links(self, urls: List[str]) -> List[str]:
+        """Enlaces http(s) normalizados de la página, sin recursos ni redes sociales"""
+        links = []
+
+        for url in urls:
+            next_url = self._normalize_url(url)
+
+            if urlparse(next_url).scheme in ('http', 'https') and not should_skip_url(next_url):
+                links.append(next_url)
+
+        return links
     
     def _extract_translatable_elements(self, soup: BeautifulSoup) -> List[Dict]:
         """
         Extrae elementos traducibles del HTML
         
+        En fragment_mode cada bloque de texto se extrae una sola vez (ver
+        _extract_fragments); si no, cada tag de TEXT_TAGS con su texto plano.
+        El XPath de cada elemento sale de un índice calculado en un solo
+        recorrido del árbol (ElementPathIndex).
+
         Returns:
             Lista de elementos con su contenido y metadata
         """
-        elements = []
-        
-        # Tags que contienen texto traducible
-        text_tags = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'span', 'div', 'a']
-        
-        for tag in soup.find_all(text_tags):
-            text = tag.get_text(strip=True)
-            
-            if text and len(text) > 3:  # Ignorar textos muy cortos
-                elements.append({
-                    'tag': tag.name,
-                    'text': text,
-                    'attrs': dict(tag.attrs),
-                    'xpath': self._get_xpath(tag)
-                })
+        paths = ElementPathIndex(soup)
+
+        if self.fragment_mode:
+            elements = self._extract_fragments(soup, paths)
+        else:
+            elements = []
+
+            for tag in soup.find_all(TEXT_TAGS):
+                text = tag.get_text(strip=True)
+
+                if text and len(text) > 3:  # Ignorar textos muy cortos
+                    elements.append({
+                        'tag': tag.name,
+                        'text': text,
+                        'attrs': dict(tag.attrs),
+                        'xpath': paths.path(tag)
+                    })
         
         # Extraer alt text de imágenes
         for img in soup.find_all('img'):
@@ -93,108 +233,234 @@ class WebExtractor:
                     'tag': 'img',
                     'text': alt,
                     'attrs': {'alt': alt, 'src': img.get('src', '')},
-                    'xpath': self._get_xpath(img)
+                    'xpath': paths.path(img)
                 })
         
         return elements
     
-    def _get_xpath(self, element) -> str:
+    def _extract_fragments(self, soup: BeautifulSoup, paths: ElementPathIndex) -> List[Dict]:
         """
-        Genera XPath simplificado para ubicar el elemento
+        Extrae los bloques hoja de texto con su HTML interno
+
+        Un bloque hoja es un tag de TEXT_TAGS sin bloques dentro (un <p>, un
+        <li> sin listas anidadas, un <div> que solo contiene texto e inline).
+        Sus hijos inline (<a>, <b>, <em>, <span>) no se extraen por separado:
+        el bloque se traduce entero con DeepL tag_handling='html' y el
+        reconstructor sustituye su contenido, conservando el marcado.
+
+        Los elementos con hijos incluyen 'html' (HTML interno a traducir);
+        los que solo tienen texto se traducen como texto plano. Los bloques
+        con NON_TRANSLATABLE_TAGS dentro se omiten.
+
+        Returns:
+            Lista de elementos (mismo formato que el modo texto + 'html')
         """
-        components = []
-        child = element if element.name else element.parent
+        elements = []
+        units = set()
 
-        for parent in child.parents:
-            siblings = parent.find_all(child.name, recursive=False)
-            components.append(
-                child.name if len(siblings) == 1
-                else f'{child.name}[{siblings.index(child) + 1}]'
-            )
-            child = parent
+        # find_all recorre en orden de documento: los ancestros van primero
+        for tag in soup.find_all(TEXT_TAGS):
+            if any(id(parent) in units for parent in tag.parents):
+                continue
+
+            # Contenedor de otros bloques: se extraen sus hijos
+            if tag.find(BLOCK_TAGS) is not None:
+                continue
+
+            # Bloques con scripts, estilos, SVG... no se pueden reescribir
+            if tag.find(NON_TRANSLATABLE_TAGS) is not None:
+                continue
+
+            text = tag.get_text(strip=True)
 
-        components.reverse()
-        return '/' + '/'.join(components)
+            if not text or len(text) <= 3:  # Ignorar textos muy cortos
+                continue
+
+            units.add(id(tag))
+            element = {
+                'tag': tag.name,
+                'text': text,
+                'attrs': dict(tag.attrs),
+                'xpath': paths.path(tag)
+            }
+
+            if any(isinstance(child, Tag) for child in tag.children):
+                element['html'] = tag.decode_contents()
+
+            elements.append(element)
+
+        return elements
 
     def crawl_website(self, base_url: str, max_pages: int = 50) -> Dict:
         """
         Crawl entire website starting from base_url
 
+        The frontier is seeded from the site's sitemaps (robots.txt Sitemap:
+        lines or /sitemap.xml, newest <lastmod> first), so the page list is
+        known before the first page is parsed; <a href> links are followed
+        after them (CRAWL_FOLLOW_LINKS) and always when there is no sitemap.
+
+        Up to CRAWL_CONCURRENCY pages are fetched in parallel (threads).
+        Request starts to the host are spaced by an adaptive delay: never
+        below robots.txt Crawl-delay, growing with the server's response
+        time and on 429/503 (see src.core.crawl_frontier.HostPoliteness).
+
         Args:
             base_url: Starting URL
             max_pages: Maximum pages to crawl
 
         Returns:
-            Dict with pages_count, word_count, and pages list
+            Dict with pages_count, word_count, pages list (in discovery
+            order) and stats (pages, errors, bytes, seconds,
+            pages_per_second, sitemap_urls, per-host delays)
         """
-        visited = set()
-        to_visit = [self._normalize_url(base_url)]
+        start_url = self._normalize_url(base_url)
+        base_domain = urlparse(base_url).netloc
+
+        politeness = HostPoliteness()
+        stats = CrawlStats()
+        concurrency = max(1, settings.CRAWL_CONCURRENCY)
+
+        robots = self._load_robots(start_url, politeness)
+        self.politeness = politeness
+
         pages_data = []
         total_words = 0
+        attempted = 0
 
-        base_domain = urlparse(base_url).netloc
+        try:
+            sitemap_urls = self._discover_sitemap_urls(start_url, robots) if settings.CRAWL_SITEMAPS_ENABLED else []
+            follow_links = settings.CRAWL_FOLLOW_LINKS or not sitemap_urls
+            frontier = CrawlFrontier([start_url, *sitemap_urls])
 
-        while to_visit and len(visited) < max_pages:
-            url = to_visit.pop(0)
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='crawl') as executor:
+                in_flight = {}
 
-            if url in visited:
-                continue
+                while frontier or in_flight:
+                    while frontier and len(in_flight) < concurrency and attempted < max_pages:
+                        url = frontier.pop()
+                        attempted += 1
+                        logger.info(f"Crawling {attempted}/{max_pages}: {url}")
+                        in_flight[executor.submit(self.crawl_page, url)] = (attempted, url)
 
-            # Only crawl same domain
-            if urlparse(url).netloc != base_domain:
-                continue
+                    if not in_flight:
+                        break
 
-            visited.add(url)
-            logger.info(f"Crawling {len(visited)}/{max_pages}: {url}")
-
-            # Crawl page
-            page_data = self.crawl_page(url)
-
-            if page_data:
-                # Get URL path for filename
-                parsed_url = urlparse(url)
-                url_path = parsed_url.path.rstrip('/') or '/index'
-                if not url_path.endswith('.html'):
-                    url_path += '.html'
-                url_path = url_path.lstrip('/')
-
-                pages_data.append({
-                    'url': url,
-                    'url_path': url_path,
-                    'title': page_data['title'],
-                    'word_count': page_data['word_count'],
-                    'meta_description': page_data['meta_description'],
-                    'html': page_data['html_original'],
-                    'elements': page_data['elements']
-                })
-                total_words += page_data['word_count']
-
-                # Extract links for further crawling
-                if len(visited) < max_pages:
-                    soup = BeautifulSoup(page_data['html_original'], 'html.parser')
-                    for link in soup.find_all('a', href=True):
-                        next_url = urljoin(url, link['href'])
-                        next_url = self._normalize_url(next_url)
-
-                        # Filter: same domain, http/https only, not already queued
-                        parsed = urlparse(next_url)
-                        if (parsed.netloc == base_domain and
-                            parsed.scheme in ['http', 'https'] and
-                            next_url not in visited and
-                            next_url not in to_visit and
-                            not any(next_url.endswith(ext) for ext in ['.pdf', '.jpg', '.png', '.zip', '.css', '.js'])):
-                            to_visit.append(next_url)
-
-        logger.info(f"Crawl complete: {len(pages_data)} pages, {total_words} words")
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        order, url = in_flight.pop(future)
+                        page_data = future.result()
+
+                        if not page_data:
+                            stats.record_error()
+                            continue
+
+                        stats.record_page(len(page_data['html_original']))
+                        pages_data.append((order, self._page_entry(url, page_data)))
+                        total_words += page_data['word_count']
+
+                        # Extract links for further crawling (same domain only)
+                        if follow_links and attempted < max_pages:
+                            for next_url in page_data.get('links', []):
+                                if urlparse(next_url).netloc == base_domain:
+                                    frontier.add(next_url)
+
+        finally:
+            self.politeness = None
+
+        pages = [page for _, page in sorted(pages_data, key=lambda item: item[0])]
+        crawl_stats = stats.as_dict(politeness)
+        crawl_stats['sitemap_urls'] = len(sitemap_urls)
+
+        logger.info(
+            f"Crawl complete: {len(pages)} pages, {total_words} words "
+            f"({crawl_stats['pages_per_second']} pages/s, {crawl_stats['errors']} errors)"
+        )
 
         return {
-            'pages_count': len(pages_data),
+            'pages_count': len(pages),
             'word_count': total_words,
-            'pages': pages_data
+            'pages': pages,
+            'stats': crawl_stats
         }
 
+    def _page_entry(self, url: str, page_data: Dict) -> Dict:
+        """Entrada de crawl_website para una página (con url_path para el ZIP)"""
+        # Get URL path for filename
+        parsed_url = urlparse(url)
+        url_path = parsed_url.path.rstrip('/') or '/index'
+        if not url_path.endswith('.html'):
+            url_path += '.html'
+        url_path = url_path.lstrip('/')
+
+        return {
+            'url': url,
+            'url_path': url_path,
+            'title': page_data['title'],
+            'word_count': page_data['word_count'],
+            'meta_description': page_data['meta_description'],
+            'html': page_data['html_original'],
+            'elements': page_data['elements']
+        }
+
+    def _load_robots(self, start_url: str, politeness: HostPoliteness):
+        """
+        Descarga robots.txt del host (Crawl-delay); sin robots.txt, retardo mínimo
+
+        Returns:
+            RobotFileParser (líneas Sitemap:) o None sin robots.txt
+        """
+        parsed = urlparse(start_url)
+        robots_txt = None
+
+        try:
+            response = self.session.get(
+                f"{parsed.scheme}://{parsed.netloc}/robots.txt",
+                timeout=(min(5.0, settings.CRAWL_TIMEOUT_SECONDS), settings.CRAWL_TIMEOUT_SECONDS)
+            )
+            if response.status_code == 200:
+                robots_txt = response.text
+        except requests.RequestException as e:
+            logger.info(f"robots.txt not available for {parsed.netloc}: {e}")
+
+        return politeness.set_robots(parsed.netloc, robots_txt)
+
+    def _discover_sitemap_urls(self, start_url: str, robots) -> List[str]:
+        """
+        URLs de páginas de los sitemaps del sitio (índices y .xml.gz
+        incluidos), la más reciente primero; [] si no hay sitemap
+        """
+        collector = SitemapCollector(
+            start_url,
+            robots.site_maps() if robots else None,
+            normalize=self._normalize_url,
+            accept=lambda url: not should_skip_url(url)
+        )
+
+        while (sitemap_url := collector.next()):
+            try:
+                response = self._get(sitemap_url)
+                if response.status_code == 200:
+                    collector.feed(sitemap_url, response.content)
+            except requests.RequestException as e:
+                logger.info(f"Sitemap not available {sitemap_url}: {e}")
+
+        urls = collector.urls()
+        if urls:
+            logger.info(f"Sitemaps list {len(urls)} pages for {urlparse(start_url).netloc}")
+        return urls
+
     def _normalize_url(self, url: str) -> str:
         """Remove fragments and trailing slashes"""
         parsed = urlparse(url)
         path = parsed.path.rstrip('/') if parsed.path != '/' else '/'
         return f"{parsed.scheme}://{parsed.netloc}{path}"
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Segundos de Retry-After (None si falta o es una fecha)"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
@@ -75,6 +75,7 @@ async def get_translation_status():
         "deepl_available": status['deepl_available'],
         "marian_available": status['marian_available'],
         "primary_provider": status['primary_provider'],
+        "providers": status['providers'],
         "status": "operational" if status['primary_provider'] else "degraded"
     }
 
@@ -90,6 +91,9 @@ async def get_translation_usage():
             "characters_used": usage['character_count'],
             "characters_limit": usage['character_limit'],
             "percentage_used": usage['percentage_used'],
+            "estimated": usage['estimated'],
+            "reconciled_at": usage.get('reconciled_at'),
+            "local_characters": service.ledger.get_local_totals(),
             "available": True
         }
     else:
@@ -97,4 +101,57 @@ async def get_translation_usage():
             "provider": "marian",
             "message": "DeepL not configured - using MarianMT fallback",
             "available": False
-        }
\ No newline at end of file
+        }
+
+@app.get("/api/translation/memory")
+async def get_translation_memory_stats():
+    """Get translation memory hit/miss statistics for this container"""
+    service = get_translation_service()
+    stats = service.get_memory_stats()
+
+    if stats:
+        return {"enabled": True, **stats}
+    else:
+        return {
+            "enabled": False,
+            "message": "Translation memory disabled (no database configured)"
+        }
+
+@app.get("/api/translation/cache")
+async def get_translation_cache_stats():
+    """Get translation cache statistics (in-process and /tmp tiers) for this container"""
+    service = get_translation_service()
+    stats = service.get_cache_stats()
+
+    if stats:
+        return {"enabled": True, **stats}
+    else:
+        return {"enabled": False, "message": "Translation cache disabled"}
+
+@app.get("/api/translation/models")
+async def get_model_cache_stats():
+    """Get MarianMT model cache statistics (loads, evictions, memory) for this container"""
+    service = get_translation_service()
+    stats = service.get_model_cache_stats()
+
+    if stats:
+        return {"enabled": True, **stats}
+    else:
+        return {"enabled": False, "message": "MarianMT not available"}
+
+@app.get("/api/translation/fuzzy")
+async def get_fuzzy_match_stats():
+    """Get fuzzy translation memory statistics for this container"""
+    service = get_translation_service()
+    stats = service.get_fuzzy_stats()
+
+    if stats:
+        return {"enabled": True, **stats}
+    else:
+        return {"enabled": False, "message": "Fuzzy matching disabled"}
+
+@app.get("/api/translation/routing")
+async def get_provider_routing_stats():
+    """Get provider routing decisions and per-provider latency percentiles for this container"""
+    service = get_translation_service()
+    return service.get_routing_stats()
@@ -84,6 +84,9 @@ class JobStatusResponse(BaseModel):
     pages_translated: Optional[int] = None
     words_total: Optional[int] = None
     words_translated: Optional[int] = None
+    segments_total: Optional[int] = Field(None, description="Text segments extracted from all pages")
+    segments_unique: Optional[int] = Field(None, description="Distinct segments sent for translation")
+    dedup_ratio: Optional[float] = Field(None, ge=0, le=1, description="Share of segments served by job-wide deduplication")
     created_at: datetime
     updated_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
@@ -108,6 +111,9 @@ class JobStatusResponse(BaseModel):
                 "pages_translated": 7,
                 "words_total": 5000,
                 "words_translated": 3500,
+                "segments_total": 1200,
+                "segments_unique": 420,
+                "dedup_ratio": 0.65,
                 "created_at": "2025-10-20T15:30:00Z",
                 "started_at": "2025-10-20T15:30:05Z",
                 "message": "Translating page 7 of 10..."
@@ -163,6 +169,9 @@ class DynamoDBJob(BaseModel):
     pages_translated: Optional[int] = None
     words_total: Optional[int] = None
     words_translated: Optional[int] = None
+    segments_total: Optional[int] = None
+    segments_unique: Optional[int] = None
+    dedup_ratio: Optional[float] = None  # Stored as Decimal in DynamoDB
     created_at: str  # ISO format string for DynamoDB
     updated_at: Optional[str] = None
     started_at: Optional[str] = None
@@ -0,0 +1,92 @@
+"""
+Tests para CircuitBreaker
+"""
+
+import asyncio
+
+import pytest
+from src.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.core.deepl_translator import DeepLTranslator
+from src.core.rate_limiter import AdaptiveRateController
+
+
+def half_open_breaker():
+    """Breaker abierto por un fallo, ya en half-open (timeout 0)"""
+    breaker = CircuitBreaker('test', failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == HALF_OPEN
+    return breaker
+
+
+def test_opens_after_threshold():
+    """Test el circuito se abre tras N fallos consecutivos"""
+    breaker = CircuitBreaker('test', failure_threshold=3, recovery_timeout=60.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.get_status()['rejected'] == 1
+
+
+def test_half_open_admits_one_probe():
+    """Test half-open deja pasar una sola sonda; su resultado decide el estado"""
+    breaker = half_open_breaker()
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+
+    breaker = half_open_breaker()
+    assert breaker.allow_request()
+    breaker.recovery_timeout = 60.0
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_abandoned_probe_frees_slot():
+    """Test una sonda abandonada libera su slot sin cambiar el estado"""
+    breaker = half_open_breaker()
+
+    assert breaker.allow_request()
+    breaker.record_abandoned()
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+
+    # Fuera de half-open no hace nada
+    breaker.record_success()
+    breaker.record_abandoned()
+    assert breaker.state == CLOSED
+
+
+def test_cancelled_deepl_probe_releases_breaker():
+    """Test una sonda half-open cancelada no deja el circuito bloqueado"""
+    translator = DeepLTranslator('test-key:fx')
+    translator.breaker = half_open_breaker()
+    translator.rate_controller = AdaptiveRateController('test')
+
+    class HangingClient:
+        async def translate(self, texts, **kwargs):
+            await asyncio.sleep(10)
+
+    translator.async_client = HangingClient()
+
+    async def scenario():
+        task = asyncio.create_task(translator.translate_batch_async(['Hola'], 'es', 'en'))
+        await asyncio.sleep(0.05)
+        assert not translator.breaker.allow_request()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+
+    assert translator.breaker.state == HALF_OPEN
+    assert translator.breaker.allow_request()
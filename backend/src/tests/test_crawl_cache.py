@@ -0,0 +1,75 @@
+"""
+Tests para la caché de rastreo (frescura y revalidación con ETag)
+"""
+
+import asyncio
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.core import web_crawler
+from src.core.crawl_cache import CrawlCache, DiskCrawlCacheBackend
+from src.core.web_crawler import WebCrawler
+
+PAGE = b'<html><head><title>Inicio</title></head><body><p>Hola mundo</p><a href="/precios">Precios</a></body></html>'
+
+
+def make_cache(tmp_path, ttl_seconds=3600):
+    return CrawlCache(DiskCrawlCacheBackend(str(tmp_path), 1024 * 1024), ttl_seconds)
+
+
+def test_store_lookup_and_validators(tmp_path):
+    """Test una respuesta se guarda con sus validadores; no-store no se guarda"""
+    cache = make_cache(tmp_path)
+    url = 'https://example.com/'
+
+    cache.store(url, 200, {'ETag': '"v1"', 'Last-Modified': 'Wed, 01 Oct 2025 10:00:00 GMT'}, PAGE)
+    entry = cache.lookup(url)
+
+    assert entry['body'] == PAGE
+    assert cache.is_fresh(entry)
+    assert cache.validators(entry) == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 01 Oct 2025 10:00:00 GMT'
+    }
+
+    assert cache.store('https://example.com/privado', 200, {'Cache-Control': 'private, no-store'}, PAGE) is None
+    assert cache.lookup('https://example.com/privado') is None
+
+
+def test_crawler_serves_fresh_and_revalidates_stale(tmp_path, monkeypatch):
+    """Test entrada fresca sin petición; entrada caducada con petición condicional y 304"""
+    cache = make_cache(tmp_path)
+    monkeypatch.setattr(web_crawler, 'get_crawl_cache', lambda: cache)
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304, headers={'ETag': '"v1"'})
+        return web.Response(body=PAGE, content_type='text/html', charset='utf-8', headers={'ETag': '"v1"'})
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get('/', handler)
+
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            crawler = WebCrawler()
+            url = str(server.make_url('/'))
+
+            first = await crawler.fetch_page(session, url)
+            fresh = await crawler.fetch_page(session, url)
+
+            cache.ttl_seconds = 0
+            revalidated = await crawler.fetch_page(session, url)
+
+        return first, fresh, revalidated
+
+    first, fresh, revalidated = asyncio.run(scenario())
+
+    assert first['title'] == 'Inicio'
+    assert fresh == first
+    assert revalidated['text'] == first['text']
+    assert requests == [None, '"v1"']
+    assert cache.get_stats()['hits'] == 1
+    assert cache.get_stats()['revalidated'] == 1
@@ -0,0 +1,66 @@
+"""
+Tests para la frontera de rastreo y la cortesía por host
+"""
+
+from src.core.crawl_frontier import CrawlFrontier, HostPoliteness, should_skip_url
+
+
+def test_frontier_enqueues_each_url_once():
+    """Test cada URL entra en la cola una sola vez, en orden FIFO"""
+    frontier = CrawlFrontier(['https://example.com/', 'https://example.com/a'])
+
+    assert not frontier.add('https://example.com/')
+    assert frontier.add('https://example.com/b')
+    assert frontier.pop() == 'https://example.com/'
+
+    # Ya visitada: sigue contando como vista
+    assert not frontier.add('https://example.com/')
+    assert 'https://example.com/' in frontier
+    assert len(frontier) == 2
+
+
+def test_should_skip_url():
+    """Test se descartan recursos, documentos, mailto: y redes sociales"""
+    assert should_skip_url('https://example.com/logo.PNG?v=2')
+    assert should_skip_url('https://example.com/terms.pdf')
+    assert should_skip_url('mailto:hello@example.com')
+    assert should_skip_url('https://www.facebook.com/example')
+    assert not should_skip_url('https://example.com/pricing?plan=pro')
+    assert not should_skip_url('https://example.com/blog/json-tips')
+
+
+def test_robots_crawl_delay_is_a_floor():
+    """Test el Crawl-delay de robots.txt es el mínimo aunque el servidor sea rápido"""
+    politeness = HostPoliteness(min_delay=0.0, max_delay=10.0, latency_factor=1.0)
+    robots = politeness.set_robots('example.com', 'User-agent: *\nCrawl-delay: 2\nSitemap: https://example.com/s.xml')
+
+    assert robots.site_maps() == ['https://example.com/s.xml']
+
+    politeness.record('example.com', 0.01, 200)
+    assert politeness.get_stats()['example.com']['delay_seconds'] == 2.0
+
+
+def test_reserve_spaces_requests_per_host():
+    """Test las reservas del mismo host se espacian; otros hosts no esperan"""
+    politeness = HostPoliteness(min_delay=1.0, max_delay=10.0, latency_factor=1.0)
+
+    assert politeness.reserve('a.com') == 0.0
+    assert 0.9 < politeness.reserve('a.com') <= 1.0
+    assert politeness.reserve('b.com') == 0.0
+
+
+def test_throttling_backs_off_and_recovers():
+    """Test un 429 dobla el retardo (o usa Retry-After) y los éxitos lo reducen"""
+    politeness = HostPoliteness(min_delay=0.5, max_delay=30.0, latency_factor=1.0)
+    host = 'example.com'
+
+    politeness.record(host, 0.1, 429)
+    assert politeness.get_stats()[host]['delay_seconds'] == 1.0
+
+    politeness.record(host, 0.1, 503, retry_after=8)
+    assert politeness.get_stats()[host]['delay_seconds'] == 8.0
+    assert politeness.get_stats()[host]['throttled'] == 2
+
+    for _ in range(10):
+        politeness.record(host, 0.1, 200)
+    assert politeness.get_stats()[host]['delay_seconds'] < 1.0
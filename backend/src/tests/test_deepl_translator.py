@@ -0,0 +1,99 @@
+"""
+Tests para DeepLTranslator (lotes, sin llamadas a la API)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import deepl
+from src.core.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from src.core.deepl_async_client import DeepLAPIError
+from src.core.deepl_translator import DeepLTranslator
+from src.core.rate_limiter import AdaptiveRateController
+
+
+def make_translator(failure_threshold=5):
+    """Traductor con breaker y controlador propios (sin estado compartido)"""
+    translator = DeepLTranslator('test-key:fx')
+    translator.breaker = CircuitBreaker('test', failure_threshold=failure_threshold, recovery_timeout=60.0)
+    translator.rate_controller = AdaptiveRateController('test', max_retries=0, base_delay=0.0)
+    return translator
+
+
+class FakeSyncClient:
+    """deepl.Translator falso: rechaza los lotes que contienen `bad` con `status`"""
+
+    def __init__(self, bad='BAD', status=400):
+        self.bad = bad
+        self.status = status
+        self.calls = []
+
+    def translate_text(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        if any(self.bad in text for text in texts):
+            raise deepl.DeepLException(f'HTTP {self.status}', http_status_code=self.status)
+        return [SimpleNamespace(text=text.upper()) for text in texts]
+
+
+class FakeAsyncClient(FakeSyncClient):
+    """AsyncDeepLClient falso con la misma regla"""
+
+    async def translate(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        if any(self.bad in text for text in texts):
+            raise DeepLAPIError(f'HTTP {self.status}', status=self.status)
+        return [text.upper() for text in texts]
+
+
+def test_bisects_rejected_batch():
+    """Test un 400 divide el lote hasta aislar el texto rechazado"""
+    translator = make_translator()
+    translator.translator = FakeSyncClient()
+    texts = ['uno', 'dos', 'BAD', 'cuatro']
+
+    results = translator.translate_batch(texts, 'es', 'en')
+
+    assert [r['success'] for r in results] == [True, True, False, True]
+    assert results[0]['text'] == 'UNO'
+    assert results[2]['retryable'] is False
+    assert translator.breaker.state == CLOSED
+
+
+def test_async_bisects_with_same_rule():
+    """Test la ruta async divide con la misma regla que la síncrona"""
+    translator = make_translator()
+    translator.async_client = FakeAsyncClient(status=413)
+    texts = ['uno', 'BAD', 'tres']
+
+    results = asyncio.run(translator.translate_batch_async(texts, 'es', 'en'))
+    assert [r['success'] for r in results] == [True, False, True]
+
+    # Un error no reconocido no se divide en ninguna de las dos rutas
+    for client in (FakeSyncClient(status=418), FakeAsyncClient(status=418)):
+        translator = make_translator()
+        translator.translator = translator.async_client = client
+
+        if isinstance(client, FakeAsyncClient):
+            results = asyncio.run(translator.translate_batch_async(texts, 'es', 'en'))
+        else:
+            results = translator.translate_batch(texts, 'es', 'en')
+
+        assert len(client.calls) == 1
+        assert not any(r['success'] for r in results)
+
+
+def test_unknown_errors_count_as_failures():
+    """Test solo los rechazos del payload son neutrales para el breaker"""
+    translator = make_translator(failure_threshold=2)
+    translator.translator = FakeSyncClient(status=418)
+
+    translator.translate_batch(['BAD'], 'es', 'en')
+    translator.translate_batch(['BAD'], 'es', 'en')
+    assert translator.breaker.state == OPEN
+
+    translator = make_translator(failure_threshold=2)
+    translator.translator = FakeSyncClient(status=400)
+
+    translator.translate_batch(['BAD'], 'es', 'en')
+    translator.translate_batch(['BAD'], 'es', 'en')
+    assert translator.breaker.state == CLOSED
@@ -0,0 +1,68 @@
+"""
+Tests para FuzzyMatchIndex
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from src.core.fuzzy_memory import FuzzyMatchIndex
+
+
+def test_numeric_difference_is_adapted():
+    """Test un número distinto se sustituye en la traducción guardada"""
+    index = FuzzyMatchIndex(threshold=0.85)
+    index.add_many([("Save 10% on all plans today", "Ahorra un 10% en todos los planes hoy")], "en", "es")
+
+    assert index.lookup_many(["Save 20% on all plans today"], "en", "es") == {
+        0: "Ahorra un 20% en todos los planes hoy"
+    }
+
+
+def test_product_name_is_adapted():
+    """Test un nombre propio a mitad de frase se sustituye"""
+    assert FuzzyMatchIndex._adapt(
+        "Try Zentro free for 30 days",
+        "Try NovaDesk free for 30 days",
+        "Prueba NovaDesk gratis durante 30 días"
+    ) == "Prueba Zentro gratis durante 30 días"
+
+
+@pytest.mark.parametrize('old, new, translation', [
+    ("a", "one", "Llega a tiempo con tu postre"),
+    ("no", "any", "Llama ya, no hay cargos extra"),
+    ("me", "us", "Dime si me quieres ver"),
+    ("son", "kid", "Regalos para su hijo: son los mejores"),
+    ("pie", "cake", "Pide el pie de manzana hoy mismo"),
+])
+def test_common_word_difference_is_rejected(old, new, translation):
+    """Test una palabra común no se sustituye aunque aparezca en la traducción"""
+    candidate = f"Order {old} apple dessert for the whole family today"
+    segment = f"Order {new} apple dessert for the whole family today"
+
+    assert FuzzyMatchIndex._adapt(segment, candidate, translation) is None
+
+
+def test_sentence_start_word_is_rejected():
+    """Test una palabra en mayúscula al inicio de frase no se trata como nombre propio"""
+    assert FuzzyMatchIndex._adapt(
+        "Yes credit card required for the trial",
+        "No credit card required for the trial",
+        "No se requiere tarjeta de crédito para la prueba"
+    ) is None
+
+
+def test_signature_is_independent_of_hash_seed():
+    """Test la firma MinHash es la misma con distintos PYTHONHASHSEED"""
+    code = 'from src.core.fuzzy_memory import FuzzyMatchIndex; print(FuzzyMatchIndex()._signature("Save 10% today"))'
+    signatures = {
+        subprocess.run(
+            [sys.executable, '-c', code],
+            env={**os.environ, 'PYTHONHASHSEED': seed},
+            capture_output=True, text=True, check=True
+        ).stdout
+        for seed in ('1', '2')
+    }
+
+    assert len(signatures) == 1
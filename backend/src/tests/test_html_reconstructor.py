@@ -0,0 +1,92 @@
+"""
+Tests para ElementPathIndex y HTMLReconstructor
+"""
+
+from bs4 import BeautifulSoup
+from src.core.html_reconstructor import HTMLReconstructor
+from src.core.page_parser import HTML_PARSER, ElementPathIndex
+from src.core.web_extractor import WebExtractor
+
+PAGE = (
+    '<html><head><title>Inicio</title></head><body>'
+    '<div><p>Same text</p><p>Same text</p><p>Other text</p></div>'
+    '<div><ul><li>First item</li><li>Second item</li></ul><img src="/a.png" alt="Logo image"></div>'
+    '</body></html>'
+)
+
+
+def test_paths_of_identical_siblings_are_distinct():
+    """Test hermanos idénticos tienen cada uno su propio XPath"""
+    soup = BeautifulSoup(PAGE, HTML_PARSER)
+    paths = ElementPathIndex(soup)
+    first, second, third = soup.find_all('p')
+
+    assert paths.path(first) == '/html/body/div[1]/p[1]'
+    assert paths.path(second) == '/html/body/div[1]/p[2]'
+    assert paths.path(third) == '/html/body/div[1]/p[3]'
+    assert paths.path(soup.find('img')) == '/html/body/div[2]/img'
+    assert paths.path(soup.title) == '/html/head/title'
+
+
+def test_find_is_inverse_of_path():
+    """Test find(path(elemento)) devuelve el mismo elemento"""
+    soup = BeautifulSoup(PAGE, HTML_PARSER)
+    paths = ElementPathIndex(soup)
+
+    for tag in soup.find_all(True):
+        assert paths.find(paths.path(tag)) is tag
+    assert paths.find('/html/body/div[3]') is None
+
+
+def test_reconstruct_translates_each_identical_paragraph():
+    """Test extraer y reconstruir: cada <p> idéntico recibe su propia traducción"""
+    page = WebExtractor(fragment_mode=False)._parse_page('https://example.com/', PAGE.encode('utf-8'), 'https://example.com/')
+    paragraphs = [element for element in page['elements'] if element['tag'] == 'p']
+    assert [element['xpath'] for element in paragraphs] == [
+        '/html/body/div[1]/p[1]',
+        '/html/body/div[1]/p[2]',
+        '/html/body/div[1]/p[3]',
+    ]
+
+    translations = {'/html/body/div[1]/p[1]': 'Mismo texto (1)', '/html/body/div[1]/p[2]': 'Mismo texto (2)'}
+    for element in page['elements']:
+        element['translated_text'] = translations.get(element['xpath'], '')
+        if element['tag'] == 'img':
+            element['translated_text'] = 'Imagen del logo'
+
+    html = HTMLReconstructor().reconstruct_page(page['html_original'], page['elements'], 'es')
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    assert [p.get_text(strip=True) for p in soup.find_all('p')] == ['Mismo texto (1)', 'Mismo texto (2)', 'Other text']
+    assert soup.find('img')['alt'] == 'Imagen del logo'
+    assert soup.html['lang'] == 'es'
+
+
+def test_reconstruct_falls_back_to_text_match():
+    """Test sin XPath válido se localiza el elemento por tag y texto original"""
+    element = {'tag': 'li', 'text': 'Second item', 'attrs': {}, 'xpath': '/html/body/missing', 'translated_text': 'Segundo'}
+
+    html = HTMLReconstructor().reconstruct_page(PAGE, [element], 'es')
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    assert [li.get_text(strip=True) for li in soup.find_all('li')] == ['First item', 'Segundo']
+
+
+def test_fragment_mode_translates_img_alt_inside_block():
+    """Test en modo fragmento el alt de una <img> dentro del bloque se traduce tras sustituirlo"""
+    html = b'<html><body><p>Click <b>here</b> to see <img src="/cat.png" alt="A nice cat"> now</p></body></html>'
+    page = WebExtractor(fragment_mode=True)._parse_page('https://example.com/', html, 'https://example.com/')
+
+    for element in page['elements']:
+        if 'html' in element:
+            # DeepL tag_handling='html' traduce el texto, no los atributos
+            element['translated_text'] = element['html'].replace('Click', 'Haz clic').replace('here', 'aquí')
+        elif element['tag'] == 'img':
+            element['translated_text'] = 'Un gato bonito'
+
+    # El img va antes que su bloque: el orden de la lista no debe importar
+    html = HTMLReconstructor().reconstruct_page(page['html_original'], page['elements'][::-1], 'es')
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    assert soup.find('b').get_text(strip=True) == 'aquí'
+    assert soup.find('img')['alt'] == 'Un gato bonito'
@@ -0,0 +1,77 @@
+"""
+Tests para ModelCache
+"""
+
+import threading
+import time
+
+from src.core.model_cache import ModelCache
+
+
+def make_cache(max_bytes=100, pinned=()):
+    evicted = []
+    cache = ModelCache(
+        max_bytes=max_bytes,
+        size_of=lambda value: value[1],
+        pinned=pinned,
+        on_evict=lambda key, value: evicted.append(key)
+    )
+    return cache, evicted
+
+
+def test_lru_eviction_within_budget():
+    """Test cargar un modelo que no cabe expulsa el menos usado"""
+    cache, evicted = make_cache()
+    cache.get('en-es', lambda: ('en-es', 40))
+    cache.get('en-fr', lambda: ('en-fr', 40))
+    cache.get('en-es', lambda: None)  # hit: en-es pasa a ser el más reciente
+    cache.get('en-de', lambda: ('en-de', 40))
+
+    assert evicted == ['en-fr']
+    assert cache.get_stats()['entries'] == ['en-es', 'en-de']
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_pinned_models_are_not_evicted():
+    """Test los pares fijados nunca se expulsan"""
+    cache, evicted = make_cache(pinned=['en-es'])
+    cache.get('en-es', lambda: ('en-es', 60))
+    cache.get('en-fr', lambda: ('en-fr', 60))
+
+    assert 'en-es' in cache
+    assert 'en-fr' in cache  # el recién cargado se conserva aunque exceda el presupuesto
+    assert evicted == []
+
+    cache.unpin('en-es')
+    assert evicted == ['en-es']
+
+
+def test_failed_load_is_not_cached():
+    """Test una carga fallida no se guarda y se reintenta en la siguiente petición"""
+    cache, _ = make_cache()
+
+    def broken():
+        raise OSError('modelo no encontrado')
+
+    assert cache.get('en-es', broken) is None
+    assert cache.get('en-es', lambda: ('en-es', 10)) == ('en-es', 10)
+    assert cache.get_stats()['load_failures'] == 1
+
+
+def test_concurrent_misses_load_once():
+    """Test peticiones simultáneas del mismo modelo comparten una carga"""
+    cache, _ = make_cache()
+    loads = []
+
+    def load():
+        loads.append(1)
+        time.sleep(0.1)
+        return ('en-es', 10)
+
+    threads = [threading.Thread(target=cache.get, args=('en-es', load)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(loads) == 1
@@ -0,0 +1,57 @@
+"""
+Tests para page_parser (charset y análisis en una pasada)
+"""
+
+import codecs
+
+from src.core.page_parser import decode_html, parse_html, resolve_charset, scan_page, visible_text
+
+
+def test_resolve_charset_precedence():
+    """Test BOM, cabecera Content-Type, <meta> y UTF-8 por defecto, en ese orden"""
+    meta_1252 = b'<html><head><meta charset="windows-1252"></head></html>'
+
+    assert resolve_charset(codecs.BOM_UTF8 + meta_1252, 'text/html; charset=iso-8859-2') == 'utf-8-sig'
+    assert resolve_charset(meta_1252, 'text/html; charset=UTF-8') == 'utf-8'
+    assert resolve_charset(meta_1252, 'text/html') == 'cp1252'
+    assert resolve_charset(b'<meta http-equiv="Content-Type" content="text/html; charset=Shift_JIS">') == 'shift_jis'
+    assert resolve_charset(b'<html></html>') == 'utf-8'
+
+
+def test_latin1_labels_decode_as_windows_1252():
+    """Test latin-1 se decodifica como windows-1252, igual que los navegadores"""
+    assert resolve_charset(b'', 'text/html; charset=ISO-8859-1') == 'cp1252'
+    assert decode_html('café €'.encode('cp1252'), 'text/html; charset=latin1') == 'café €'
+
+
+def test_unknown_label_falls_back():
+    """Test una etiqueta desconocida no rompe: se usa la siguiente declaración"""
+    assert resolve_charset(b'<meta charset="utf-8">', 'text/html; charset=x-unknown') == 'utf-8'
+
+
+def test_meta_charset_page_decoded_once():
+    """Test página windows-1252 declarada solo en <meta> con tildes correctas"""
+    body = '<html><head><meta charset="windows-1252"><title>Señal</title></head><body><p>Café</p></body></html>'
+    soup = parse_html(body.encode('cp1252'), 'text/html')
+
+    assert soup.title.string == 'Señal'
+    assert 'Café' in visible_text(soup)
+
+
+def test_scan_page_and_visible_text():
+    """Test metadatos y enlaces en un recorrido; script/style fuera del texto"""
+    soup = parse_html(
+        b'<html><head><title>Inicio</title><meta name="Description" content="Desc">'
+        b'<meta name="keywords" content="a, b"><style>p{}</style></head>'
+        b'<body><script>var x = 1;</script><p>Hola <b>mundo</b></p>'
+        b'<a href="/precios">Precios</a><a>sin href</a><!-- comentario --></body></html>'
+    )
+    scan = scan_page(soup, 'https://example.com/es/')
+
+    assert scan == {
+        'title': 'Inicio',
+        'description': 'Desc',
+        'keywords': 'a, b',
+        'links': ['https://example.com/precios']
+    }
+    assert visible_text(soup) == 'Inicio Hola mundo Precios sin href'
@@ -0,0 +1,136 @@
+"""
+Tests para el registro y router de proveedores
+"""
+
+import pytest
+from src.core.circuit_breaker import CircuitBreaker
+from src.core.fuzzy_memory import FuzzyMatchIndex
+from src.core.providers import (
+    PseudoLocalizationProvider,
+    ProviderRegistry,
+    ProviderRouter,
+    TranslationProvider,
+)
+from src.core.translation_cache import LRUTTLCache, TieredTranslationCache
+from src.core.usage_ledger import UsageLedger
+
+
+class FakeProvider(TranslationProvider):
+    """Proveedor de prueba que devuelve el texto en mayúsculas"""
+
+    supports_markup = True
+
+    def __init__(self, name, quality, cost_per_character):
+        super().__init__(CircuitBreaker(name, failure_threshold=1, recovery_timeout=60.0), cost_per_character)
+        self.name = self.label = name
+        self.quality = quality
+
+    def translate_batch(self, texts, source_lang, target_lang, tag_handling=None):
+        return [{'text': text.upper(), 'success': True} for text in texts]
+
+    async def translate_batch_async(self, texts, source_lang, target_lang, tag_handling=None):
+        return self.translate_batch(texts, source_lang, target_lang, tag_handling)
+
+
+def test_provider_interface_is_abstract():
+    """Test un proveedor sin translate_batch/translate_batch_async no se puede instanciar"""
+    class Incomplete(TranslationProvider):
+        def translate_batch(self, texts, source_lang, target_lang, tag_handling=None):
+            return []
+
+    with pytest.raises(TypeError):
+        Incomplete(CircuitBreaker('test'))
+
+
+def make_registry():
+    registry = ProviderRegistry()
+    registry.register(FakeProvider('deepl', 9, 0.00002))
+    registry.register(FakeProvider('marian', 7, 0.000001))
+    registry.register(PseudoLocalizationProvider())
+    return registry
+
+
+def chain_for(router, registry, text, strategy):
+    [(chain, _)] = router.plan(registry, [text], [0], 'en', 'es', strategy=strategy)
+    return [provider.name for provider in chain]
+
+
+def test_pseudo_is_last_resort_in_every_strategy():
+    """Test pseudo va al final aunque su coste sea 0"""
+    registry = make_registry()
+    router = ProviderRouter(bulk_min_characters=10)
+    bulk = 'x' * 50
+
+    assert chain_for(router, registry, bulk, 'quality') == ['deepl', 'marian', 'pseudo']
+    assert chain_for(router, registry, bulk, 'cost') == ['marian', 'deepl', 'pseudo']
+    assert chain_for(router, registry, bulk, 'latency')[-1] == 'pseudo'
+
+
+def test_pseudo_first_only_when_others_unavailable():
+    """Test pseudo se usa primero solo con los demás circuitos abiertos"""
+    registry = make_registry()
+    registry.get('deepl').breaker.record_failure()
+    registry.get('marian').breaker.record_failure()
+
+    assert chain_for(ProviderRouter(), registry, 'Hello', 'quality') == ['pseudo', 'deepl', 'marian']
+
+
+def test_pseudo_results_not_stored_or_counted(monkeypatch):
+    """Test las pseudo-traducciones no se guardan en caché, memoria ni índice difuso"""
+    from src.config.settings import settings
+    from src.core.translation_service import TranslationService
+
+    monkeypatch.setattr(settings, 'PSEUDO_LOCALIZATION_ENABLED', True)
+
+    cache = TieredTranslationCache(LRUTTLCache())
+    fuzzy = FuzzyMatchIndex()
+    ledger = UsageLedger()
+    service = TranslationService(translation_cache=cache, fuzzy_index=fuzzy, usage_ledger=ledger)
+
+    results = service.translate_batch(['Hello world, this is a test'], 'en', 'es')
+
+    assert results[0]['provider'] == 'pseudo'
+    assert cache.get_stats()['memory']['entries'] == 0
+    assert fuzzy.get_stats()['entries'] == 0
+    assert 'pseudo' not in ledger.get_local_totals()
+
+
+class RecordingMemory:
+    """Memoria de traducción falsa que registra lo que se guarda"""
+
+    def __init__(self):
+        self.stored = []
+
+    def lookup_many(self, texts, source_lang, target_lang):
+        return {}
+
+    def store_many(self, entries, source_lang, target_lang, provider):
+        self.stored.append((provider, list(entries)))
+        return len(entries)
+
+
+def test_fallback_results_not_stored_in_translation_memory(monkeypatch):
+    """Test con DeepL caído, la salida de MarianMT no va a la TM y caduca pronto en caché"""
+    from src.config.settings import settings
+    from src.core.translation_service import TranslationService
+
+    monkeypatch.setattr(settings, 'PSEUDO_LOCALIZATION_ENABLED', True)
+    monkeypatch.setattr(settings, 'TRANSLATION_FALLBACK_TTL_SECONDS', 0)
+
+    memory = RecordingMemory()
+    cache = TieredTranslationCache(LRUTTLCache())
+    fuzzy = FuzzyMatchIndex()
+    service = TranslationService(translation_memory=memory, translation_cache=cache, fuzzy_index=fuzzy)
+    service.registry = make_registry()
+    text = 'Hello world, this is a test'
+
+    service.registry.get('deepl').breaker.record_failure()
+    assert service.translate_batch([text], 'en', 'es')[0]['provider'] == 'marian'
+    assert memory.stored == []
+    assert fuzzy.get_stats()['entries'] == 0
+    assert cache.lookup_many([text], 'en', 'es') == {}
+
+    service.registry.get('deepl').breaker.record_success()
+    assert service.translate_batch([text], 'en', 'es')[0]['provider'] == 'deepl'
+    assert memory.stored == [('deepl', [(text, text.upper())])]
+    assert cache.lookup_many([text], 'en', 'es') == {0: text.upper()}
@@ -0,0 +1,113 @@
+"""
+Tests para AdaptiveRateController
+"""
+
+import asyncio
+import threading
+
+import pytest
+from src.core.rate_limiter import AdaptiveRateController, classify_error
+
+
+class StatusError(Exception):
+    """Error con status HTTP, como DeepLAPIError"""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f'HTTP {status}')
+        self.status = status
+        self.retry_after = retry_after
+
+
+def test_classify_error():
+    """Test clasificación por status"""
+    assert classify_error(StatusError(429)) == 'throttled'
+    assert classify_error(StatusError(503)) == 'server'
+    assert classify_error(StatusError(413)) == 'invalid'
+    assert classify_error(StatusError(456)) == 'quota'
+    assert classify_error(StatusError(None)) == 'network'
+
+
+def test_call_retries_transient_errors():
+    """Test reintento de errores transitorios y fallo inmediato del resto"""
+    controller = AdaptiveRateController('test', max_retries=2, base_delay=0.0)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise StatusError(503)
+        return 'ok'
+
+    assert controller.call(flaky) == 'ok'
+    assert len(attempts) == 3
+
+    with pytest.raises(StatusError):
+        controller.call(lambda: (_ for _ in ()).throw(StatusError(400)))
+    assert controller.get_stats()['failures'] == 1
+
+
+def test_throttle_halves_limit():
+    """Test AIMD: un 429 reduce el límite a la mitad"""
+    controller = AdaptiveRateController('test', max_concurrency=8)
+    controller.record_throttle(0.0)
+    assert controller.get_stats()['concurrency_limit'] == 4
+
+
+def test_cancelled_call_releases_slot():
+    """Test una llamada cancelada libera su slot"""
+    controller = AdaptiveRateController('test', min_concurrency=1, max_concurrency=1)
+
+    async def scenario():
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def fast():
+            return 'ok'
+
+        task = asyncio.create_task(controller.call_async(slow))
+        await started.wait()
+        assert controller.get_stats()['in_flight'] == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert controller.get_stats()['in_flight'] == 0
+        return await asyncio.wait_for(controller.call_async(fast), timeout=1)
+
+    assert asyncio.run(scenario()) == 'ok'
+
+
+def test_release_wakes_other_event_loop():
+    """Test un slot liberado en un event loop despierta a otro"""
+    controller = AdaptiveRateController('test', min_concurrency=1, max_concurrency=1)
+    holding = threading.Event()
+    release = threading.Event()
+    results = []
+
+    async def hold():
+        holding.set()
+        await asyncio.get_running_loop().run_in_executor(None, release.wait)
+
+    async def fast():
+        return 'ok'
+
+    holder = threading.Thread(target=lambda: asyncio.run(controller.call_async(hold)))
+    holder.start()
+    holding.wait(timeout=1)
+
+    async def wait_for_slot():
+        task = asyncio.create_task(controller.call_async(fast))
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        release.set()
+        results.append(await asyncio.wait_for(task, timeout=2))
+
+    asyncio.run(wait_for_slot())
+    holder.join(timeout=2)
+
+    assert results == ['ok']
+    assert controller.get_stats()['in_flight'] == 0
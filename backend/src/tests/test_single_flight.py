@@ -0,0 +1,77 @@
+"""
+Tests para SingleFlight
+"""
+
+import asyncio
+import threading
+import time
+
+from src.core.single_flight import SingleFlight
+
+
+def run_concurrently(function, count):
+    """Ejecuta `function` en `count` hilos a la vez y devuelve sus resultados"""
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(position):
+        barrier.wait()
+        results[position] = function()
+
+    threads = [threading.Thread(target=worker, args=(position,)) for position in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test llamadas simultáneas con la misma clave ejecutan la función una vez"""
+    flights = SingleFlight('test', timeout=5)
+    calls = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'hola'
+
+    results = run_concurrently(lambda: flights.do('key', work), 4)
+
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ['hola'] * 4
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert flights.get_stats()['in_flight'] == 0
+
+
+def test_followers_retry_when_leader_fails():
+    """Test si el líder falla, los seguidores hacen el trabajo ellos mismos"""
+    flights = SingleFlight('test', timeout=5)
+    flight, leader = flights.acquire('key')
+    assert leader
+
+    follower = []
+    thread = threading.Thread(target=lambda: follower.append(flights.do('key', lambda: 'propio')))
+    thread.start()
+
+    time.sleep(0.05)
+    # El líder falló: publica None
+    flights.release('key', flight, None)
+    thread.join(timeout=5)
+
+    assert follower == [('propio', False)]
+    assert flights.get_stats()['abandoned'] == 1
+
+
+def test_async_follower_of_thread_leader():
+    """Test una corrutina espera el resultado de un líder en otro hilo"""
+    flights = SingleFlight('test')
+    flight, _ = flights.acquire('key')
+
+    async def follow():
+        other, leader = flights.acquire('key')
+        assert not leader
+        threading.Timer(0.05, flights.release, args=('key', flight, 'resultado')).start()
+        return await other.wait_async(timeout=5)
+
+    assert asyncio.run(follow()) == 'resultado'
@@ -0,0 +1,76 @@
+"""
+Tests para el análisis de sitemaps
+"""
+
+import gzip
+
+from src.core.sitemap import SitemapCollector, parse_sitemap
+
+URLSET = b'''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/old</loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>https://example.com/undated</loc></url>
+  <url><loc>https://example.com/new</loc><lastmod>2025-10-01T12:00:00Z</lastmod></url>
+  <url><loc>https://other.com/page</loc></url>
+</urlset>'''
+
+INDEX = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/pages.xml.gz</loc></sitemap>
+  <sitemap><loc>https://example.com/blog.xml</loc></sitemap>
+</sitemapindex>'''
+
+
+def test_parse_urlset_and_index():
+    """Test urlset con lastmod y sitemapindex con sitemaps hijos"""
+    pages, children = parse_sitemap(URLSET)
+    assert [url for url, _ in pages][:2] == ['https://example.com/old', 'https://example.com/undated']
+    assert pages[1][1] is None
+    assert children == []
+
+    pages, children = parse_sitemap(INDEX)
+    assert pages == []
+    assert children == ['https://example.com/pages.xml.gz', 'https://example.com/blog.xml']
+
+
+def test_parse_gzip_and_plain_text():
+    """Test sitemaps comprimidos y de texto plano"""
+    pages, _ = parse_sitemap(gzip.compress(URLSET))
+    assert len(pages) == 4
+
+    pages, _ = parse_sitemap(b'https://example.com/a\n\nnot a url\nhttps://example.com/b\n')
+    assert [url for url, _ in pages] == ['https://example.com/a', 'https://example.com/b']
+
+
+def test_invalid_xml_keeps_parsed_urls():
+    """Test un XML truncado conserva las URLs anteriores al error"""
+    pages, _ = parse_sitemap(URLSET[:URLSET.index(b'<url><loc>https://example.com/new')] + b'<url><loc>')
+    assert [url for url, _ in pages] == ['https://example.com/old', 'https://example.com/undated']
+
+
+def test_collector_follows_index_and_orders_by_lastmod():
+    """Test el colector sigue el índice, filtra el host y ordena por lastmod"""
+    collector = SitemapCollector('https://example.com/', ['https://example.com/sitemap_index.xml'], max_sitemaps=5)
+    fetched = {
+        'https://example.com/sitemap_index.xml': INDEX,
+        'https://example.com/pages.xml.gz': gzip.compress(URLSET),
+        'https://example.com/blog.xml': None,
+    }
+
+    while (sitemap_url := collector.next()):
+        collector.feed(sitemap_url, fetched[sitemap_url])
+
+    assert collector.urls() == [
+        'https://example.com/new',
+        'https://example.com/old',
+        'https://example.com/undated',
+    ]
+
+
+def test_collector_sitemap_limit():
+    """Test no se descargan más sitemaps que max_sitemaps"""
+    collector = SitemapCollector('https://example.com/', max_sitemaps=1)
+
+    assert collector.next() == 'https://example.com/sitemap.xml'
+    collector.feed('https://example.com/sitemap.xml', INDEX)
+    assert collector.next() is None
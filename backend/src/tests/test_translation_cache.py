@@ -0,0 +1,70 @@
+"""
+Tests para la caché de traducciones (memoria + SQLite)
+"""
+
+import sqlite3
+
+import pytest
+from src.core.translation_cache import DiskTranslationCache, LRUTTLCache, TieredTranslationCache
+
+
+def test_lru_evicts_least_recently_used():
+    """Test el tier de memoria expulsa la entrada menos usada"""
+    cache = LRUTTLCache(max_entries=2)
+    cache.set('a', '1')
+    cache.set('b', '2')
+    cache.get('a')
+    cache.set('c', '3')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == '1'
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_tiered_cache_falls_back_to_disk(tmp_path):
+    """Test una entrada expulsada de memoria se sirve desde disco"""
+    disk = DiskTranslationCache(str(tmp_path / 'cache.db'), max_bytes=1024 * 1024)
+    cache = TieredTranslationCache(LRUTTLCache(max_entries=1), disk)
+
+    cache.store_many([('Sign in', 'Iniciar sesión'), ('Sign out', 'Cerrar sesión')], 'en', 'es')
+
+    assert cache.lookup_many(['Sign in', 'Sign out', 'Help'], 'en', 'es') == {
+        0: 'Iniciar sesión',
+        1: 'Cerrar sesión'
+    }
+    assert disk.get_stats()['hits'] >= 1
+
+
+def test_disk_size_cap_with_running_total(tmp_path):
+    """Test el total acumulado coincide con la tabla y se respeta el límite"""
+    disk = DiskTranslationCache(str(tmp_path / 'cache.db'), max_bytes=2000)
+
+    for batch in range(10):
+        disk.set_many({f'key-{batch}-{i}': 'x' * 40 for i in range(5)})
+    # Sobrescribir no cuenta el tamaño dos veces
+    disk.set_many({'key-9-0': 'y' * 10})
+
+    stats = disk.get_stats()
+    assert stats['evictions'] > 0
+    assert stats['size_bytes'] <= 2000
+    assert disk._size == stats['size_bytes']
+
+
+def test_disk_set_many_rolls_back_on_error(tmp_path):
+    """Test un lote fallido no se guarda a medias ni bloquea la conexión"""
+    disk = DiskTranslationCache(str(tmp_path / 'cache.db'), max_bytes=1024 * 1024)
+    disk._conn.execute(
+        '''
+        CREATE TRIGGER reject_boom BEFORE INSERT ON translation_cache
+        WHEN NEW.key = 'boom' BEGIN SELECT RAISE(ABORT, 'rejected'); END
+        '''
+    )
+
+    with pytest.raises(sqlite3.IntegrityError):
+        disk.set_many({'ok': 'bien', 'boom': 'mal'})
+
+    assert disk.get_many(['ok']) == {}
+    assert disk._size == 0
+
+    disk.set_many({'ok': 'bien'})
+    assert disk.get_many(['ok']) == {'ok': 'bien'}
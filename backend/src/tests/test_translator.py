@@ -3,6 +3,11 @@ Tests para MarianTranslator
 """
 
 import pytest
+
+# MarianMT necesita PyTorch y transformers (no instalados en Lambda)
+pytest.importorskip('torch')
+pytest.importorskip('transformers')
+
 from src.core.marian_translator import MarianTranslator
 
 
@@ -31,3 +36,33 @@ async def test_translate_simple():
     )
     assert result is not None
     assert len(result) > 0
+
+
+def test_translate_batch_keeps_order():
+    """Test batch con longitudes distintas: mismo orden que la entrada"""
+    translator = MarianTranslator()
+    texts = [
+        'This is a considerably longer sentence that ends up in a different length bucket.',
+        'Hello world',
+        '',
+        'Good morning'
+    ]
+    results = translator.translate_batch(texts, 'en', 'es', batch_size=2)
+    assert len(results) == len(texts)
+    assert results[2] is None
+    assert results[1] == translator.translate('Hello world', 'en', 'es')
+
+
+def test_plan_batches_respects_token_budget(monkeypatch):
+    """Test los lotes no superan el presupuesto de tokens ni batch_size"""
+    translator = MarianTranslator()
+    monkeypatch.setattr(translator, '_token_budget', lambda: 40)
+
+    # (índice, ids de tokens), ordenados por longitud
+    items = [(i, [0] * length) for i, length in enumerate([2, 3, 5, 8, 10, 10, 20])]
+    batches = translator._plan_batches(items, batch_size=3)
+
+    assert [index for batch in batches for index, _ in batch] == list(range(len(items)))
+    for batch in batches:
+        assert len(batch) <= 3
+        assert len(batch) == 1 or len(batch) * len(batch[-1][1]) <= 40
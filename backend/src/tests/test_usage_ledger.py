@@ -0,0 +1,34 @@
+"""
+Tests para UsageLedger (sin base de datos)
+"""
+
+from src.core.usage_ledger import UsageLedger
+
+
+def test_deepl_usage_estimated_between_reconciliations():
+    """Test el uso de DeepL se estima como último contador + caracteres facturados"""
+    ledger = UsageLedger()
+    fetch = lambda: {'character_count': 1000, 'character_limit': 10000}
+
+    ledger.get_deepl_usage(fetch)
+    ledger.record('deepl', 50, 'en', 'es')
+    ledger.record('marian', 70, 'en', 'es')
+
+    usage = ledger.get_deepl_usage(fetch)
+    assert usage['character_count'] == 1050
+    assert usage['estimated'] is True
+
+
+def test_reconcile_keeps_characters_billed_during_fetch():
+    """Test los caracteres registrados durante la consulta a DeepL no se pierden"""
+    ledger = UsageLedger()
+    ledger.record('deepl', 100, 'en', 'es')
+
+    def fetch():
+        # Otra traducción termina mientras la petición a /v2/usage está en curso
+        ledger.record('deepl', 30, 'en', 'es')
+        return {'character_count': 100, 'character_limit': 10000}
+
+    usage = ledger.get_deepl_usage(fetch, force=True)
+    assert usage['character_count'] == 130
+    assert usage['drift'] is None
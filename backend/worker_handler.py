@@ -9,7 +9,10 @@ Flow:
 2. Update DynamoDB status to "processing"
 3. Crawl website
 4. Extract translatable text
-5. Translate using DeepL/MarianMT
+5. Deduplicate segments across the whole job, translate each distinct
+   segment once using DeepL/MarianMT and fan results back out
+   (characters are counted per provider in the usage ledger, flushed to
+   Postgres when the job ends)
 6. Build translated website
 7. Upload to S3
 8. Update DynamoDB status to "completed"
@@ -20,15 +23,20 @@ Last Updated: 2025-10-20
 
 import json
 import logging
+import time
 import traceback
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 # Import core translation services
 from src.core.web_extractor import WebExtractor
 from src.core.translation_service import TranslationService
 from src.core.html_reconstructor import HTMLReconstructor
 from src.core.job_manager import update_job_status, get_job
+from src.core.placeholder_protector import PlaceholderProtector
+from src.core.rate_limiter import get_rate_controller
+from src.core.circuit_breaker import get_circuit_breaker
+from src.core.usage_ledger import get_usage_ledger
 from src.schemas.job import JobStatus
 from src.config.settings import settings
 
@@ -36,6 +44,92 @@ from src.config.settings import settings
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Elements sent to TranslationService.translate_batch per call. Each call is
+# packed into multi-text DeepL requests; the job progress is updated once per
+# call to keep DynamoDB writes low.
+TRANSLATION_BATCH_SIZE = 250
+
+# Pause before the end-of-job retry pass for segments that failed transiently
+# (DeepL throttling, 5xx, network) - gives the provider time to recover
+TRANSIENT_RETRY_DELAY_SECONDS = 10
+
+# Load hot MarianMT pairs (MARIAN_WARMUP_PAIRS) in the background while the
+# first job is fetched and crawled - the fallback is then ready when needed
+try:
+    from src.core.marian_translator import get_marian_translator
+    get_marian_translator().warm_up()
+except ImportError:
+    pass  # PyTorch not installed: DeepL only
+
+
+def deduplicate_segments(elements: List[Dict]) -> Tuple[List[str], List[int], List[bool]]:
+    """
+    Collapse identical segments across all pages of a job
+
+    Header, footer, navigation and cookie banner text repeats on every page;
+    each distinct segment is translated once and fanned back out.
+    Segments are compared in PlaceholderProtector.normalize_segment() form,
+    so whitespace differences do not prevent a match. Elements extracted in
+    HTML fragment mode are translated as their inner HTML ('html') and never
+    share a segment with plain text.
+
+    Args:
+        elements: Extracted elements from every page (with 'text', and
+                  'html' for markup fragments)
+
+    Returns:
+        tuple: (unique_texts, segment_index, unique_markup)
+        - unique_texts: First occurrence of each distinct segment
+        - segment_index: segment_index[i] is the position in unique_texts
+          of elements[i]
+        - unique_markup: unique_markup[j] is True if unique_texts[j] is an
+          HTML fragment
+
+    Example:
+        >>> deduplicate_segments([{'text': 'Home'}, {'text': 'About'}, {'text': 'Home'}])
+        (['Home', 'About'], [0, 1, 0], [False, False])
+    """
+    unique_texts: List[str] = []
+    unique_markup: List[bool] = []
+    positions: Dict[Tuple[bool, str], int] = {}
+    segment_index: List[int] = []
+
+    for element in elements:
+        markup = 'html' in element
+        source = element['html'] if markup else element['text']
+        key = (markup, PlaceholderProtector.normalize_segment(source)[0])
+
+        if key not in positions:
+            positions[key] = len(unique_texts)
+            unique_texts.append(source)
+            unique_markup.append(markup)
+
+        segment_index.append(positions[key])
+
+    return unique_texts, segment_index, unique_markup
+
+
+def plan_batches(positions: List[int], unique_markup: List[bool]) -> List[Tuple[Optional[str], List[int]]]:
+    """
+    Group segment positions into translate_batch() calls
+
+    Plain text and HTML fragments go in separate calls (DeepL tag handling
+    applies to a whole request), each at most TRANSLATION_BATCH_SIZE long.
+
+    Returns:
+        list: (tag_handling, positions) per call - tag_handling is 'html'
+              for fragments, None for plain text
+    """
+    batches = []
+
+    for markup in (False, True):
+        group = [position for position in positions if unique_markup[position] == markup]
+
+        for start in range(0, len(group), TRANSLATION_BATCH_SIZE):
+            batches.append(('html' if markup else None, group[start:start + TRANSLATION_BATCH_SIZE]))
+
+    return batches
+
 
 def handler(event, context):
     """
@@ -122,7 +216,11 @@ def process_translation_job(job_id: str, user_id: str, url: str, source_lang: st
         logger.info(f"[{job_id}] Initializing translation services")
 
         extractor = WebExtractor()
-        translator = TranslationService(deepl_api_key=settings.DEEPL_API_KEY)
+        translator = TranslationService(
+            deepl_api_key=settings.DEEPL_API_KEY,
+            user_id=user_id,
+            job_id=job_id
+        )
         reconstructor = HTMLReconstructor()
 
         # Update status to processing
@@ -176,9 +274,10 @@ def process_translation_job(job_id: str, user_id: str, url: str, source_lang: st
                 message=f"Processing page {i+1} of {total_pages}..."
             )
 
-            # Get elements that were extracted during crawl
-            elements = page.get('elements', [])
-            all_elements.extend(elements)
+            # Get elements that were extracted during crawl, tagged with their
+            # page so the reconstructor applies them to the right HTML
+            for element in page.get('elements', []):
+                all_elements.append({**element, 'page_url': page['url']})
 
         logger.info(f"[{job_id}] Extracted {len(all_elements)} elements ({total_words} words)")
 
@@ -191,47 +290,132 @@ def process_translation_job(job_id: str, user_id: str, url: str, source_lang: st
         )
 
         # ================================================================
-        # Step 4: Translate elements
+        # Step 4: Translate distinct segments, fan out to every element
         # ================================================================
-        logger.info(f"[{job_id}] Starting translation")
+        unique_texts, segment_index, unique_markup = deduplicate_segments(all_elements)
+
+        # Elements and words behind each distinct segment, for progress
+        # (words of the visible text - fragments also contain markup)
+        occurrences = [0] * len(unique_texts)
+        segment_words = [0] * len(unique_texts)
+        for element, position in zip(all_elements, segment_index):
+            occurrences[position] += 1
+            segment_words[position] = len(element['text'].split())
+
+        logger.info(
+            f"[{job_id}] Starting translation: {len(unique_texts)} distinct segments "
+            f"for {len(all_elements)} elements"
+        )
 
-        translated_elements = []
+        update_job_status(
+            job_id=job_id,
+            status=JobStatus.PROCESSING,
+            segments_total=len(all_elements),
+            segments_unique=len(unique_texts)
+        )
+
+        unique_results: List[Optional[Dict]] = [None] * len(unique_texts)
         words_translated = 0
+        done = 0
 
-        for i, element in enumerate(all_elements):
-            # Translate text
-            translation_result = translator.translate(
-                text=element['text'],
+        for tag_handling, batch in plan_batches(list(range(len(unique_texts))), unique_markup):
+            # Translate the whole batch (packed into multi-text DeepL requests)
+            batch_results = translator.translate_batch(
+                texts=[unique_texts[position] for position in batch],
                 source_lang=source_lang,
-                target_lang=target_lang
+                target_lang=target_lang,
+                tag_handling=tag_handling
             )
 
-            if translation_result['success']:
-                translated_element = element.copy()
-                translated_element['text'] = translation_result['text']
-                translated_elements.append(translated_element)
+            for position, translation_result in zip(batch, batch_results):
+                unique_results[position] = translation_result
+
+                if translation_result['success']:
+                    words_translated += segment_words[position] * occurrences[position]
+                elif not translation_result.get('retryable'):
+                    logger.warning(
+                        f"[{job_id}] Translation failed for segment {position} "
+                        f"({occurrences[position]} elements): {translation_result.get('error')}"
+                    )
+
+            # Update progress once per batch to avoid too many DynamoDB writes
+            done += len(batch)
+            update_job_status(
+                job_id=job_id,
+                status=JobStatus.PROCESSING,
+                progress=35 + int((done / len(unique_texts)) * 50),
+                words_translated=words_translated,
+                message=f"Translating... {int((done / len(unique_texts)) * 100)}% complete"
+            )
 
-                # Update progress
-                words_in_element = len(element['text'].split())
-                words_translated += words_in_element
+        # End-of-job retry pass: transient failures get one more chance
+        # instead of shipping untranslated
+        retry_positions = [
+            position for position, result in enumerate(unique_results)
+            if not result['success'] and result.get('retryable')
+        ]
 
-                progress = 35 + int((i / len(all_elements)) * 50)
+        if retry_positions:
+            logger.info(f"[{job_id}] Retrying {len(retry_positions)} segments that failed transiently")
 
-                # Update every 10 elements to avoid too many DynamoDB writes
-                if i % 10 == 0 or i == len(all_elements) - 1:
-                    update_job_status(
-                        job_id=job_id,
-                        status=JobStatus.PROCESSING,
-                        progress=progress,
-                        words_translated=words_translated,
-                        message=f"Translating... {int((i/len(all_elements))*100)}% complete"
-                    )
-            else:
-                logger.warning(f"[{job_id}] Translation failed for element {i}: {translation_result.get('error')}")
-                # Keep original text if translation fails
-                translated_elements.append(element)
+            update_job_status(
+                job_id=job_id,
+                status=JobStatus.PROCESSING,
+                message=f"Retrying {len(retry_positions)} segments..."
+            )
+
+            # If DeepL's circuit is open, wait until it lets a probe through
+            time.sleep(max(
+                TRANSIENT_RETRY_DELAY_SECONDS,
+                get_circuit_breaker('deepl').get_status()['retry_in_seconds']
+            ))
+
+            for tag_handling, batch in plan_batches(retry_positions, unique_markup):
+                batch_results = translator.translate_batch(
+                    texts=[unique_texts[position] for position in batch],
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    tag_handling=tag_handling
+                )
+
+                for position, translation_result in zip(batch, batch_results):
+                    unique_results[position] = translation_result
+
+                    if translation_result['success']:
+                        words_translated += segment_words[position] * occurrences[position]
+                    else:
+                        logger.warning(
+                            f"[{job_id}] Translation failed for segment {position} after retry "
+                            f"({occurrences[position]} elements): {translation_result.get('error')}"
+                        )
+
+            logger.info(f"[{job_id}] DeepL rate controller: {get_rate_controller('deepl').get_stats()}")
+
+        translated_elements = []
 
-        logger.info(f"[{job_id}] Translation complete: {len(translated_elements)} elements")
+        for element, position in zip(all_elements, segment_index):
+            translation_result = unique_results[position]
+            translated_element = element.copy()
+
+            # Keep original text (or markup) if translation fails
+            translated_element['translated_text'] = (
+                translation_result['text'] if translation_result['success'] else element.get('html', element['text'])
+            )
+            translated_elements.append(translated_element)
+
+        dedup_ratio = 1 - len(unique_texts) / len(all_elements) if all_elements else 0.0
+        logger.info(
+            f"[{job_id}] Translation complete: {len(translated_elements)} elements, "
+            f"{len(unique_texts)} distinct segments ({dedup_ratio:.1%} deduplicated)"
+        )
+
+        memory_stats = translator.get_memory_stats()
+        if memory_stats:
+            logger.info(
+                f"[{job_id}] Translation memory: {memory_stats['hits']} hits, "
+                f"{memory_stats['misses']} misses, "
+                f"{memory_stats['characters_saved']} DeepL characters saved"
+            )
 
         update_job_status(
             job_id=job_id,
@@ -329,3 +513,7 @@ def process_translation_job(job_id: str, user_id: str, url: str, source_lang: st
         )
 
         raise
+
+    finally:
+        # Persist this job's character usage before the container is frozen
+        get_usage_ledger().flush()
@@ -60,6 +60,38 @@ CREATE TABLE translations (
     translated_at TIMESTAMP
 );
 
+-- ============================================
+-- TABLA: translation_memory
+-- ============================================
+CREATE TABLE translation_memory (
+    source_lang VARCHAR(10) NOT NULL,
+    target_lang VARCHAR(10) NOT NULL,
+    source_hash CHAR(64) NOT NULL,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    provider VARCHAR(50) NOT NULL,
+    char_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source_lang, target_lang, source_hash)
+);
+
+-- ============================================
+-- TABLA: translation_usage
+-- ============================================
+CREATE TABLE translation_usage (
+    usage_date DATE NOT NULL,
+    user_id VARCHAR(255) NOT NULL DEFAULT '',
+    job_id VARCHAR(255) NOT NULL DEFAULT '',
+    provider VARCHAR(50) NOT NULL,
+    source_lang VARCHAR(10) NOT NULL,
+    target_lang VARCHAR(10) NOT NULL,
+    characters BIGINT NOT NULL DEFAULT 0,
+    segments INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (usage_date, user_id, job_id, provider, source_lang, target_lang)
+);
+
 -- ============================================
 -- TABLA: payments
 -- ============================================
@@ -84,6 +116,9 @@ CREATE INDEX idx_projects_user_id ON projects(user_id);
 CREATE INDEX idx_projects_status ON projects(status);
 CREATE INDEX idx_translations_project_id ON translations(project_id);
 CREATE INDEX idx_translations_status ON translations(status);
+CREATE INDEX idx_translation_memory_updated_at ON translation_memory(updated_at);
+CREATE INDEX idx_translation_usage_user_date ON translation_usage(user_id, usage_date);
+CREATE INDEX idx_translation_usage_job_id ON translation_usage(job_id);
 CREATE INDEX idx_payments_user_id ON payments(user_id);
 CREATE INDEX idx_payments_status ON payments(status);
 
@@ -0,0 +1,24 @@
+-- ============================================
+-- ADD TRANSLATION MEMORY TABLE
+-- Migration: Persistent translation memory (TM)
+-- ============================================
+-- Every segment translated by a provider is stored here and looked up by
+-- TranslationService before calling DeepL/MarianMT again.
+-- source_hash = SHA-256 of the normalized source segment
+-- (see PlaceholderProtector.normalize_segment)
+
+CREATE TABLE IF NOT EXISTS translation_memory (
+    source_lang VARCHAR(10) NOT NULL,
+    target_lang VARCHAR(10) NOT NULL,
+    source_hash CHAR(64) NOT NULL,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    provider VARCHAR(50) NOT NULL,
+    char_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source_lang, target_lang, source_hash)
+);
+
+-- Allow pruning old entries
+CREATE INDEX IF NOT EXISTS idx_translation_memory_updated_at ON translation_memory(updated_at);
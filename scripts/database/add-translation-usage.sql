@@ -0,0 +1,26 @@
+-- ============================================
+-- ADD TRANSLATION USAGE TABLE
+-- Migration: Local character-usage ledger
+-- ============================================
+-- Characters translated per day, user, job, provider and language pair.
+-- Written by UsageLedger (backend/src/core/usage_ledger.py) in periodic
+-- batched upserts; used for dashboards and quota checks instead of live
+-- DeepL /v2/usage calls.
+-- user_id / job_id are '' when the translation had no user or job.
+
+CREATE TABLE IF NOT EXISTS translation_usage (
+    usage_date DATE NOT NULL,
+    user_id VARCHAR(255) NOT NULL DEFAULT '',
+    job_id VARCHAR(255) NOT NULL DEFAULT '',
+    provider VARCHAR(50) NOT NULL,
+    source_lang VARCHAR(10) NOT NULL,
+    target_lang VARCHAR(10) NOT NULL,
+    characters BIGINT NOT NULL DEFAULT 0,
+    segments INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (usage_date, user_id, job_id, provider, source_lang, target_lang)
+);
+
+-- Per-user monthly totals and per-job breakdowns
+CREATE INDEX IF NOT EXISTS idx_translation_usage_user_date ON translation_usage(user_id, usage_date);
+CREATE INDEX IF NOT EXISTS idx_translation_usage_job_id ON translation_usage(job_id);